@@ -0,0 +1,128 @@
+import atexit
+import datetime
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import random
+import sys
+from flask import Blueprint, g, has_request_context, request
+from metrics import record_log_drop
+
+
+logging_bp = Blueprint('app_logging', __name__)
+
+# Log records are put on an in-memory queue by the request thread and written
+# as one JSON object per line by a background listener, so a request never
+# waits on stdout. Full request and result payloads are only logged for a
+# sample of requests (SCHOLAR_LOG_PAYLOAD_SAMPLE, a fraction between 0 and 1).
+# If the output falls so far behind that the queue fills, new records are
+# dropped and counted rather than making requests wait.
+LOG_LEVEL = os.environ.get("SCHOLAR_LOG_LEVEL", "INFO").upper()
+PAYLOAD_SAMPLE_RATE = float(os.environ.get("SCHOLAR_LOG_PAYLOAD_SAMPLE", 0.01))
+LOG_QUEUE_SIZE = int(os.environ.get("SCHOLAR_LOG_QUEUE_SIZE", 10000))
+REQUEST_ID_HEADER = "X-Request-ID"
+
+_handler = None
+_listener = None
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record):
+        entry = {
+            "ts": datetime.datetime.fromtimestamp(record.created, datetime.timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "request_id": getattr(record, "request_id", None),
+            "pid": record.process
+        }
+        entry.update(getattr(record, "fields", None) or {})
+        return json.dumps(entry, default=str)
+
+
+class LocalQueueHandler(logging.handlers.QueueHandler):
+    # The queue never leaves the process, so records are queued as they are
+    # and all formatting happens in the listener. Fields passed to a log call
+    # must not be changed afterwards.
+    def prepare(self, record):
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            record_log_drop()
+
+
+class LocalQueueListener(logging.handlers.QueueListener):
+    # Waits for room for the stop marker instead of failing on a full queue.
+    def enqueue_sentinel(self):
+        self.queue.put(self._sentinel)
+
+
+class RequestIdFilter(logging.Filter):
+    # Runs in the request thread, before the record is queued.
+    def filter(self, record):
+        record.request_id = g.get("request_id") if has_request_context() else None
+        return True
+
+
+def _start_listener(stream=None):
+    global _listener
+    _handler.queue = queue.Queue(LOG_QUEUE_SIZE)
+    output = logging.StreamHandler(stream or sys.stdout)
+    output.setFormatter(JsonFormatter())
+    _listener = LocalQueueListener(_handler.queue, output)
+    _listener.start()
+
+def _restart_after_fork():
+    # The listener thread does not survive a fork, and records still queued
+    # in the parent belong to the parent.
+    if _handler is not None:
+        _start_listener()
+
+def stop_logging():
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+def setup_logging(stream=None):
+    global _handler
+    if _handler is not None:
+        return
+    _handler = LocalQueueHandler(queue.Queue(LOG_QUEUE_SIZE))
+    _handler.addFilter(RequestIdFilter())
+    logger = logging.getLogger("scholar")
+    logger.setLevel(LOG_LEVEL)
+    logger.addHandler(_handler)
+    logger.propagate = False
+    _start_listener(stream)
+    os.register_at_fork(after_in_child=_restart_after_fork)
+    atexit.register(stop_logging)
+
+def get_logger(name):
+    return logging.getLogger(f"scholar.{name}")
+
+def sample_payload():
+    # One decision per request, so a sampled request logs both its input and
+    # its output.
+    if not has_request_context():
+        return random.random() < PAYLOAD_SAMPLE_RATE
+    if "log_payload" not in g:
+        g.log_payload = random.random() < PAYLOAD_SAMPLE_RATE
+    return g.log_payload
+
+
+@logging_bp.before_app_request
+def assign_request_id():
+    # A caller-supplied id lets one request be followed across services.
+    g.request_id = request.headers.get(REQUEST_ID_HEADER, "")[:128] or os.urandom(8).hex()
+
+@logging_bp.after_app_request
+def return_request_id(response):
+    if "request_id" in g:
+        response.headers[REQUEST_ID_HEADER] = g.request_id
+    return response
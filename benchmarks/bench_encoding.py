@@ -0,0 +1,116 @@
+import argparse
+import contextlib
+import glob
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+os.environ.setdefault("SCHOLAR_DB_PATH", os.path.join(tempfile.gettempdir(), "scholar_encoding_bench.db"))
+
+with contextlib.redirect_stdout(io.StringIO()):
+    import main
+import response_encoding
+import scraper_fixtures
+import synthetic_merit
+from flask.json.provider import DefaultJSONProvider
+
+
+# Encode time and bytes on the wire for the app's larger responses: /predict
+# results (in full, with compact=1 and with a fields= projection), /universities,
+# and the scraped fee, scholarship and event payloads as recorded in the
+# scraper fixtures. json is what jsonify used before (sorted keys, ASCII
+# escapes); orjson is what FastJSONProvider uses when it is installed. Each
+# encoding is shown at the level used per response and at the level used for
+# bodies that are encoded once and cached.
+EXPECTED_DIR = os.path.join(scraper_fixtures.FIXTURE_DIR, "expected")
+PREDICT_VARIANTS = {
+    "predict": "/predict",
+    "predict compact": "/predict?compact=1",
+    "predict fields": "/predict?fields=predicted_2026_cutoff,admission_chance"
+}
+
+def best_ms(func, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = (time.perf_counter() - start) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def predict_payloads(count, seed):
+    client = main.app.test_client()
+    programs = synthetic_merit.program_names(len(synthetic_merit.PROGRAM_NAMES))
+    bodies = synthetic_merit.make_requests(count, programs, seed)
+    # Each variant is picked from the same request, the one whose full
+    # response is the median or the largest.
+    responses = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for body in bodies:
+            variants = {name: client.post(url, json=body) for name, url in PREDICT_VARIANTS.items()}
+            if all(response.status_code == 200 for response in variants.values()):
+                responses.append({name: response.get_json() for name, response in variants.items()})
+    responses.sort(key=lambda variants: len(json.dumps(variants["predict"])))
+    payloads = {}
+    for label, variants in (("median", responses[len(responses) // 2]), ("largest", responses[-1])):
+        for name, payload in variants.items():
+            payloads[f"{name} ({label})"] = payload
+    payloads["universities"] = client.get("/universities").get_json()
+    return payloads
+
+def fixture_payloads():
+    groups = {"fees": {}, "scholarships": {}, "events": {}}
+    for path in sorted(glob.glob(os.path.join(EXPECTED_DIR, "*.json"))):
+        name = os.path.splitext(os.path.basename(path))[0]
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        if name.endswith("_fees"):
+            groups["fees"][name[:-len("_fees")]] = data
+        elif name.endswith("_events"):
+            groups["events"][name[:-len("_events")]] = data
+        else:
+            groups["scholarships"][name] = data
+    return {f"{name} (all)": payload for name, payload in groups.items()}
+
+def measure(payload, repeat):
+    provider = DefaultJSONProvider(main.app)
+    body = response_encoding.dumps_bytes(payload)
+    row = {
+        "json_ms": best_ms(lambda: provider.dumps(payload).encode("utf-8"), repeat),
+        "fast_ms": best_ms(lambda: response_encoding.dumps_bytes(payload), repeat),
+        "identity": len(body)
+    }
+    for encoding in response_encoding.ENCODINGS:
+        for cached in (False, True):
+            label = f"{encoding}{'*' if cached else ''}"
+            row[label] = len(response_encoding.compress(body, encoding, cached))
+            row[f"{label}_ms"] = best_ms(lambda: response_encoding.compress(body, encoding, cached), repeat)
+    return row
+
+def main_bench():
+    parser = argparse.ArgumentParser(description="Measure JSON encode time and compressed sizes of the larger responses.")
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=200, help="synthetic /predict requests to pick payloads from")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    payloads = predict_payloads(args.requests, args.seed)
+    payloads.update(fixture_payloads())
+    encoder = "orjson" if response_encoding.orjson is not None else "json (orjson not installed)"
+    print(f"fast encoder: {encoder}; * marks the level used for cached bodies")
+    labels = [f"{encoding}{mark}" for encoding in response_encoding.ENCODINGS for mark in ("", "*")]
+    print(f"{'payload':<26}{'json ms':>9}{'fast ms':>9}{'bytes':>9}" + "".join(f"{label:>16}" for label in labels))
+    for name, payload in payloads.items():
+        row = measure(payload, args.repeat)
+        cells = "".join(f"{row[label]:>8} {row[label + '_ms']:>6.2f}ms" for label in labels)
+        print(f"{name:<26}{row['json_ms']:>9.3f}{row['fast_ms']:>9.3f}{row['identity']:>9}{cells}")
+
+
+if __name__ == "__main__":
+    main_bench()
@@ -0,0 +1,149 @@
+import argparse
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bs4 import BeautifulSoup
+import events
+
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'events')
+FIXTURES = {
+    'comsats': ('comsats.html', lambda: events.COMSATS_EVENTS_URL),
+    'neduet': ('neduet.html', lambda: events.NEDUET_EVENTS_URL.format(page=0)),
+    'uet_taxila': ('uet_taxila.html', lambda: events.UET_TAXILA_EVENTS_URL)
+}
+
+# The extractors as they were before parse_only trees and module-level
+# patterns, kept here as the baseline.
+def legacy_comsats(html):
+    soup = BeautifulSoup(html, 'html.parser')
+    found = []
+    for a in soup.find_all('a'):
+        text = a.get_text(strip=True)
+        if 'Event Date:' in text:
+            parts = text.split('Event Date:')
+            title = parts[0].strip()
+            date = parts[1].strip() if len(parts) > 1 else None
+            found.append({'title': title, 'date': date})
+    return found
+
+def legacy_neduet(html):
+    soup = BeautifulSoup(html, 'html.parser')
+    content = soup.find('div', {'class': 'content'})
+    if not content:
+        content = soup
+    text_lines = [t.strip() for t in content.stripped_strings]
+    found = []
+    date_pattern = re.compile(
+        r'(\b\d{1,2}(?:st|nd|rd|th)?\s+\w+,\s*\d{4}\b|\b\w+\s+\d{1,2}\s*-\s*\d{1,2},?\s*\d{4}\b|\b\d{1,2}\s*-\s*\d{1,2}\s*\w+\s*\d{4}\b)'
+    )
+    for i, line in enumerate(text_lines):
+        if date_pattern.search(line):
+            if i + 1 < len(text_lines):
+                title = text_lines[i + 1]
+                date = line
+                if not any(word in title.lower() for word in ["breadcrumb", "home", "events", "pagination", "quick", "links"]):
+                    found.append({'date': date, 'title': title})
+    return found
+
+def legacy_uet_taxila(html):
+    soup = BeautifulSoup(html, 'html.parser')
+    found = []
+    table = soup.find('table')
+    if not table:
+        raise ValueError('No events table found')
+    rows = table.find_all('tr')
+    for row in rows[1:]:
+        cols = row.find_all('td')
+        if len(cols) >= 2:
+            found.append({'title': cols[0].get_text(strip=True), 'date': cols[1].get_text(strip=True)})
+    return found
+
+PARSERS = {
+    'comsats': (legacy_comsats, events.parse_comsats_events),
+    'neduet': (legacy_neduet, events.parse_neduet_events),
+    'uet_taxila': (legacy_uet_taxila, events.parse_uet_taxila_events)
+}
+
+
+def _chrome(links=300, paragraphs=60):
+    # Navigation, footer and sidebar markup similar in size to the real pages.
+    nav = ''.join(f'<li><a href="/page/{i}"><span>Menu item {i}</span></a></li>' for i in range(links))
+    text = ''.join(f'<p>Lorem ipsum dolor sit amet {i}, consectetur adipiscing elit.</p>' for i in range(paragraphs))
+    return f'<header><ul class="menu">{nav}</ul></header>', f'<aside>{text}</aside><footer><ul>{nav}</ul></footer>'
+
+def synthetic_page(source, count=40):
+    head, tail = _chrome()
+    if source == 'comsats':
+        items = ''.join(
+            f'<div class="event"><a href="/alumni/event.aspx?id={i}"><h4>Alumni Meetup {i}</h4>'
+            f'<span>Event Date: {i % 28 + 1}/{i % 12 + 1}/2026</span></a></div>'
+            for i in range(count)
+        )
+        body = f'<form><div class="events">{items}</div></form>'
+    elif source == 'neduet':
+        items = ''.join(
+            f'<div class="views-row"><span class="date">{i % 28 + 1}th March, 2026</span>'
+            f'<h3><a href="/node/{i}">Seminar on topic {i}</a></h3><p>Details of seminar {i}.</p></div>'
+            for i in range(count)
+        )
+        body = f'<div class="content"><h1>Events</h1>{items}<ul class="pagination"><li>1</li></ul></div>'
+    else:
+        rows = ''.join(f'<tr><td>Workshop {i}</td><td>2026-03-{i % 28 + 1:02d}</td></tr>' for i in range(count))
+        body = f'<table class="table"><tr><th>Title</th><th>Date</th></tr>{rows}</table><table><tr><td>x</td></tr></table>'
+    return f'<html><head><title>Events</title></head><body>{head}<main>{body}</main>{tail}</body></html>'
+
+def load_page(source):
+    path = os.path.join(FIXTURE_DIR, FIXTURES[source][0])
+    if os.path.exists(path):
+        with open(path, encoding='utf-8') as f:
+            return f.read(), 'recorded'
+    return synthetic_page(source), 'synthetic'
+
+def record_pages():
+    os.makedirs(FIXTURE_DIR, exist_ok=True)
+    for source, (filename, url) in FIXTURES.items():
+        resp = events.polite_get(url(), headers=events.HEADERS, timeout=30)
+        resp.raise_for_status()
+        with open(os.path.join(FIXTURE_DIR, filename), 'w', encoding='utf-8') as f:
+            f.write(resp.text)
+        print(f"Recorded {source}: {len(resp.text)} bytes")
+
+def best_of(func, html, repeat, number):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func(html)
+        timings.append((time.perf_counter() - start) / number)
+    return min(timings)
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare event page parse times before and after targeted parsing.')
+    parser.add_argument('--record', action='store_true', help='fetch the live event pages into benchmarks/fixtures/events first')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--number', type=int, default=20)
+    args = parser.parse_args()
+
+    if args.record:
+        record_pages()
+
+    print(f"parser: {events.EVENT_PARSER}")
+    print(f"{'source':<12}{'page':<11}{'bytes':>9}{'events':>8}{'legacy ms':>12}{'targeted ms':>13}{'speedup':>9}")
+    for source, (legacy, targeted) in PARSERS.items():
+        html, kind = load_page(source)
+        expected = legacy(html)
+        result = targeted(html)
+        if result != expected:
+            print(f"{source}: targeted parser returned {len(result)} events, legacy returned {len(expected)}")
+        before = best_of(legacy, html, args.repeat, args.number)
+        after = best_of(targeted, html, args.repeat, args.number)
+        print(f"{source:<12}{kind:<11}{len(html):>9}{len(result):>8}{before * 1000:>12.2f}{after * 1000:>13.2f}{before / after:>8.1f}x")
+
+
+if __name__ == '__main__':
+    main()
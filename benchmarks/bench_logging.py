@@ -0,0 +1,160 @@
+import argparse
+import contextlib
+import io
+import logging
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+os.chdir(ROOT)
+os.environ.setdefault("SCHOLAR_DB_PATH", os.path.join(tempfile.gettempdir(), "scholar_logging_bench.db"))
+
+with contextlib.redirect_stdout(io.StringIO()):
+    import main
+import app_logging
+import synthetic_merit
+
+
+# /predict latency under each way of logging it, all writing to the same sink:
+# a file by default, or with --pipe-mbps a pipe drained at a fixed rate, like a
+# terminal or a container log driver that cannot keep up.
+#   print          the old behaviour, print() of the full request and results
+#   sync           JSON records written by a plain handler in the request thread
+#   queue          JSON records handed to the background listener
+#   queue-sampled  the same, with payloads logged for a sample of requests
+MODES = ["print", "sync", "queue", "queue-sampled"]
+
+# Reads stdin in small chunks, sleeping to hold the given MB/s. Idle time
+# earns no credit, so a burst after a quiet spell is throttled too.
+SLOW_READER = """
+import sys, time
+rate = float(sys.argv[1]) * 1024 * 1024
+ready = time.perf_counter()
+while True:
+    chunk = sys.stdin.buffer.read1(16384)
+    if not chunk:
+        break
+    ready = max(ready, time.perf_counter()) + len(chunk) / rate
+    time.sleep(max(0.0, ready - time.perf_counter()))
+"""
+
+class PrintLog:
+    # Reproduces the prints /predict used to make on every request.
+    def info(self, message, extra=None):
+        fields = (extra or {}).get("fields", {})
+        if message == "predict request":
+            print("Received data:", fields["request"])
+        elif message == "predict results":
+            print("Final results:", fields["results"])
+
+    def warning(self, message, extra=None):
+        fields = (extra or {}).get("fields", {})
+        print(f"Error loading {fields.get('data_file', 'data')}: {fields.get('error')}")
+
+class Forgetful(set):
+    # Stands in for main._reported_load_errors so load errors are reported on
+    # every request, as they used to be.
+    def add(self, item):
+        pass
+
+
+def use_mode(mode, sink):
+    logger = logging.getLogger("scholar")
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+    app_logging.stop_logging()
+    main.log = app_logging.get_logger("predict")
+    main._reported_load_errors = set()
+    app_logging.PAYLOAD_SAMPLE_RATE = 1.0
+    if mode == "print":
+        main.log = PrintLog()
+        main._reported_load_errors = Forgetful()
+    elif mode == "sync":
+        handler = logging.StreamHandler(sink)
+        handler.setFormatter(app_logging.JsonFormatter())
+        handler.addFilter(app_logging.RequestIdFilter())
+        logger.addHandler(handler)
+    else:
+        logger.addHandler(app_logging._handler)
+        app_logging._start_listener(sink)
+        if mode == "queue-sampled":
+            app_logging.PAYLOAD_SAMPLE_RATE = float(os.environ.get("SCHOLAR_LOG_PAYLOAD_SAMPLE", 0.01))
+
+def run(client, bodies, mode, sink):
+    use_mode(mode, sink)
+    latencies = []
+    with contextlib.redirect_stdout(sink):
+        started = time.perf_counter()
+        for body in bodies:
+            start = time.perf_counter()
+            response = client.post("/predict", json=body)
+            latencies.append((time.perf_counter() - start) * 1000)
+            if response.status_code != 200:
+                raise RuntimeError(f"/predict returned {response.status_code} for {body}")
+        elapsed = time.perf_counter() - started
+        # Queued records still have to be written; that time is reported
+        # separately because no request waits for it.
+        drain_start = time.perf_counter()
+        app_logging.stop_logging()
+        sink.flush()
+        drain_ms = (time.perf_counter() - drain_start) * 1000
+    ordered = sorted(latencies)
+    def pick(q):
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+    return {
+        "p50": pick(0.50), "p95": pick(0.95), "p99": pick(0.99), "mean": statistics.fmean(ordered),
+        "throughput_rps": len(bodies) / elapsed, "drain_ms": drain_ms
+    }
+
+@contextlib.contextmanager
+def open_sink(path, pipe_mbps):
+    if not pipe_mbps:
+        with open(path, "w", encoding="utf-8") as sink:
+            yield sink
+        return
+    reader = subprocess.Popen([sys.executable, "-c", SLOW_READER, str(pipe_mbps)], stdin=subprocess.PIPE)
+    sink = io.TextIOWrapper(reader.stdin, encoding="utf-8", line_buffering=True)
+    try:
+        yield sink
+    finally:
+        sink.close()
+        reader.wait()
+
+def main_bench():
+    parser = argparse.ArgumentParser(description="Compare /predict latency with print, synchronous and queued logging.")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--modes", nargs="+", default=MODES, choices=MODES)
+    parser.add_argument("--sink", default=os.path.join(tempfile.gettempdir(), "scholar_logging_bench.log"),
+                        help="file the logs are written to; use /dev/null to leave out the disk")
+    parser.add_argument("--pipe-mbps", type=float, help="write to a pipe read at this many MB/s instead of --sink")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    client = main.app.test_client()
+    programs = synthetic_merit.program_names(len(synthetic_merit.PROGRAM_NAMES))
+    bodies = synthetic_merit.make_requests(args.requests, programs, args.seed)
+    results = {}
+    with open_sink(args.sink, args.pipe_mbps) as sink:
+        # Fit every prediction first so all modes time the same warm path.
+        run(client, bodies, "queue-sampled", sink)
+        for mode in args.modes:
+            results[mode] = run(client, bodies, mode, sink)
+    print(f"{'mode':<15}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'mean ms':>9}{'req/s':>9}{'drain ms':>10}")
+    for mode, stats in results.items():
+        print(f"{mode:<15}{stats['p50']:>9.3f}{stats['p95']:>9.3f}{stats['p99']:>9.3f}{stats['mean']:>9.3f}"
+              f"{stats['throughput_rps']:>9.1f}{stats['drain_ms']:>10.1f}")
+    if "print" in results:
+        baseline = results["print"]["mean"]
+        for mode, stats in results.items():
+            if mode != "print":
+                print(f"{mode}: {baseline - stats['mean']:+.3f} ms per request against print")
+
+
+if __name__ == "__main__":
+    main_bench()
@@ -0,0 +1,189 @@
+import argparse
+import contextlib
+import datetime
+import io
+import json
+import os
+import platform
+import resource
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+os.chdir(ROOT)
+os.environ.setdefault("SCHOLAR_DB_PATH", os.path.join(tempfile.gettempdir(), "scholar_predict_bench.db"))
+
+with contextlib.redirect_stdout(io.StringIO()):
+    import main
+import merit_tables
+import synthetic_merit
+
+
+def install_dataset(data, paths):
+    # Point the app at the synthetic data and drop tables built from the
+    # previous dataset.
+    for uni_id, path in paths.items():
+        main.UNIVERSITIES[uni_id]["data_file"] = path
+    for uni_id in synthetic_merit.INLINE_SOURCES:
+        if uni_id in main.INLINE_MERIT_DATA:
+            main.INLINE_MERIT_DATA[uni_id] = dict(main.INLINE_MERIT_DATA[uni_id], columns=data[uni_id])
+    merit_tables._tables.clear()
+
+def ingest():
+    start = time.perf_counter()
+    tables = {}
+    with contextlib.redirect_stdout(io.StringIO()):
+        for uni_id, uni_config in main.UNIVERSITIES.items():
+            try:
+                table = merit_tables.get_merit_table(uni_id, uni_config, main.INLINE_MERIT_DATA.get(uni_id))
+            except Exception:
+                continue
+            if table is not None:
+                tables[uni_id] = table
+    return (time.perf_counter() - start) * 1000, tables
+
+def clear_predictions(tables):
+    for table in tables.values():
+        table.predictions.clear()
+
+def percentiles(latencies):
+    ordered = sorted(latencies)
+    def pick(q):
+        return round(ordered[min(len(ordered) - 1, int(q * len(ordered)))], 3)
+    return {"p50": pick(0.50), "p95": pick(0.95), "p99": pick(0.99), "mean": round(statistics.fmean(ordered), 3)}
+
+def run_requests(client, bodies, tables, cold):
+    latencies = []
+    sink = io.StringIO()
+    started = time.perf_counter()
+    for body in bodies:
+        if cold:
+            clear_predictions(tables)
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(sink):
+            response = client.post("/predict", json=body)
+        latencies.append((time.perf_counter() - start) * 1000)
+        if response.status_code != 200:
+            raise RuntimeError(f"/predict returned {response.status_code} for {body}")
+        sink.seek(0)
+        sink.truncate()
+    elapsed = time.perf_counter() - started
+    return latencies, elapsed
+
+def peak_memory(client, bodies, tables, cold):
+    peaks = []
+    sink = io.StringIO()
+    for body in bodies:
+        if cold:
+            clear_predictions(tables)
+        tracemalloc.start()
+        with contextlib.redirect_stdout(sink):
+            client.post("/predict", json=body)
+        peaks.append(tracemalloc.get_traced_memory()[1] / 1024)
+        tracemalloc.stop()
+        sink.seek(0)
+        sink.truncate()
+    return {"peak_kib_p50": round(statistics.median(peaks), 1), "peak_kib_max": round(max(peaks), 1)}
+
+def bench_size(client, size, args, data_dir):
+    programs, years, campuses = size
+    data = synthetic_merit.generate(programs, years, campuses, seed=args.seed)
+    paths = synthetic_merit.write_files(data, os.path.join(data_dir, f"{programs}x{years}x{campuses}"))
+    install_dataset(data, paths)
+    ingest_ms, tables = ingest()
+    program_list = synthetic_merit.program_names(programs)
+    bodies = synthetic_merit.make_requests(args.requests, program_list, args.seed)
+
+    result = {
+        "size": f"{programs}x{years}x{campuses}",
+        "programs": programs,
+        "years": years,
+        "campuses": campuses,
+        "rows": synthetic_merit.row_counts(data),
+        "ingest_ms": round(ingest_ms, 2),
+        "table_kib": round(sum(t.years.nbytes + t.cutoffs.nbytes + sum(len(n) for n in t.norms) for t in tables.values()) / 1024, 1)
+    }
+    for mode, cold, count in (("cold", True, args.cold_requests), ("warm", False, args.requests)):
+        clear_predictions(tables)
+        run_requests(client, bodies[:args.warmup], tables, cold)
+        latencies, elapsed = run_requests(client, bodies[:count], tables, cold)
+        result[mode] = {
+            "requests": count,
+            "latency_ms": percentiles(latencies),
+            "throughput_rps": round(count / elapsed, 1),
+            "memory": peak_memory(client, bodies[:args.memory_samples], tables, cold)
+        }
+    return result
+
+def parse_size(text):
+    parts = [int(part) for part in text.lower().split("x")]
+    if len(parts) != 3 or min(parts) < 1:
+        raise argparse.ArgumentTypeError(f"size must look like PROGRAMSxYEARSxCAMPUSES, got {text!r}")
+    return tuple(parts)
+
+def compare(results, baseline_path):
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = {run["size"]: run for run in json.load(f)["runs"]}
+    print(f"\ncompared with {baseline_path}")
+    for run in results["runs"]:
+        old = baseline.get(run["size"])
+        if not old:
+            continue
+        for mode in ("cold", "warm"):
+            for key in ("p50", "p95", "p99"):
+                before = old[mode]["latency_ms"][key]
+                after = run[mode]["latency_ms"][key]
+                change = (after - before) / before * 100 if before else 0.0
+                print(f"{run['size']:<14}{mode:<6}{key:<5}{before:>10.3f} ms ->{after:>10.3f} ms  {change:+6.1f}%")
+
+def print_table(results):
+    print(f"{'size':<14}{'mode':<6}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'req/s':>10}{'peak KiB':>11}{'ingest ms':>11}")
+    for run in results["runs"]:
+        for mode in ("cold", "warm"):
+            stats = run[mode]
+            latency = stats["latency_ms"]
+            print(f"{run['size']:<14}{mode:<6}{latency['p50']:>10.3f}{latency['p95']:>10.3f}{latency['p99']:>10.3f}"
+                  f"{stats['throughput_rps']:>10.1f}{stats['memory']['peak_kib_p50']:>11.1f}{run['ingest_ms']:>11.1f}")
+
+def main_bench():
+    parser = argparse.ArgumentParser(description="Benchmark /predict against synthetic merit data of growing size.")
+    parser.add_argument("--sizes", type=parse_size, nargs="+", default=[(20, 5, 2), (100, 10, 4), (400, 20, 8)],
+                        help="datasets as PROGRAMSxYEARSxCAMPUSES")
+    parser.add_argument("--requests", type=int, default=500, help="requests per size with fitted predictions reused")
+    parser.add_argument("--cold-requests", type=int, default=50, help="requests per size that refit every model")
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--memory-samples", type=int, default=20, help="requests traced with tracemalloc per mode")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=os.path.join(ROOT, "benchmarks", "results", f"predict-{datetime.datetime.now():%Y%m%d-%H%M%S}.json"))
+    parser.add_argument("--compare", help="earlier results JSON to compare latencies against")
+    args = parser.parse_args()
+
+    client = main.app.test_client()
+    with tempfile.TemporaryDirectory() as data_dir:
+        runs = [bench_size(client, size, args, data_dir) for size in args.sizes]
+    results = {
+        "created": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "args": {"requests": args.requests, "cold_requests": args.cold_requests, "warmup": args.warmup,
+                 "memory_samples": args.memory_samples, "seed": args.seed},
+        "request_mix": dict(synthetic_merit.REQUEST_MIX),
+        "max_rss_kib": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        "runs": runs
+    }
+    print_table(results)
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+    print(f"\nresults written to {args.output}")
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main_bench()
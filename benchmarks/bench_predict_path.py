@@ -0,0 +1,158 @@
+import argparse
+import contextlib
+import io
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+import re
+import numpy as np
+import pandas as pd
+
+with contextlib.redirect_stdout(io.StringIO()):
+    import main
+import merit_tables
+
+
+PROGRAMS = ["Computer Science", "Software Engineering", "Electrical Engineering", "Data Science", "Psychology"]
+
+# The per-request DataFrame path /predict used before merit tables, kept here
+# as the baseline.
+def legacy_normalize(text):
+    if pd.isna(text):
+        return ""
+    return re.sub(r'\b(bs|bsc|bachelors|in|science|scien)\b', '', str(text).lower()).strip()
+
+def legacy_frame(uni_id, uni_config):
+    spec = main.INLINE_MERIT_DATA.get(uni_id)
+    if spec:
+        df = pd.DataFrame(spec["columns"])
+        if spec.get("melt"):
+            id_col, var_name, value_name = spec["melt"]
+            df = df.melt(id_vars=[id_col], var_name=var_name, value_name=value_name)
+            df[var_name] = df[var_name].astype(int)
+        return df
+    if uni_config.get("data_file"):
+        path = uni_config["data_file"]
+        return pd.read_excel(path) if str(path).lower().endswith((".xlsx", ".xls")) else pd.read_csv(path)
+    return None
+
+def legacy_latest_cutoff(df, program, cutoff_col, year_col=None, program_col="Program"):
+    df = df.copy()
+    if program_col not in df.columns:
+        return None, None
+    df["Program_norm"] = df[program_col].apply(legacy_normalize)
+    matched = df[df["Program_norm"].str.contains(legacy_normalize(program), na=False)]
+    if matched.empty:
+        return None, None
+    if year_col and year_col in df.columns:
+        matched = matched.copy()
+        matched.loc[:, 'Year_Num'] = matched[year_col].apply(merit_tables.extract_year)
+        matched = matched.dropna(subset=['Year_Num'])
+        if not matched.empty:
+            latest = matched.loc[matched['Year_Num'].idxmax()]
+            return float(latest[cutoff_col]), int(latest['Year_Num'])
+    val = matched.iloc[0].get(cutoff_col, None)
+    return (float(val), None) if pd.notna(val) else (None, None)
+
+def legacy_training_data(df, program, year_col, cutoff_col, program_col="Program"):
+    df = df.copy()
+    if program_col not in df.columns or cutoff_col not in df.columns:
+        return None, None
+    df["Program_norm"] = df[program_col].apply(legacy_normalize)
+    prog_df = df[df["Program_norm"].str.contains(legacy_normalize(program), na=False)].copy()
+    if prog_df.empty:
+        return None, None
+    if year_col and year_col in prog_df.columns:
+        prog_df.loc[:, 'Year_Num'] = prog_df[year_col].apply(merit_tables.extract_year)
+        prog_df = prog_df.dropna(subset=['Year_Num', cutoff_col])
+        if prog_df.shape[0] >= 1:
+            return prog_df[['Year_Num']].astype(int).values, prog_df[cutoff_col].astype(float).values
+    prog_df = prog_df.dropna(subset=[cutoff_col])
+    if prog_df.shape[0] >= 2:
+        return np.arange(len(prog_df)).reshape(-1, 1), prog_df[cutoff_col].astype(float).values
+    elif prog_df.shape[0] == 1:
+        return np.array([[0]]), prog_df[cutoff_col].astype(float).values
+    return None, None
+
+def legacy_request(program):
+    for uni_id, uni_config in main.UNIVERSITIES.items():
+        try:
+            df = legacy_frame(uni_id, uni_config)
+        except Exception:
+            continue
+        if df is None:
+            continue
+        cutoff_col, year_col, program_col = merit_tables.merit_columns(uni_config, main.INLINE_MERIT_DATA.get(uni_id))
+        legacy_latest_cutoff(df, program, cutoff_col, year_col, program_col)
+        X, y = legacy_training_data(df, program, year_col, cutoff_col, program_col)
+        if X is not None and len(X) > 1:
+            main.predict_cutoff(X, y, 2026)
+
+def table_request(program, cold):
+    for uni_id, uni_config in main.UNIVERSITIES.items():
+        try:
+            table = merit_tables.get_merit_table(uni_id, uni_config, main.INLINE_MERIT_DATA.get(uni_id))
+        except Exception:
+            continue
+        if table is None:
+            continue
+        if cold:
+            table.predictions.clear()
+        main.predict_program(table, program, 2026)
+
+def http_request(client, program):
+    with contextlib.redirect_stdout(io.StringIO()):
+        client.post("/predict", json={"matric_marks": 950, "fsc_marks": 900, "nts_marks": 70, "net_marks": 140, "program": program})
+
+def measure(name, func, rounds):
+    latencies = []
+    peaks = []
+    blocks = []
+    for i in range(rounds):
+        program = PROGRAMS[i % len(PROGRAMS)]
+        tracemalloc.start()
+        before = tracemalloc.take_snapshot()
+        start = time.perf_counter()
+        func(program)
+        latencies.append((time.perf_counter() - start) * 1000)
+        after = tracemalloc.take_snapshot()
+        peaks.append(tracemalloc.get_traced_memory()[1] / 1024)
+        blocks.append(sum(stat.count_diff for stat in after.compare_to(before, "filename") if stat.count_diff > 0))
+        tracemalloc.stop()
+    # tracemalloc slows every allocation down, so latency is re-measured
+    # without it.
+    latencies = []
+    for i in range(rounds):
+        program = PROGRAMS[i % len(PROGRAMS)]
+        start = time.perf_counter()
+        func(program)
+        latencies.append((time.perf_counter() - start) * 1000)
+    print(f"{name:<28}{statistics.median(latencies):>12.2f}{statistics.median(peaks):>14.1f}{statistics.median(blocks):>17.0f}")
+
+def main_bench():
+    parser = argparse.ArgumentParser(description="Compare the /predict data path before and after merit tables.")
+    parser.add_argument("--rounds", type=int, default=10)
+    args = parser.parse_args()
+
+    # Warm imports and table ingest so only steady-state requests are measured.
+    legacy_request(PROGRAMS[0])
+    table_request(PROGRAMS[0], cold=True)
+    client = main.app.test_client()
+    http_request(client, PROGRAMS[0])
+
+    print(f"{'path':<28}{'median ms':>12}{'peak KiB':>14}{'retained blocks':>17}")
+    measure("legacy DataFrames", legacy_request, args.rounds)
+    measure("tables, cold fit", lambda p: table_request(p, cold=True), args.rounds)
+    measure("tables, cached fit", lambda p: table_request(p, cold=False), args.rounds)
+    measure("POST /predict", lambda p: http_request(client, p), args.rounds)
+
+
+if __name__ == "__main__":
+    main_bench()
@@ -0,0 +1,230 @@
+import argparse
+import contextlib
+import io
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+os.environ.setdefault("SCHOLAR_DB_PATH", os.path.join(tempfile.gettempdir(), "scholar_scraper_bench.db"))
+
+with contextlib.redirect_stdout(io.StringIO()):
+    import main
+import web_scraping
+import extra_universities
+import scholarships
+import events
+import scraper_fixtures
+
+
+EXPECTED_DIR = os.path.join(scraper_fixtures.FIXTURE_DIR, "expected")
+
+def fee_scraper(func):
+    def run():
+        data, error, _, _ = func()
+        return {"data": data, "error": error}
+    return run
+
+def scholarship_route(func):
+    def run():
+        with main.app.test_request_context():
+            response = func()
+        if isinstance(response, tuple):
+            response = response[0]
+        return response.get_json()
+    return run
+
+def event_parser(func, filename):
+    def run():
+        return func(load_event_page(filename))
+    return run
+
+# name -> (page URL, routine). Fee and scholarship routines run unchanged, with
+# their fetch and cache writes redirected by offline(); event pages go straight
+# to their parse_* functions since fetch_* also crawls and stores. Scrapers
+# without a URL run on a synthetic page only and are skipped by --record.
+SCRAPERS = {
+    "iiui_fees": (lambda: main.UNIVERSITIES["iiui"]["fee_url"], fee_scraper(web_scraping.scrape_iiui_fees)),
+    "uet_fees": (lambda: main.UNIVERSITIES["uet"]["fee_url"], fee_scraper(web_scraping.scrape_uet_fees)),
+    "lums_fees": (lambda: main.UNIVERSITIES["lums"]["fee_url"], fee_scraper(web_scraping.scrape_lums_fees)),
+    "ned_fees": (lambda: main.UNIVERSITIES["ned"]["fee_url"], fee_scraper(web_scraping.scrape_ned_fees)),
+    "air_fees": (lambda: main.UNIVERSITIES["air"]["fee_url"], fee_scraper(web_scraping.scrape_fee_structure_air)),
+    "nust_fees": (lambda: main.UNIVERSITIES["nust"]["fee_url"], fee_scraper(web_scraping.scrape_nust_fees)),
+    "comsats_fees": (lambda: main.UNIVERSITIES["comsats"]["fee_url"], fee_scraper(web_scraping.scrape_comsats_fees)),
+    "uni_of_education_fees": (lambda: main.UNIVERSITIES["uni_of_education"]["fee_url"], fee_scraper(web_scraping.scrape_uni_of_educ_fees)),
+    "fast_fees": (lambda: main.UNIVERSITIES["fast"]["fee_url"], fee_scraper(web_scraping.scrape_fast_fees)),
+    "nust_scholarships": (lambda: main.UNIVERSITIES["nust"]["scholarship_url"], fee_scraper(web_scraping.scrape_nust_scholarships)),
+    "iqra_fees": (lambda: extra_universities.IQRA["fee_url"],
+                  fee_scraper(lambda: extra_universities.scrape_table_fees("iqra_fees", extra_universities.IQRA["fee_url"], "Iqra University"))),
+    "bahria_fees": (lambda: extra_universities.BAHRIA["fee_url"],
+                    fee_scraper(lambda: extra_universities.scrape_table_fees("bahria_fees", extra_universities.BAHRIA["fee_url"], "Bahria University"))),
+    "uol_fees": (lambda: extra_universities.UOL["fee_url"], fee_scraper(extra_universities.scrape_fee_structure_uol)),
+    "sisgp": (lambda: scholarships.SISGP_URL, scholarship_route(scholarships.scrape_sisgp)),
+    "turkiye": (lambda: scholarships.TURKIYE_URL, scholarship_route(scholarships.scrape_turkiye)),
+    "hungary": (lambda: scholarships.STIPENDIUM_URL, scholarship_route(scholarships.scrape_stipendium)),
+    "chevening": (lambda: scholarships.CHEVENING_URL, scholarship_route(scholarships.scrape_chevening)),
+    "erasmus": (lambda: scholarships.ERASMUS_URL, scholarship_route(scholarships.scrape_erasmus)),
+    "commonwealth": (lambda: scholarships.COMMONWEALTH_URL, scholarship_route(scholarships.scrape_commonwealth)),
+    "rhodes": (lambda: scholarships.RHODES_URL, scholarship_route(scholarships.scrape_rhodes)),
+    "comsats_events": (lambda: events.COMSATS_EVENTS_URL, event_parser(events.parse_comsats_events, "comsats.html")),
+    "comsats_split_events": (None, event_parser(events.parse_comsats_events, "comsats_split.html")),
+    "neduet_events": (lambda: events.NEDUET_EVENTS_URL.format(page=0), event_parser(events.parse_neduet_events, "neduet.html")),
+    "uet_taxila_events": (lambda: events.UET_TAXILA_EVENTS_URL, event_parser(events.parse_uet_taxila_events, "uet_taxila.html"))
+}
+
+def fixture_path(name):
+    if name.endswith("_events"):
+        return os.path.join(scraper_fixtures.EVENT_FIXTURE_DIR, scraper_fixtures.EVENT_PAGES[name[:-len("_events")]])
+    return os.path.join(scraper_fixtures.FIXTURE_DIR, f"{name}.html")
+
+_event_pages = {}
+
+def load_event_page(filename):
+    if filename not in _event_pages:
+        with open(os.path.join(scraper_fixtures.EVENT_FIXTURE_DIR, filename), encoding="utf-8") as f:
+            _event_pages[filename] = f.read()
+    return _event_pages[filename]
+
+
+class FixtureResponse:
+    status_code = 200
+
+    def __init__(self, url, body):
+        self.url = url
+        self.content = body
+        self.text = body.decode("utf-8")
+        self.encoding = "utf-8"
+
+    def raise_for_status(self):
+        pass
+
+@contextlib.contextmanager
+def offline(pages):
+    # Serves fixture pages instead of the network and turns cache writes into
+    # no-ops, so only fetch-free parsing is timed and nothing is persisted.
+    def fixture_get(url, **kwargs):
+        if url not in pages:
+            raise RuntimeError(f"No fixture recorded for {url}")
+        return FixtureResponse(url, pages[url])
+
+    def skip_store(*args, **kwargs):
+        pass
+
+    patches = [
+        (web_scraping, "polite_get", fixture_get),
+        (scholarships, "polite_get", fixture_get),
+        (web_scraping, "load_cached_data", dict),
+        (web_scraping, "store_cached_entry", skip_store),
+        (extra_universities, "load_cached_data", dict),
+        (extra_universities, "store_cached_entry", skip_store),
+        (scholarships, "store_scholarship", skip_store)
+    ]
+    saved = [(module, name, getattr(module, name)) for module, name, _ in patches]
+    for module, name, value in patches:
+        setattr(module, name, value)
+    try:
+        yield
+    finally:
+        for module, name, value in saved:
+            setattr(module, name, value)
+
+def record(names):
+    for name in names:
+        if SCRAPERS[name][0] is None:
+            continue
+        url = SCRAPERS[name][0]()
+        resp = web_scraping.polite_get(url, headers={"User-Agent": "Mozilla/5.0"}, timeout=30)
+        resp.raise_for_status()
+        with open(fixture_path(name), "wb") as f:
+            f.write(resp.content)
+        print(f"Recorded {name}: {len(resp.content)} bytes from {url}")
+
+def normalized(result):
+    return json.loads(json.dumps(result, sort_keys=True, default=str))
+
+def measure(run, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = run()
+        timings.append((time.perf_counter() - start) * 1000)
+    tracemalloc.start()
+    run()
+    peak = tracemalloc.get_traced_memory()[1] / 1024
+    tracemalloc.stop()
+    return result, timings, peak
+
+def main_bench():
+    parser = argparse.ArgumentParser(description="Run every scraper's parsing against recorded pages, offline.")
+    parser.add_argument("names", nargs="*", help="scrapers to run (default: all)")
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--record", action="store_true", help="fetch the live pages into the fixture corpus first")
+    parser.add_argument("--build", action="store_true", help="rewrite the synthetic fixture corpus first")
+    parser.add_argument("--update-expected", action="store_true", help="store the current outputs as the expected ones")
+    parser.add_argument("--output", help="write the results as JSON to this path")
+    args = parser.parse_args()
+
+    names = args.names or list(SCRAPERS)
+    unknown = [name for name in names if name not in SCRAPERS]
+    if unknown:
+        parser.error(f"unknown scrapers: {', '.join(unknown)}")
+    if args.build:
+        scraper_fixtures.write_fixtures()
+    if args.record:
+        record(names)
+
+    pages = {}
+    page_bytes = {}
+    for name in names:
+        with open(fixture_path(name), "rb") as f:
+            body = f.read()
+        page_bytes[name] = len(body)
+        if SCRAPERS[name][0] is not None:
+            pages[SCRAPERS[name][0]()] = body
+
+    results = {}
+    failures = 0
+    print(f"{'scraper':<24}{'page KiB':>10}{'median ms':>11}{'min ms':>9}{'peak KiB':>11}  output")
+    with offline(pages), contextlib.redirect_stdout(io.StringIO()):
+        for name in names:
+            run = SCRAPERS[name][1]
+            result, timings, peak = measure(run, args.repeat)
+            result = normalized(result)
+            expected_path = os.path.join(EXPECTED_DIR, f"{name}.json")
+            if args.update_expected:
+                os.makedirs(EXPECTED_DIR, exist_ok=True)
+                with open(expected_path, "w", encoding="utf-8") as f:
+                    json.dump(result, f, indent=2, sort_keys=True, ensure_ascii=False)
+                status = "updated"
+            elif os.path.exists(expected_path):
+                with open(expected_path, encoding="utf-8") as f:
+                    status = "equal" if json.load(f) == result else "DIFFERENT"
+            else:
+                status = "no expected output"
+            if status == "DIFFERENT":
+                failures += 1
+            results[name] = {
+                "page_bytes": page_bytes[name],
+                "median_ms": round(statistics.median(timings), 3),
+                "min_ms": round(min(timings), 3),
+                "peak_kib": round(peak, 1),
+                "output": status
+            }
+            sys.__stdout__.write(f"{name:<24}{results[name]['page_bytes'] / 1024:>10.1f}{results[name]['median_ms']:>11.2f}"
+                                 f"{results[name]['min_ms']:>9.2f}{results[name]['peak_kib']:>11.1f}  {status}\n")
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    if failures:
+        print(f"{failures} scraper(s) produced output different from the expected fixtures")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main_bench()
@@ -0,0 +1,81 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Runs in a fresh interpreter so every sample is a cold start: it times the
+# import of the app, then the first request to a cheap route and the first
+# /predict, which is where deferred imports are paid.
+PROBE = r'''
+import contextlib, io, json, sys, time
+started = time.perf_counter()
+with contextlib.redirect_stdout(io.StringIO()):
+    import main
+imported = time.perf_counter()
+booted = [name for name in ("pandas", "numpy", "sklearn", "bs4", "requests") if name in sys.modules]
+client = main.app.test_client()
+client.get("/")
+index_done = time.perf_counter()
+with contextlib.redirect_stdout(io.StringIO()):
+    client.post("/predict", json={"matric_marks": 950, "fsc_marks": 900, "nts_marks": 70, "net_marks": 140, "program": "Computer Science"})
+predict_done = time.perf_counter()
+print(json.dumps({
+    "import_ms": (imported - started) * 1000,
+    "first_index_ms": (index_done - imported) * 1000,
+    "first_predict_ms": (predict_done - index_done) * 1000,
+    "heavy_modules_after_boot": booted
+}))
+'''
+
+def run_probe(eager, db_path):
+    env = dict(os.environ)
+    env["SCHOLAR_DB_PATH"] = db_path
+    if eager:
+        env["SCHOLAR_EAGER_IMPORTS"] = "1"
+    else:
+        env.pop("SCHOLAR_EAGER_IMPORTS", None)
+    result = subprocess.run([sys.executable, "-c", PROBE], cwd=ROOT, env=env, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "probe failed")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+def summarize(samples, key):
+    values = [sample[key] for sample in samples]
+    return {"median": round(statistics.median(values), 1), "min": round(min(values), 1), "max": round(max(values), 1)}
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure cold-start import time and first-request latency of the web app.")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--eager", action="store_true", help="measure with SCHOLAR_EAGER_IMPORTS=1")
+    parser.add_argument("--budget-ms", type=float, default=None, help="fail when the median import time exceeds this budget")
+    parser.add_argument("--db", default=os.path.join(tempfile.gettempdir(), "scholar_startup_bench.db"))
+    parser.add_argument("--output", help="write the summary as JSON to this path")
+    args = parser.parse_args()
+
+    run_probe(args.eager, args.db)  # warm the filesystem cache and create the schema
+    samples = [run_probe(args.eager, args.db) for _ in range(args.runs)]
+    summary = {
+        "mode": "eager" if args.eager else "lazy",
+        "runs": args.runs,
+        "import_ms": summarize(samples, "import_ms"),
+        "first_index_ms": summarize(samples, "first_index_ms"),
+        "first_predict_ms": summarize(samples, "first_predict_ms"),
+        "heavy_modules_after_boot": samples[-1]["heavy_modules_after_boot"]
+    }
+    print(json.dumps(summary, indent=2))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2)
+    if args.budget_ms is not None and summary["import_ms"]["median"] > args.budget_ms:
+        print(f"Startup budget exceeded: median import {summary['import_ms']['median']} ms > {args.budget_ms} ms")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Runs in a fresh interpreter and mimics gunicorn's process model with plain
+# fork(): with preload the master imports the app and freezes the collector
+# before forking and each worker runs the post_fork step; without it every
+# worker imports the app itself. Workers serve a few requests, report ready
+# and wait until the master has read their memory.
+PROBE = r'''
+import contextlib, gc, io, json, os, sys
+workers = int(sys.argv[1])
+requests_per_worker = int(sys.argv[2])
+preload = os.environ.get("SCHOLAR_PRELOAD") == "1"
+programs = ["Computer Science", "Software Engineering", "Electrical Engineering", "Data Science", "Business Administration"]
+
+def serve():
+    with contextlib.redirect_stdout(io.StringIO()):
+        import main
+        client = main.app.test_client()
+        client.get("/")
+        for i in range(requests_per_worker):
+            client.post("/predict", json={"matric_marks": 950, "fsc_marks": 900, "nts_marks": 70, "net_marks": 140,
+                                          "ecat_marks": 300, "ned_test_marks": 70, "program": programs[i % len(programs)]})
+        gc.collect()
+
+def smaps(pid):
+    values = {}
+    with open(f"/proc/{pid}/smaps_rollup") as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) == 3 and parts[2] == "kB":
+                values[parts[0].rstrip(":")] = int(parts[1])
+    return {"rss_kib": values["Rss"], "pss_kib": values["Pss"],
+            "uss_kib": values["Private_Clean"] + values["Private_Dirty"]}
+
+if preload:
+    with contextlib.redirect_stdout(io.StringIO()):
+        import main
+    gc.freeze()
+
+children = []
+for _ in range(workers):
+    ready_r, ready_w = os.pipe()
+    done_r, done_w = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(ready_r)
+        os.close(done_w)
+        if preload:
+            import merit_tables
+            merit_tables.detach_predictions()
+        serve()
+        os.write(ready_w, b"1")
+        os.read(done_r, 1)
+        os._exit(0)
+    os.close(ready_w)
+    os.close(done_r)
+    children.append((pid, ready_r, done_w))
+
+for _, ready_r, _ in children:
+    os.read(ready_r, 1)
+report = {"master": smaps(os.getpid()), "workers": [smaps(pid) for pid, _, _ in children]}
+for pid, _, done_w in children:
+    os.write(done_w, b"1")
+    os.waitpid(pid, 0)
+print(json.dumps(report))
+'''
+
+def run_probe(preload, workers, requests_per_worker, db_path):
+    env = dict(os.environ)
+    env["SCHOLAR_DB_PATH"] = db_path
+    env["SCHOLAR_PRELOAD"] = "1" if preload else "0"
+    env["SCHOLAR_EAGER_IMPORTS"] = "1" if preload else "0"
+    result = subprocess.run([sys.executable, "-c", PROBE, str(workers), str(requests_per_worker)],
+                            cwd=ROOT, env=env, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "probe failed")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+def summarize(report):
+    workers = report["workers"]
+    return {
+        "worker_uss_kib": round(statistics.median(w["uss_kib"] for w in workers)),
+        "worker_pss_kib": round(statistics.median(w["pss_kib"] for w in workers)),
+        "worker_rss_kib": round(statistics.median(w["rss_kib"] for w in workers)),
+        "master_uss_kib": report["master"]["uss_kib"],
+        "total_pss_kib": report["master"]["pss_kib"] + sum(w["pss_kib"] for w in workers)
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare per-worker unique memory with and without preloading the app in the master.")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--requests", type=int, default=20, help="/predict requests each worker serves before it is measured")
+    parser.add_argument("--db", default=os.path.join(tempfile.gettempdir(), "scholar_memory_bench.db"))
+    parser.add_argument("--output", help="write the summary as JSON to this path")
+    args = parser.parse_args()
+
+    if not os.path.exists("/proc/self/smaps_rollup"):
+        print("This benchmark reads /proc/<pid>/smaps_rollup and needs Linux.")
+        sys.exit(1)
+
+    summary = {"workers": args.workers, "requests_per_worker": args.requests}
+    for mode, preload in (("per_worker", False), ("preload", True)):
+        summary[mode] = summarize(run_probe(preload, args.workers, args.requests, args.db))
+
+    print(f"{'mode':<14}{'worker USS':>14}{'worker PSS':>14}{'worker RSS':>14}{'master USS':>14}{'total PSS':>14}")
+    for mode in ("per_worker", "preload"):
+        row = summary[mode]
+        print(f"{mode:<14}{row['worker_uss_kib'] / 1024:>11.1f} MiB{row['worker_pss_kib'] / 1024:>10.1f} MiB"
+              f"{row['worker_rss_kib'] / 1024:>10.1f} MiB{row['master_uss_kib'] / 1024:>10.1f} MiB{row['total_pss_kib'] / 1024:>10.1f} MiB")
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
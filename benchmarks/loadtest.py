@@ -0,0 +1,252 @@
+import argparse
+import datetime
+import json
+import os
+import random
+import sys
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import synthetic_merit
+
+
+# Closed-loop load generator for a running instance of the app. Each virtual
+# user repeatedly picks a scenario by weight and plays its steps; concurrency
+# is ramped in stages and every request is recorded against its route.
+#
+#   gunicorn -c gunicorn.conf.py main:app --bind 127.0.0.1:5000 --workers 4
+#   python benchmarks/loadtest.py --base-url http://127.0.0.1:5000 --ramp 1 4 16 64
+#
+# Point the app at benchmarks/mock_upstream.py (SCRAPE_UPSTREAM_URL) so the
+# scraping routes hit a controlled upstream instead of the real sites.
+FEE_ROUTES = ["/feesiiui", "/feesuet", "/feeslums", "/nedfees", "/feesair", "/feesnust",
+              "/feescomsats", "/fees_uni_of_education", "/feesfast"]
+FEE_HISTORY_UNIS = ["nust", "comsats", "fast", "uet"]
+SCHOLARSHIP_ROUTES = ["/sisgp", "/turkiye", "/hungary", "/chevening", "/erasmus", "/commonwealth", "/rhodes", "/scholarshipsnust"]
+SEARCH_TERMS = ["computer science fee", "scholarship pakistan", "engineering", "fully funded masters", "hostel"]
+PROGRAMS = synthetic_merit.program_names(len(synthetic_merit.PROGRAM_NAMES))
+
+# Default SLOs per route, matched by the longest prefix. Latencies in ms,
+# error rate as a fraction of requests.
+DEFAULT_SLOS = {
+    "/predict": {"p95": 300, "p99": 800, "error_rate": 0.01},
+    "/fees": {"p95": 2000, "p99": 5000, "error_rate": 0.02},
+    "/api/events": {"p95": 500, "p99": 1500, "error_rate": 0.01},
+    "/": {"p95": 3000, "p99": 8000, "error_rate": 0.02}
+}
+
+
+def predict_heavy(user):
+    kinds = [kind for kind, _ in synthetic_merit.REQUEST_MIX]
+    weights = [weight for _, weight in synthetic_merit.REQUEST_MIX]
+    for _ in range(user.rng.randint(1, 3)):
+        body = synthetic_merit.make_request(user.rng, user.rng.choices(kinds, weights)[0], PROGRAMS)
+        user.request("POST", "/predict", json=body)
+
+def fees_browse(user):
+    user.request("GET", "/")
+    for route in user.rng.sample(FEE_ROUTES, user.rng.randint(1, 3)):
+        user.request("GET", route)
+    if user.rng.random() < 0.3:
+        user.request("GET", f"/fees/{user.rng.choice(FEE_HISTORY_UNIS)}/history", route="/fees/<uni_id>/history")
+
+def events_browse(user):
+    start = datetime.date.today() + datetime.timedelta(days=user.rng.randint(-30, 30))
+    end = start + datetime.timedelta(days=user.rng.choice([7, 30, 90]))
+    user.request("GET", f"/api/events?from={start}&to={end}", route="/api/events")
+    # Feed readers poll with the validator from their previous fetch.
+    feed = user.rng.choice(["/api/events.json", "/api/events.ics"])
+    headers = {"If-None-Match": user.etags[feed]} if feed in user.etags else None
+    user.request("GET", feed, headers=headers)
+    if user.rng.random() < 0.3:
+        user.request("GET", user.rng.choice(["/api/comsats_events", "/api/neduet_events", "/api/uet_taxila_events"]))
+
+def scholarships(user):
+    user.request("GET", "/scholarships/deadlines?within=30d", route="/scholarships/deadlines")
+    user.request("GET", f"/search?q={user.rng.choice(SEARCH_TERMS)}", route="/search")
+    user.request("GET", user.rng.choice(SCHOLARSHIP_ROUTES))
+
+SCENARIOS = {
+    "predict": predict_heavy,
+    "fees": fees_browse,
+    "events": events_browse,
+    "scholarships": scholarships
+}
+
+
+class VirtualUser:
+    def __init__(self, base_url, seed, timeout, records):
+        self.base_url = base_url.rstrip("/")
+        self.rng = random.Random(seed)
+        self.session = requests.Session()
+        self.timeout = timeout
+        self.records = records
+        self.etags = {}
+
+    def request(self, method, path, route=None, headers=None, json=None):
+        route = route or urlsplit(path).path
+        start = time.perf_counter()
+        try:
+            response = self.session.request(method, self.base_url + path, headers=headers, json=json, timeout=self.timeout)
+            status = response.status_code
+            if response.headers.get("ETag"):
+                self.etags[path] = response.headers["ETag"]
+        except requests.RequestException:
+            status = None
+        self.records.append((route, (time.perf_counter() - start) * 1000, status))
+
+def run_stage(base_url, concurrency, seconds, mix, think_ms, timeout, seed):
+    names = list(mix)
+    weights = [mix[name] for name in names]
+    deadline = time.perf_counter() + seconds
+    per_user = [[] for _ in range(concurrency)]
+
+    def user_loop(index):
+        user = VirtualUser(base_url, seed * 100003 + index, timeout, per_user[index])
+        while time.perf_counter() < deadline:
+            SCENARIOS[user.rng.choices(names, weights)[0]](user)
+            if think_ms:
+                time.sleep(user.rng.expovariate(1000 / think_ms))
+
+    threads = [threading.Thread(target=user_loop, args=(i,), daemon=True) for i in range(concurrency)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return [record for records in per_user for record in records], time.perf_counter() - started
+
+def percentile(ordered, q):
+    return round(ordered[min(len(ordered) - 1, int(q * len(ordered)))], 2) if ordered else None
+
+def summarize(records, elapsed):
+    routes = {}
+    for route, latency, status in records:
+        routes.setdefault(route, []).append((latency, status))
+    summary = {}
+    for route, samples in sorted(routes.items()):
+        latencies = sorted(latency for latency, _ in samples)
+        errors = sum(1 for _, status in samples if status is None or status >= 500)
+        summary[route] = {
+            "requests": len(samples),
+            "throughput_rps": round(len(samples) / elapsed, 2),
+            "error_rate": round(errors / len(samples), 4),
+            "p50": percentile(latencies, 0.50),
+            "p95": percentile(latencies, 0.95),
+            "p99": percentile(latencies, 0.99)
+        }
+    return summary
+
+def slo_for(route, slos):
+    matches = [prefix for prefix in slos if route.startswith(prefix)]
+    return slos[max(matches, key=len)] if matches else None
+
+def check_slos(route_stats, slos):
+    breaches = []
+    for route, stats in route_stats.items():
+        slo = slo_for(route, slos)
+        for key, limit in (slo or {}).items():
+            if stats.get(key) is not None and stats[key] > limit:
+                breaches.append(f"{route} {key} {stats[key]} > {limit}")
+    return breaches
+
+def saturation(stages):
+    # Per route, the lowest concurrency already delivering 95% of the best
+    # throughput seen: adding users beyond it only adds queueing.
+    points = {}
+    routes = {route for stage in stages for route in stage["routes"]}
+    for route in sorted(routes):
+        series = [(stage["concurrency"], stage["routes"][route]["throughput_rps"]) for stage in stages if route in stage["routes"]]
+        best = max(rps for _, rps in series)
+        knee = next(concurrency for concurrency, rps in series if rps >= 0.95 * best)
+        points[route] = {"concurrency": knee, "max_throughput_rps": best,
+                         "saturated": knee < series[-1][0]}
+    return points
+
+def parse_weights(text):
+    mix = {}
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        if name not in SCENARIOS:
+            raise argparse.ArgumentTypeError(f"unknown scenario {name!r}; choose from {', '.join(SCENARIOS)}")
+        mix[name] = float(weight or 1)
+    return mix
+
+def parse_slos(text):
+    # "/predict:p95=250,p99=600;/fees:error_rate=0.05"
+    slos = {}
+    for part in filter(None, text.split(";")):
+        route, _, limits = part.partition(":")
+        slos[route] = {key: float(value) for key, _, value in (item.partition("=") for item in limits.split(","))}
+    return slos
+
+def main():
+    parser = argparse.ArgumentParser(description="Ramp concurrent virtual users against a running app and check SLOs.")
+    parser.add_argument("--base-url", default="http://127.0.0.1:5000")
+    parser.add_argument("--mix", type=parse_weights, default=parse_weights("predict=50,fees=20,events=20,scholarships=10"),
+                        help="scenario weights, e.g. predict=50,fees=20,events=20,scholarships=10")
+    parser.add_argument("--ramp", type=int, nargs="+", default=[1, 2, 4, 8, 16, 32], help="concurrency of each stage")
+    parser.add_argument("--stage-seconds", type=float, default=20)
+    parser.add_argument("--think-ms", type=float, default=0, help="mean pause between scenarios per user")
+    parser.add_argument("--timeout", type=float, default=30)
+    parser.add_argument("--slo", type=parse_slos, default={}, help="override SLOs, e.g. '/predict:p95=250,p99=600;/fees:error_rate=0.05'")
+    parser.add_argument("--target", type=int, help="concurrency that must meet every SLO (default: the last stage)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="write the full report as JSON to this path")
+    args = parser.parse_args()
+
+    slos = dict(DEFAULT_SLOS)
+    slos.update(args.slo)
+    target = args.target or args.ramp[-1]
+    stages = []
+    print(f"{'users':>6}{'route':<34}{'req':>7}{'req/s':>9}{'err %':>7}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}")
+    for concurrency in args.ramp:
+        records, elapsed = run_stage(args.base_url, concurrency, args.stage_seconds, args.mix, args.think_ms, args.timeout, args.seed)
+        routes = summarize(records, elapsed)
+        breaches = check_slos(routes, slos)
+        stages.append({"concurrency": concurrency, "seconds": round(elapsed, 2), "requests": len(records),
+                       "throughput_rps": round(len(records) / elapsed, 2), "routes": routes, "slo_breaches": breaches})
+        for route, stats in routes.items():
+            print(f"{concurrency:>6} {route:<33}{stats['requests']:>7}{stats['throughput_rps']:>9.1f}{stats['error_rate'] * 100:>7.1f}"
+                  f"{stats['p50']:>9.1f}{stats['p95']:>9.1f}{stats['p99']:>9.1f}")
+        print(f"{concurrency:>6} {'all routes':<33}{len(records):>7}{len(records) / elapsed:>9.1f}  SLO {'ok' if not breaches else 'breached'}")
+
+    capacity = max((stage["concurrency"] for stage in stages if not stage["slo_breaches"]), default=None)
+    target_stage = next((stage for stage in stages if stage["concurrency"] == target), None)
+    passed = target_stage is not None and not target_stage["slo_breaches"]
+    report = {
+        "created": datetime.datetime.now().isoformat(timespec="seconds"),
+        "base_url": args.base_url,
+        "mix": args.mix,
+        "slos": slos,
+        "stages": stages,
+        "saturation": saturation(stages),
+        "capacity_concurrency": capacity,
+        "target_concurrency": target,
+        "passed": passed
+    }
+
+    print("\nsaturation (lowest concurrency reaching 95% of peak throughput)")
+    for route, point in report["saturation"].items():
+        print(f"  {route:<33} {point['concurrency']:>4} users, {point['max_throughput_rps']:.1f} req/s{' (saturated)' if point['saturated'] else ''}")
+    print(f"\nhighest concurrency meeting every SLO: {capacity if capacity is not None else 'none'}")
+    if target_stage is None:
+        print(f"FAIL: no stage ran at the target concurrency {target}")
+    elif passed:
+        print(f"PASS: all SLOs met at {target} concurrent users")
+    else:
+        print(f"FAIL at {target} concurrent users:")
+        for breach in target_stage["slo_breaches"]:
+            print(f"  {breach}")
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    sys.exit(0 if passed else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+import argparse
+import email.utils
+import hashlib
+import json
+import os
+import random
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+
+# A stand-in for the university, ilmkidunya and event sites. It serves the
+# page corpus from benchmarks/fixtures and can inject latency, errors, hangs,
+# truncated bodies and 304s. Start it, then run the app with
+# SCRAPE_UPSTREAM_URL=http://127.0.0.1:<port> so polite_get fetches from here:
+# a request for https://host/path arrives as /host/path.
+#
+# GET /_mock/stats returns per-outcome counters; POST /_mock/config with a JSON
+# object changes any fault setting while the server runs ("reset_stats": true
+# also clears the counters).
+DEFAULT_FAULTS = {
+    "latency_ms": 0.0,
+    "jitter_ms": 0.0,
+    "error_rate": 0.0,
+    "error_status": 503,
+    "timeout_rate": 0.0,
+    "hang_s": 35.0,
+    "truncate_rate": 0.0,
+    "truncate_mode": "abort",
+    "not_modified_rate": 0.0
+}
+
+def fixture_routes():
+    # Keyed by "host/path?query" with a leading www. dropped, the way the
+    # rewritten URLs arrive.
+    import bench_scrapers
+    routes = {}
+    for name, (url, _) in bench_scrapers.SCRAPERS.items():
+        if url is None:
+            continue
+        routes[route_key(url())] = bench_scrapers.fixture_path(name)
+    return routes
+
+def route_key(url):
+    parts = urlsplit(url if "://" in url else f"http://{url}")
+    host = (parts.hostname or "").lower()
+    host = host[4:] if host.startswith("www.") else host
+    return f"{host}{parts.path or '/'}" + (f"?{parts.query}" if parts.query else "")
+
+
+class MockUpstream(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, routes, faults, seed):
+        super().__init__(address, MockHandler)
+        self.routes = routes
+        self.faults = dict(faults)
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.stats = {}
+        self.pages = {}
+        self.started = email.utils.formatdate(time.time(), usegmt=True)
+
+    def page(self, key):
+        path = self.routes.get(key)
+        if path is None:
+            return None
+        if path not in self.pages:
+            with open(path, "rb") as f:
+                body = f.read()
+            self.pages[path] = (body, '"' + hashlib.sha1(body).hexdigest()[:16] + '"')
+        return self.pages[path]
+
+    def draw(self):
+        # One draw per request decides its fate, so a fixed seed and request
+        # order replay the same faults.
+        with self.lock:
+            faults = dict(self.faults)
+            roll = self.rng.random()
+            delay = max(0.0, faults["latency_ms"] + self.rng.uniform(-1, 1) * faults["jitter_ms"]) / 1000
+        outcome = "ok"
+        for name, rate in (("error", faults["error_rate"]), ("timeout", faults["timeout_rate"]),
+                           ("truncated", faults["truncate_rate"]), ("not_modified", faults["not_modified_rate"])):
+            if roll < rate:
+                outcome = name
+                break
+            roll -= rate
+        return outcome, delay, faults
+
+    def count(self, outcome):
+        with self.lock:
+            self.stats[outcome] = self.stats.get(outcome, 0) + 1
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def send_body(self, status, body, content_type="text/html; charset=utf-8", headers=None, length=None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body) if length is None else length))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        server = self.server
+        if self.path == "/_mock/stats":
+            with server.lock:
+                body = json.dumps({"faults": server.faults, "outcomes": server.stats}).encode()
+            return self.send_body(200, body, "application/json")
+
+        key = route_key(self.path.lstrip("/"))
+        page = server.page(key)
+        if page is None:
+            server.count("not_found")
+            return self.send_body(404, b"No fixture for this URL")
+        body, etag = page
+        outcome, delay, faults = server.draw()
+        time.sleep(delay)
+        validators = {"ETag": etag, "Last-Modified": server.started}
+
+        if outcome == "error":
+            server.count("error")
+            return self.send_body(int(faults["error_status"]), b"Upstream error injected by mock server")
+        if outcome == "timeout":
+            server.count("timeout")
+            time.sleep(faults["hang_s"])
+            self.close_connection = True
+            return
+        conditional = self.headers.get("If-None-Match") == etag or self.headers.get("If-Modified-Since") == server.started
+        if outcome == "not_modified" or conditional:
+            # Unprompted 304s model a misbehaving cache in front of the site.
+            server.count("not_modified")
+            self.send_response(304)
+            for name, value in validators.items():
+                self.send_header(name, value)
+            self.end_headers()
+            return
+        if outcome == "truncated":
+            server.count("truncated")
+            cut = body[:len(body) // 2]
+            if faults["truncate_mode"] == "short":
+                # A complete response whose page simply stops half way.
+                return self.send_body(200, cut, headers=validators)
+            # Promise the full body, send half and drop the connection.
+            self.close_connection = True
+            return self.send_body(200, cut, headers=validators, length=len(body))
+        server.count("ok")
+        self.send_body(200, body, headers=validators)
+
+    def do_POST(self):
+        server = self.server
+        if self.path != "/_mock/config":
+            return self.send_body(404, b"Unknown endpoint")
+        try:
+            changes = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+            reset = changes.pop("reset_stats", False)
+            unknown = [name for name in changes if name not in DEFAULT_FAULTS]
+            if unknown:
+                raise ValueError(f"Unknown fault settings: {', '.join(unknown)}")
+        except ValueError as e:
+            return self.send_body(400, json.dumps({"error": str(e)}).encode(), "application/json")
+        with server.lock:
+            server.faults.update(changes)
+            if reset:
+                server.stats.clear()
+            body = json.dumps({"faults": server.faults}).encode()
+        self.send_body(200, body, "application/json")
+
+
+def serve(host="127.0.0.1", port=8900, seed=0, **faults):
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    settings = dict(DEFAULT_FAULTS)
+    settings.update({name: value for name, value in faults.items() if value is not None})
+    server = MockUpstream((host, port), fixture_routes(), settings, seed)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve the recorded upstream pages with injected latency and failures.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8900)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--latency-ms", type=float, help="added delay per request")
+    parser.add_argument("--jitter-ms", type=float, help="uniform +/- spread around the delay")
+    parser.add_argument("--error-rate", type=float, help="share of requests answered with --error-status")
+    parser.add_argument("--error-status", type=int)
+    parser.add_argument("--timeout-rate", type=float, help="share of requests that hang for --hang-s before closing")
+    parser.add_argument("--hang-s", type=float)
+    parser.add_argument("--truncate-rate", type=float, help="share of responses cut off half way")
+    parser.add_argument("--truncate-mode", choices=["abort", "short"],
+                        help="abort: drop the connection before Content-Length is reached; short: a valid response with half the page")
+    parser.add_argument("--not-modified-rate", type=float, help="share of requests answered 304 even without validators")
+    args = parser.parse_args()
+
+    faults = {name: getattr(args, name) for name in DEFAULT_FAULTS}
+    server = serve(args.host, args.port, args.seed, **faults)
+    print(f"Serving {len(server.routes)} recorded pages on http://{args.host}:{args.port}")
+    print(f"Run the app with SCRAPE_UPSTREAM_URL=http://{args.host}:{args.port}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,234 @@
+import os
+
+from bench_event_parsing import FIXTURE_DIR as EVENT_FIXTURE_DIR, synthetic_page as event_page
+
+
+# Builds the offline page corpus for bench_scrapers.py. Each page carries the
+# markup its scraper looks for, wrapped in navigation, sidebar, footer and
+# script chrome of roughly the size of the live pages, so parse times are
+# comparable. bench_scrapers.py --record replaces them with live captures.
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "scrapers")
+
+PROGRAMS = [
+    "BS Computer Science", "BS Software Engineering", "BS Artificial Intelligence", "BS Data Science",
+    "BS Cyber Security", "BS Information Technology", "BE Electrical Engineering", "BE Mechanical Engineering",
+    "BE Civil Engineering", "BBA", "BS Accounting and Finance", "BS Economics", "BS Psychology",
+    "BS Mathematics", "BS Physics", "BS English", "MS Computer Science", "MS Electrical Engineering",
+    "MBA", "M.Phil Economics", "PhD Computer Science", "PhD Management Sciences"
+]
+
+def chrome(title, links=180, sidebar=40):
+    nav = "".join(f'<li class="menu-item"><a href="/colleges/page-{i}.aspx"><span>Menu entry {i}</span></a></li>' for i in range(links))
+    side = "".join(
+        f'<div class="card"><a href="/news/{i}"><img src="/img/{i}.jpg" alt="news {i}"/></a>'
+        f'<div class="card-body"><span class="small">News headline number {i} about admissions and results</span></div></div>'
+        for i in range(sidebar)
+    )
+    script = "<script>" + "".join(f"window.dataLayer.push({{'event':'view','slot':{i}}});" for i in range(120)) + "</script>"
+    head = (f'<!DOCTYPE html><html lang="en"><head><meta charset="utf-8"/><title>{title}</title>'
+            f'<link rel="stylesheet" href="/css/site.css"/>{script}</head><body>'
+            f'<header id="top"><nav class="navbar"><ul class="menu">{nav}</ul></nav></header>')
+    tail = (f'<aside class="sidebar">{side}</aside>'
+            f'<footer class="footer"><ul>{nav[:len(nav) // 3]}</ul><span>All rights reserved.</span></footer>{script}</body></html>')
+    return head, tail
+
+def page(title, body):
+    head, tail = chrome(title)
+    return f'{head}<main><div class="content main-content">{body}</div></main>{tail}'
+
+def fee_rows(count, columns):
+    rows = []
+    for i in range(count):
+        program = PROGRAMS[i % len(PROGRAMS)]
+        fee = 95000 + (i * 7919) % 160000
+        cells = {"program": program, "duration": f"{4 if i % 3 else 2} Years", "fee": f"Rs. {fee:,}",
+                 "admission": "Rs. 25,000", "semester": f"{fee // 8:,}", "credit": f"{3000 + i * 50:,}"}
+        rows.append([cells[c] for c in columns])
+    return rows
+
+def table(headers, rows, cls="table table-bordered"):
+    head = "".join(f"<th>{h}</th>" for h in headers)
+    body = "".join("<tr>" + "".join(f"<td>{c}</td>" for c in row) + "</tr>" for row in rows)
+    return f'<table class="{cls}"><tr>{head}</tr>{body}</table>'
+
+def plain_fee_page(name, tables=2, rows=18):
+    body = f"<h1>{name} Fee Structure 2025</h1><p>Here is the latest fee structure of {name} for all programs.</p>"
+    for t in range(tables):
+        body += f"<h2>{name} Fee Structure {'Undergraduate' if t == 0 else 'Graduate'}</h2>"
+        body += table(["Program", "Duration", "Total Fee", "Admission Fee"], fee_rows(rows, ["program", "duration", "fee", "admission"]))
+        body += "<p>Fee is subject to change as per university policy.</p>"
+    return page(f"{name} Fee Structure", body)
+
+def iiui_page():
+    rows = [[PROGRAMS[i % len(PROGRAMS)], f"{4 if i % 3 else 2} Years", f"Total Fee {120000 + i * 4500}"] for i in range(24)]
+    rows.append(["Diploma in Arabic", "1 Year", "Contact office"])
+    return page("IIUI Fee Structure", "<h1>IIUI Fee Structure</h1>" + table(["Program Name", "Duration", "Fee"], rows)
+                + table(["Hostel", "Charges"], [["Boys", "Rs 18,000"], ["Girls", "Rs 20,000"]], cls="table hostel"))
+
+def lums_page():
+    body = "<h1>LUMS Fee Structure</h1><h2>Freshman BSCS Fee</h2>"
+    body += table(["Item", "Per Semester", "Per Year"], [[f"Tuition component {i}", f"Rs {300000 + i * 1000:,}", f"Rs {600000 + i * 2000:,}"] for i in range(8)])
+    for section in ["Ph. D Programs", "Masters Programs", "Bachelors Programs", "M. Phil Programs", "Others Programs"]:
+        body += f"<h3>{section}</h3>" + table(["Program", "Duration", "Fee"], fee_rows(10, ["program", "duration", "fee"]))
+    return page("LUMS Fee Structure", body)
+
+def sectioned_fee_page(name):
+    body = f"<h1>{name} Fee Structure</h1>"
+    for section in ["BSCS Fee Structure", "BBA Fee Structure", "M. Phil Programs", "Masters Programs"]:
+        body += f"<h2>{name} {section}</h2><p>Semester wise breakup.</p>"
+        body += table(["Semester", "Tuition Fee", "Other Charges"], [[f"Semester {i}", f"Rs {95000 + i * 1000:,}", "Rs 5,000"] for i in range(1, 9)])
+    return page(f"{name} Fee Structure", body)
+
+def fast_page():
+    body = "<h1>FAST NUCES Fee Structure</h1><h2>Tuition Fee</h2>"
+    body += table(["Program", "Per Credit Hour", "Per Semester"], fee_rows(12, ["program", "credit", "semester"]))
+    body += "<p>Student Activities Fund of Rs 3,000 per semester is charged to all students.</p>"
+    body += "<h2>Miscellaneous Fees</h2>"
+    body += "".join(f"<p>Charge number {i} Rs {500 + i * 250:,}</p>" for i in range(6))
+    body += "<p>Admission processing Rs 2,000</p>"
+    body += table(["Item", "Amount"], [[f"Document fee {i}", f"Rs {1000 + i * 100:,}"] for i in range(6)] + [["Admission fee", "Rs 25,000"]])
+    body += "<h2>Late Payment Fine</h2><p>Rs 100 per day after the due date, up to Rs 3,000.</p>"
+    body += "<h2>Fee Refund Policy</h2><p>As per HEC guidelines.</p>"
+    body += table(["Timeline", "Refund"], [["Up to 7th day of classes", "100%"], ["8th to 15th day", "50%"], ["After 15th day", "No refund"]])
+    body += "<h2>Payment Instructions</h2>"
+    body += "".join(f"<p>Pay through branch network option {i} of the designated bank.</p>" for i in range(4))
+    body += "<li>Online payment via 1-Link</li><li>Applicant portal for admission challans</li><li>Mobile banking apps</li>"
+    body += "<h3>Contact</h3><p>Accounts office</p>"
+    return page("FAST Fee Structure", body)
+
+def nust_scholarship_page():
+    body = "<h1>NUST Islamabad</h1><h2>About NUST</h2><p>National University of Sciences and Technology.</p>"
+    body += "<h2>NUST Scholarships</h2>"
+    for i in range(6):
+        body += f"<p>NUST offers need based scholarship programme {i} for deserving students across all schools.</p>"
+        body += "<ul>" + "".join(f"<li>Scholarship scheme {i}.{j} covering tuition</li>" for j in range(4)) + "</ul>"
+    body += "<h2>NUST Hostels</h2><p>Hostel details.</p>"
+    return page("NUST Scholarships", body)
+
+def ul(items):
+    return "<ul>" + "".join(f"<li>{item}</li>" for item in items) + "</ul>"
+
+def ol(items):
+    return "<ol>" + "".join(f"<li>{item}</li>" for item in items) + "</ol>"
+
+def long_p(text):
+    return f"<p>{text} This paragraph gives Pakistani students the detail they need before they apply.</p>"
+
+def social():
+    buttons = "".join(f"<button>{name}</button>" for name in ["WhatsApp", "Facebook", "Twitter", "LinkedIn", "Email"])
+    return (f'<div class="share">{buttons}</div><div>Is this page helpful?</div><button>Yes</button><button>No</button>'
+            '<p>Join 2.5 million followers on our social channels for updates.</p>'
+            '<p>Copyright 2025 ilmkidunya.com, all rights reserved.</p>')
+
+def facts_table(rows):
+    return "<table>" + "".join(f"<tr><td>{k}</td><td>{v}</td></tr>" for k, v in rows) + "</table>"
+
+def scholarship_page(name, sections, extra=""):
+    body = f"<h1>{name} 2025</h1>" + long_p(f"The {name} is one of the most sought after fully funded awards.")
+    body += facts_table([("Level", "Masters"), ("Funding", "Fully funded"), ("Deadline", "15 March 2026"), ("Country", "Abroad")])
+    for heading, content in sections:
+        body += f"<h2>{heading}</h2>{content}"
+    return page(name, body + extra + social())
+
+def sisgp_page():
+    points = lambda label: [f"{label} point {i} for applicants" for i in range(5)]
+    return scholarship_page("SI Scholarship for Global Professionals", [
+        ("Why Pakistani Professionals Should Apply", ul(points("Why"))),
+        ("Eligibility Criteria", ul(points("Eligibility"))),
+        ("What Does the Scholarship Cover?", ul(points("Coverage"))),
+        ("How to Apply", ol(points("Step"))),
+        ("Key Dates", ul(["Application opens 1. February", "Deadline 2. March", "Results 3. May"])),
+        ("Benefits", ul(points("Benefit"))),
+        ("Final Thoughts", long_p("Apply early and prepare your documents in advance.") * 2)
+    ])
+
+def turkiye_page():
+    eligibility = "".join(f"<h3>{title}</h3>" + ul([f"{title} rule {i}" for i in range(4)]) for title in ["Academic Requirements", "Age Limits", "Other Requirements"])
+    benefits = "<table><tr><th>Benefit</th><th>Detail</th></tr>" + "".join(f"<tr><td>Benefit {i}</td><td>Monthly stipend part {i}</td></tr>" for i in range(6)) + "</table>"
+    return page("Turkiye Burslari", "<h1>Türkiye Burslari Scholarships 2025</h1><p>Fully funded Turkish government scholarship.</p>"
+                + benefits
+                + "".join(f"<h2>{h}</h2>{c}" for h, c in [
+                    ("Why Türkiye Scholarships Are a Game-Changer", ul([f"Reason {i}" for i in range(5)])),
+                    ("Who is Eligible?", eligibility),
+                    ("How to Apply", ol([f"Application step {i}" for i in range(6)])),
+                    ("Selection Process", ul([f"Stage {i}" for i in range(3)])),
+                    ("Key Dates", ul(["10 January", "20 February"])),
+                    ("Why Study in Turkey?", ul([f"Advantage {i}" for i in range(4)]))
+                ]) + social())
+
+def stipendium_page():
+    return scholarship_page("Stipendium Hungaricum Scholarship", [
+        ("Introduction", long_p("Hungary offers scholarships every year.") * 3),
+        ("What is the Stipendium Hungaricum Scholarship?", long_p("It is a bilateral programme.") * 2),
+        ("Programs Offered", ul(["Bachelor", "Master", "One-tier Master", "Doctoral"])),
+        ("Eligibility Criteria", ul([f"Criterion {i}" for i in range(5)])),
+        ("Scholarship Benefits", ul([f"Benefit {i}" for i in range(5)])),
+        ("How to Apply", long_p("Step 1. Register on the application portal.") * 3),
+        ("Important Dates", ul(["Opens November", "Closes January"])),
+        ("Why Pakistani Students Should Apply", ul([f"Reason {i}" for i in range(4)])),
+        ("Contact for Queries", "<p>Email the Higher Education Commission scholarship desk.</p>"),
+        ("Conclusion", long_p("A strong option for students who want to study in Europe."))
+    ])
+
+def generic_scholarship_page(name, paragraphs):
+    return scholarship_page(name, [
+        (f"Overview of {name}", "".join(long_p(f"{name} overview paragraph {i}.") for i in range(paragraphs))),
+        ("Eligibility", ul([f"Requirement {i}" for i in range(5)])),
+        ("Benefits", ul([f"Benefit {i}" for i in range(5)]))
+    ], extra="<h3>Frequently Asked Questions</h3>" + "".join(long_p(f"Answer {i}.") for i in range(6)))
+
+def rhodes_page():
+    process = "".join(f"<h3>Step {i}</h3><p>Detail for step {i}.</p>" + ul([f"Item {i}.{j}" for j in range(3)]) for i in range(4))
+    return scholarship_page("Rhodes Scholarship", [
+        ("Introduction", long_p("The Rhodes Scholarship is the oldest graduate scholarship.")),
+        ("What the Scholarship Covers", ul([f"Cover {i}" for i in range(5)])),
+        ("Eligibility Criteria", ul([f"Eligibility {i}" for i in range(5)])),
+        ("Application Process", process),
+        ("Why Apply for Rhodes", ul([f"Reason {i}" for i in range(4)])),
+        ("Tips for a Strong Application", ul([f"Tip {i}" for i in range(5)])),
+        ("Final Words", long_p("Start preparing a year in advance."))
+    ], extra="<p><strong>Important:</strong> Only one application per cycle is allowed.</p>")
+
+PAGES = {
+    "iiui_fees": iiui_page,
+    "uet_fees": lambda: plain_fee_page("UET Lahore", tables=1, rows=30),
+    "lums_fees": lums_page,
+    "ned_fees": lambda: plain_fee_page("NED University"),
+    "air_fees": lambda: sectioned_fee_page("Air University"),
+    "nust_fees": lambda: plain_fee_page("NUST"),
+    "comsats_fees": lambda: plain_fee_page("COMSATS", tables=3),
+    "uni_of_education_fees": lambda: plain_fee_page("University of Education"),
+    "fast_fees": fast_page,
+    "nust_scholarships": nust_scholarship_page,
+    "iqra_fees": lambda: plain_fee_page("Iqra University"),
+    "bahria_fees": lambda: plain_fee_page("Bahria University"),
+    "uol_fees": lambda: sectioned_fee_page("University of Lahore"),
+    "sisgp": sisgp_page,
+    "turkiye": turkiye_page,
+    "hungary": stipendium_page,
+    "chevening": lambda: generic_scholarship_page("Chevening Scholarship", 8),
+    "erasmus": lambda: generic_scholarship_page("Erasmus Mundus Scholarship", 10),
+    "commonwealth": lambda: generic_scholarship_page("Commonwealth Scholarship", 12),
+    "rhodes": rhodes_page
+}
+def comsats_split_page():
+    # The same events with the date marker split across tags, as in
+    # <b>Event Date</b>: 3/4/2026 or Event <b>Date:</b> 3/4/2026. No single
+    # text node holds the whole marker.
+    html = event_page("comsats")
+    half = html.index("Event Date:", len(html) // 2)
+    return html[:half].replace("Event Date:", "<b>Event Date</b>:") + html[half:].replace("Event Date:", "Event <b>Date:</b>")
+
+EVENT_PAGES = {"comsats": "comsats.html", "comsats_split": "comsats_split.html", "neduet": "neduet.html", "uet_taxila": "uet_taxila.html"}
+# Event pages that are not built by bench_event_parsing.synthetic_page.
+EVENT_BUILDERS = {"comsats_split": comsats_split_page}
+
+def write_fixtures():
+    os.makedirs(FIXTURE_DIR, exist_ok=True)
+    for name, build in PAGES.items():
+        with open(os.path.join(FIXTURE_DIR, f"{name}.html"), "w", encoding="utf-8") as f:
+            f.write(build())
+    os.makedirs(EVENT_FIXTURE_DIR, exist_ok=True)
+    for source, filename in EVENT_PAGES.items():
+        with open(os.path.join(EVENT_FIXTURE_DIR, filename), "w", encoding="utf-8") as f:
+            f.write(EVENT_BUILDERS[source]() if source in EVENT_BUILDERS else event_page(source))
@@ -0,0 +1,204 @@
+import argparse
+import os
+import random
+
+
+# Synthetic merit lists in the same column shapes as the files /predict reads,
+# sized as programs x years x campuses. Campuses only multiply the rows of the
+# sources that have a campus or institute column (COMSATS, NUST).
+PROGRAM_NAMES = [
+    "Computer Science", "Software Engineering", "Artificial Intelligence", "Data Science",
+    "Cyber Security", "Information Technology", "Electrical Engineering", "Mechanical Engineering",
+    "Civil Engineering", "Chemical Engineering", "Computer Engineering", "Mechatronics Engineering",
+    "Electronics Engineering", "Telecommunication Engineering", "Aerospace Engineering", "Environmental Engineering",
+    "Business Administration", "Accounting and Finance", "Economics", "Psychology",
+    "Mathematics", "Physics", "Chemistry", "English", "Media Studies", "Architecture",
+    "Biotechnology", "Bioinformatics", "Pharmacy", "Industrial Engineering"
+]
+CAMPUSES = ["Islamabad", "Lahore", "Abbottabad", "Wah", "Attock", "Sahiwal", "Vehari", "Karachi"]
+INSTITUTES = ["SEECS", "SMME", "SCEE", "SCME", "MCE", "CEME", "PNEC", "CAE"]
+FIRST_YEAR = 2024
+
+# Where each synthetic source goes: file-backed universities get a data file,
+# the ones whose merit data lives in main.INLINE_MERIT_DATA get columns.
+FILE_SOURCES = {
+    "fast": "fast_merit_data.xlsx",
+    "comsats": "comsats_merit_data.csv",
+    "nust": "nust_merit_data.csv",
+    "uni_of_education": "uni_of_education_merit_list.csv",
+    "uet": "uet_merit_list.xlsx"
+}
+INLINE_SOURCES = ("ned", "iiui", "air", "uol")
+
+def program_names(count):
+    names = []
+    for i in range(count):
+        name = PROGRAM_NAMES[i % len(PROGRAM_NAMES)]
+        track = i // len(PROGRAM_NAMES)
+        names.append(f"{name} {track + 1}" if track else name)
+    return names
+
+def cutoff_series(rng, programs, years, missing):
+    # One base cutoff per program with a small yearly drift and noise; a
+    # fraction of the cells is left empty like the real lists.
+    series = {}
+    for program in programs:
+        base = rng.uniform(55, 92)
+        drift = rng.uniform(-0.8, 0.8)
+        values = []
+        for offset in range(years):
+            value = round(base - drift * offset + rng.gauss(0, 0.7), 2)
+            values.append(None if rng.random() < missing else value)
+        series[program] = values
+    return series
+
+def generate(programs=20, years=5, campuses=2, seed=0, missing=0.02):
+    rng = random.Random(seed)
+    names = program_names(programs)
+    year_list = [FIRST_YEAR - offset for offset in range(years)]
+    campus_list = [CAMPUSES[i % len(CAMPUSES)] + (f" {i // len(CAMPUSES) + 1}" if i >= len(CAMPUSES) else "") for i in range(campuses)]
+    institute_list = [INSTITUTES[i % len(INSTITUTES)] + (f"-{i // len(INSTITUTES) + 1}" if i >= len(INSTITUTES) else "") for i in range(campuses)]
+    data = {}
+
+    def rows(prefix=""):
+        series = cutoff_series(rng, names, years, missing)
+        for offset, year in enumerate(year_list):
+            for name in names:
+                yield f"{prefix}{name}", year, series[name][offset]
+
+    fast = list(rows("BS "))
+    data["fast"] = {
+        "Program": [r[0] for r in fast],
+        "Merit Percentage": [r[2] for r in fast],
+        "Year": [float(r[1]) for r in fast]
+    }
+
+    comsats = {"Program": [], "Campus": [], "Year": [], "Closing Merit (%)": []}
+    for campus in campus_list:
+        for program, year, cutoff in rows("BS "):
+            comsats["Program"].append(program)
+            comsats["Campus"].append(campus)
+            comsats["Year"].append(f"Fall {year}")
+            comsats["Closing Merit (%)"].append(cutoff)
+    data["comsats"] = comsats
+
+    nust = {"Program": [], "Institute": [], "Merit No": [], "Merit No. (Closing)": [], "Closing (%)": []}
+    for institute in institute_list:
+        for program, _, cutoff in rows("Bachelors in "):
+            opening = rng.randint(1, 5000)
+            nust["Program"].append(program)
+            nust["Institute"].append(institute)
+            nust["Merit No"].append(opening)
+            nust["Merit No. (Closing)"].append(opening + rng.randint(100, 12000))
+            nust["Closing (%)"].append(cutoff)
+    data["nust"] = nust
+
+    uoe = list(rows())
+    data["uni_of_education"] = {
+        "Discipline": [r[0] for r in uoe],
+        "Year": [r[1] for r in uoe],
+        "Aggregate": [r[2] for r in uoe]
+    }
+
+    uet = list(rows())
+    data["uet"] = {
+        "Sr No,Field,Merit Score,Year": [f"{i + 1},{r[0]},{r[2]},{r[1] + 1}" for i, r in enumerate(uet)],
+        "Field": [r[0] for r in uet],
+        "Merit Score": [r[2] for r in uet],
+        "Year": [r[1] for r in uet]
+    }
+
+    # NED is kept wide, one column per year, and melted at ingest.
+    ned_series = cutoff_series(rng, names, years, missing)
+    data["ned"] = {"Discipline": names}
+    for offset, year in enumerate(year_list):
+        data["ned"][str(year)] = [ned_series[name][offset] for name in names]
+
+    iiui = list(rows("BS "))
+    data["iiui"] = {
+        "Discipline": [r[0] for r in iiui],
+        "Year": [r[1] for r in iiui],
+        "Aggregate": [r[2] for r in iiui]
+    }
+    for uni_id in ("air", "uol"):
+        source = list(rows())
+        data[uni_id] = {
+            "Program": [r[0] for r in source],
+            "Year": [r[1] for r in source],
+            "Merit Score": [r[2] for r in source]
+        }
+    return data
+
+def write_files(data, out_dir):
+    import pandas as pd
+    os.makedirs(out_dir, exist_ok=True)
+    paths = {}
+    for uni_id, filename in FILE_SOURCES.items():
+        path = os.path.join(out_dir, filename)
+        df = pd.DataFrame(data[uni_id])
+        if filename.endswith(".xlsx"):
+            df.to_excel(path, index=False)
+        else:
+            df.to_csv(path, index=False)
+        paths[uni_id] = path
+    return paths
+
+# Share of each kind of applicant in the request mix, roughly what the app
+# sees: most send NTS/NET marks, some add an entry-test score, a few are
+# O/A-level or graduate applicants.
+REQUEST_MIX = [
+    ("nts_net", 0.60),
+    ("ecat", 0.15),
+    ("ned_test", 0.10),
+    ("sat", 0.04),
+    ("o_a_level", 0.06),
+    ("graduate", 0.05)
+]
+UNKNOWN_PROGRAMS = ["Zoology", "Fine Arts", "Aviation Management"]
+
+def make_request(rng, kind, programs):
+    if rng.random() < 0.05:
+        program = rng.choice(UNKNOWN_PROGRAMS)
+    else:
+        # Popular programs are asked about far more often than the long tail.
+        program = programs[min(int(rng.paretovariate(1.2)) - 1, len(programs) - 1)]
+    body = {
+        "matric_marks": rng.randint(700, 1090),
+        "fsc_marks": rng.randint(650, 1080),
+        "nts_marks": rng.randint(40, 95),
+        "net_marks": rng.randint(80, 190),
+        "program": program
+    }
+    if kind == "ecat":
+        body["ecat_marks"] = rng.randint(100, 390)
+    elif kind == "ned_test":
+        body["ned_test_marks"] = rng.randint(30, 95)
+    elif kind == "sat":
+        body["sat_marks"] = rng.randint(900, 1580)
+    elif kind == "o_a_level":
+        body["is_o_a_level"] = True
+    elif kind == "graduate":
+        body["bachelors_cgpa"] = round(rng.uniform(2.0, 4.0), 2)
+    return body
+
+def make_requests(count, programs, seed):
+    rng = random.Random(seed)
+    kinds = [kind for kind, _ in REQUEST_MIX]
+    weights = [weight for _, weight in REQUEST_MIX]
+    return [make_request(rng, rng.choices(kinds, weights)[0], programs) for _ in range(count)]
+
+def row_counts(data):
+    return {uni_id: len(next(iter(columns.values()))) for uni_id, columns in data.items()}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Write synthetic merit data files in the shapes /predict reads.")
+    parser.add_argument("--out", required=True, help="directory to write the data files into")
+    parser.add_argument("--programs", type=int, default=20)
+    parser.add_argument("--years", type=int, default=5)
+    parser.add_argument("--campuses", type=int, default=2)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    data = generate(args.programs, args.years, args.campuses, args.seed)
+    for uni_id, path in write_files(data, args.out).items():
+        print(f"{uni_id:<18}{row_counts(data)[uni_id]:>8} rows  {path}")
@@ -0,0 +1,127 @@
+import datetime
+import functools
+import hashlib
+import json
+import os
+import time
+from flask import Response, make_response, request
+from db import get_connection
+from metrics import record_cache
+
+
+# Store-backed routes (events, feeds, fee history) check the client's
+# validators against the stored version before loading anything, and answer
+# 304 without building or serializing the body.
+#
+# Scraped fee and scholarship routes fetch upstream on every request and
+# stamp the body with the fetch time, so their ETags are weak and cover the
+# content only. A client revalidating within SCHOLAR_REVALIDATE_SECONDS of
+# the last live fetch of the same page, by any worker, gets a 304 without a
+# fetch; after that the page is fetched again, and a 304 is still sent if
+# nothing changed. The last fetch of each page is kept in SQLite, one row per
+# cache key.
+REVALIDATE_SECONDS = float(os.environ.get("SCHOLAR_REVALIDATE_SECONDS", 300))
+# Caches may keep a copy but must revalidate it before every use.
+CACHE_CONTROL = "no-cache"
+VOLATILE_FIELDS = ("last_updated", "note")
+
+_schema_pids = set()
+
+
+def make_etag(*parts):
+    return hashlib.sha1("|".join(str(part) for part in parts).encode("utf-8")).hexdigest()
+
+def timestamp(value):
+    # Records carry either a POSIX time or an ISO string in local time.
+    if value is None or isinstance(value, (int, float)):
+        return value
+    try:
+        return datetime.datetime.fromisoformat(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+def is_conditional():
+    return bool(request.if_none_match) or request.if_modified_since is not None
+
+def matches(etag, last_modified=None):
+    # If-None-Match takes precedence; If-Modified-Since is only looked at
+    # when the client sent no entity tags.
+    if request.if_none_match:
+        return request.if_none_match.contains_weak(etag)
+    last_modified = timestamp(last_modified)
+    if request.if_modified_since is not None and last_modified is not None:
+        return int(last_modified) <= request.if_modified_since.timestamp()
+    return False
+
+def with_validators(response, etag, last_modified=None, weak=False):
+    response.set_etag(etag, weak=weak)
+    last_modified = timestamp(last_modified)
+    if last_modified is not None:
+        response.last_modified = int(last_modified)
+    if "Cache-Control" not in response.headers:
+        response.headers["Cache-Control"] = CACHE_CONTROL
+    return response
+
+def not_modified(etag, last_modified=None, weak=False):
+    if request.method not in ("GET", "HEAD") or not matches(etag, last_modified):
+        return None
+    return with_validators(Response(status=304), etag, last_modified, weak)
+
+
+def _ensure_schema(conn):
+    if os.getpid() in _schema_pids:
+        return
+    with conn:
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS scrape_validators ("
+            "cache_key TEXT PRIMARY KEY, etag TEXT NOT NULL, last_modified REAL, fetched_at REAL NOT NULL)"
+        )
+    _schema_pids.add(os.getpid())
+
+def _last_fetch(cache_key):
+    conn = get_connection()
+    _ensure_schema(conn)
+    return conn.execute("SELECT etag, last_modified, fetched_at FROM scrape_validators WHERE cache_key = ?", (cache_key,)).fetchone()
+
+def _record_fetch(cache_key, etag, last_modified):
+    conn = get_connection()
+    _ensure_schema(conn)
+    with conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO scrape_validators (cache_key, etag, last_modified, fetched_at) VALUES (?, ?, ?, ?)",
+            (cache_key, etag, timestamp(last_modified), time.time())
+        )
+
+def content_etag(cache_key, payload):
+    if isinstance(payload, dict):
+        payload = {k: v for k, v in payload.items() if k not in VOLATILE_FIELDS}
+    return make_etag(cache_key, json.dumps(payload, sort_keys=True))
+
+def conditional_scrape(cache_key):
+    def decorate(view):
+        @functools.wraps(view)
+        def wrapper(*args, **kwargs):
+            if is_conditional():
+                known = _last_fetch(cache_key)
+                if known is not None and time.time() - known["fetched_at"] < REVALIDATE_SECONDS:
+                    response = not_modified(known["etag"], known["last_modified"], weak=True)
+                    if response is not None:
+                        record_cache(cache_key, "hit")
+                        return response
+            response = make_response(view(*args, **kwargs))
+            if response.status_code != 200:
+                return response
+            payload = response.get_json(silent=True)
+            if payload is None:
+                return response
+            etag = content_etag(cache_key, payload)
+            last_modified = None
+            # A cached copy served because the fetch failed carries a note and
+            # the time of an older fetch, so only a live fetch sets
+            # Last-Modified and opens the window.
+            if not (isinstance(payload, dict) and payload.get("note")):
+                last_modified = payload.get("last_updated") if isinstance(payload, dict) else None
+                _record_fetch(cache_key, etag, last_modified)
+            return not_modified(etag, last_modified, weak=True) or with_validators(response, etag, last_modified, weak=True)
+        return wrapper
+    return decorate
@@ -0,0 +1,90 @@
+import calendar
+import datetime
+import re
+
+
+MONTHS = {
+    "jan": 1, "january": 1, "feb": 2, "february": 2, "mar": 3, "march": 3,
+    "apr": 4, "april": 4, "may": 5, "jun": 6, "june": 6, "jul": 7, "july": 7,
+    "aug": 8, "august": 8, "sep": 9, "sept": 9, "september": 9, "oct": 10, "october": 10,
+    "nov": 11, "november": 11, "dec": 12, "december": 12
+}
+
+_MONTH = r"(?P<month>[A-Za-z]{3,9})\.?"
+_DAY = r"(?P<day>\d{1,2})(?:st|nd|rd|th)?"
+_YEAR = r"(?P<year>(?:19|20)\d{2})"
+
+# Ordered so that ranges win over the single dates they contain; each pattern
+# resolves to the last day it mentions, which is what a deadline means.
+DATE_PATTERNS = [
+    re.compile(r"\b(?P<month>[A-Za-z]{3,9})\.?\s+(?P<start_day>\d{1,2})(?:st|nd|rd|th)?\s*[-–]\s*" + _DAY + r",?\s+" + _YEAR + r"\b"),
+    re.compile(r"\b(?P<start_day>\d{1,2})(?:st|nd|rd|th)?\s*[-–]\s*" + _DAY + r"\s+(?:of\s+)?" + _MONTH + r",?\s+" + _YEAR + r"\b"),
+    re.compile(r"\b" + _DAY + r"\s+(?:of\s+)?" + _MONTH + r",?\s+" + _YEAR + r"\b"),
+    re.compile(r"\b" + _MONTH + r"\s+" + _DAY + r",?\s+" + _YEAR + r"\b"),
+    re.compile(r"\b" + _YEAR + r"-(?P<month_num>\d{1,2})-(?P<day>\d{1,2})\b"),
+    re.compile(r"\b" + r"(?P<day>\d{1,2})[/.](?P<month_num>\d{1,2})[/.]" + _YEAR + r"\b"),
+    re.compile(r"\b" + _MONTH + r",?\s+" + _YEAR + r"\b"),
+]
+
+def _to_date(match):
+    groups = match.groupdict()
+    year = int(groups["year"])
+    if groups.get("month_num"):
+        month = int(groups["month_num"])
+    else:
+        month = MONTHS.get(groups["month"].lower())
+        if not month:
+            return None
+    if groups.get("day"):
+        day = int(groups["day"])
+    else:
+        day = calendar.monthrange(year, month)[1] if 1 <= month <= 12 else 0
+    try:
+        return datetime.date(year, month, day)
+    except ValueError:
+        return None
+
+def _scan(text):
+    if not text:
+        return []
+    text = str(text)
+    found = []
+    taken = []
+    for pattern in DATE_PATTERNS:
+        for match in pattern.finditer(text):
+            start, end = match.span()
+            if any(start < t_end and end > t_start for t_start, t_end in taken):
+                continue
+            # Only a valid date claims its span; "31 February 2026" must not
+            # hide a later pattern's match such as "February 2026".
+            value = _to_date(match)
+            if value:
+                taken.append((start, end))
+                found.append((start, end, value, match))
+    found.sort(key=lambda item: item[:2])
+    return found
+
+def extract_dates(text):
+    return [(start, end, value) for start, end, value, _ in _scan(text)]
+
+def parse_date(text):
+    dates = extract_dates(text)
+    return dates[-1][2] if dates else None
+
+def parse_date_span(text):
+    # First date mentioned in ``text`` as a (start, end) pair, so that
+    # "5-7 March 2026" keeps both days and "March 2026" covers the month.
+    found = _scan(text)
+    if not found:
+        return None, None
+    _, _, end, match = found[0]
+    start = end
+    start_day = match.groupdict().get("start_day")
+    if not match.groupdict().get("day"):
+        start = end.replace(day=1)
+    elif start_day:
+        try:
+            start = end.replace(day=int(start_day))
+        except ValueError:
+            pass
+    return (start, end) if start <= end else (end, end)
@@ -0,0 +1,24 @@
+import os
+import sqlite3
+import threading
+
+
+DB_PATH = os.environ.get(
+    "SCHOLAR_DB_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "scholar_app.db")
+)
+
+_local = threading.local()
+
+def get_connection():
+    # One connection per thread, reopened after a fork so gunicorn workers
+    # never share a handle inherited from the master.
+    conn = getattr(_local, "conn", None)
+    if conn is None or getattr(_local, "pid", None) != os.getpid():
+        conn = sqlite3.connect(DB_PATH, timeout=30)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        _local.conn = conn
+        _local.pid = os.getpid()
+    return conn
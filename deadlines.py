@@ -0,0 +1,151 @@
+import datetime
+import os
+import re
+from flask import Blueprint, request, jsonify
+from db import get_connection
+from date_parsing import extract_dates
+
+
+deadlines_bp = Blueprint('deadlines', __name__)
+
+DATE_LIST_FIELDS = ["key_dates", "important_dates"]
+FACT_FIELDS = ["facts", "quick_facts"]
+# Whole words only, so "procedure" or "enclosed" do not mark a deadline.
+DEADLINE_WORDS = re.compile(
+    r"\b(?:deadlines?|last date|closing|close[sd]?|due|apply by|submissions?|application period)\b",
+    re.IGNORECASE
+)
+WITHIN_PATTERN = re.compile(r"^\s*(\d+)\s*([dw]?)\s*$", re.IGNORECASE)
+MAX_WITHIN_DAYS = 365
+
+_schema_pids = set()
+
+def _ensure_schema(conn):
+    if os.getpid() in _schema_pids:
+        return
+    with conn:
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS scholarship_deadlines ("
+            "cache_key TEXT NOT NULL, scholarship TEXT, label TEXT, text TEXT, "
+            "deadline TEXT NOT NULL, is_deadline INTEGER NOT NULL)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_deadlines_date ON scholarship_deadlines (is_deadline, deadline)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_deadlines_key ON scholarship_deadlines (cache_key)")
+    _schema_pids.add(os.getpid())
+
+
+def _is_deadline(label):
+    return DEADLINE_WORDS.search(label) is not None
+
+def _dated_line(label, text):
+    dates = extract_dates(text)
+    if not dates:
+        return None
+    if not label:
+        label = text[:dates[0][0]].strip(" :-–|")
+    # A line such as "Applications open Jan 1 and close Feb 28" closes on its last date.
+    return {
+        "label": label,
+        "text": text,
+        "deadline": dates[-1][2].isoformat(),
+        "is_deadline": _is_deadline(label) or _is_deadline(text)
+    }
+
+def extract_deadlines(data):
+    found = []
+    for field in DATE_LIST_FIELDS:
+        for line in data.get(field) or []:
+            item = _dated_line("", str(line))
+            if item:
+                found.append(item)
+    for field in FACT_FIELDS:
+        facts = data.get(field) or {}
+        for key, value in facts.items():
+            item = _dated_line(str(key), str(value))
+            if item:
+                item["is_deadline"] = _is_deadline(str(key)) or item["is_deadline"]
+                found.append(item)
+    return found
+
+
+def index_deadlines(cache_key, entry):
+    if entry is not None and (not isinstance(entry, dict) or "scholarship" not in entry):
+        return False
+    data = (entry["scholarship"] if entry else None) or {}
+    title = data.get("title") or cache_key
+    items = extract_deadlines(data)
+    conn = get_connection()
+    _ensure_schema(conn)
+    with conn:
+        conn.execute("DELETE FROM scholarship_deadlines WHERE cache_key = ?", (cache_key,))
+        conn.executemany(
+            "INSERT INTO scholarship_deadlines (cache_key, scholarship, label, text, deadline, is_deadline) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            [(cache_key, title, item["label"], item["text"], item["deadline"], int(item["is_deadline"])) for item in items]
+        )
+    return True
+
+def index_cached_deadlines(cached):
+    for cache_key, entry in cached.items():
+        try:
+            index_deadlines(cache_key, entry)
+        except Exception as e:
+            print(f"Error indexing deadlines for {cache_key}: {e}")
+
+def deadlines_between(start, end, include_all=False):
+    conn = get_connection()
+    _ensure_schema(conn)
+    kinds = (0, 1) if include_all else (1,)
+    rows = []
+    for kind in kinds:
+        rows.extend(conn.execute(
+            "SELECT cache_key, scholarship, label, text, deadline, is_deadline FROM scholarship_deadlines "
+            "WHERE is_deadline = ? AND deadline BETWEEN ? AND ? ORDER BY deadline",
+            (kind, start.isoformat(), end.isoformat())
+        ).fetchall())
+    if include_all:
+        rows.sort(key=lambda row: row["deadline"])
+    return [{
+        "source": row["cache_key"],
+        "scholarship": row["scholarship"],
+        "label": row["label"],
+        "text": row["text"],
+        "deadline": row["deadline"],
+        "is_deadline": bool(row["is_deadline"]),
+        "days_left": (datetime.date.fromisoformat(row["deadline"]) - start).days
+    } for row in rows]
+
+def parse_within(value):
+    match = WITHIN_PATTERN.match(value or "")
+    if not match:
+        return None
+    days = int(match.group(1)) * (7 if match.group(2).lower() == "w" else 1)
+    return min(days, MAX_WITHIN_DAYS)
+
+
+@deadlines_bp.route('/scholarships/deadlines', methods=['GET'])
+def scholarship_deadlines():
+    within = parse_within(request.args.get('within', '30d'))
+    if within is None:
+        return jsonify({
+            "status": "error",
+            "message": "Invalid 'within' value, expected e.g. 30d or 4w"
+        }), 400
+    include_all = request.args.get('all', '').lower() in ['1', 'true', 'yes']
+    today = datetime.date.today()
+    end = today + datetime.timedelta(days=within)
+    try:
+        deadlines = deadlines_between(today, end, include_all)
+    except Exception as e:
+        return jsonify({
+            "status": "error",
+            "message": str(e)
+        }), 500
+    return jsonify({
+        "status": "success",
+        "from": today.isoformat(),
+        "to": end.isoformat(),
+        "within_days": within,
+        "count": len(deadlines),
+        "deadlines": deadlines
+    })
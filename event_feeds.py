@@ -0,0 +1,186 @@
+import datetime
+import hashlib
+import json
+import threading
+import time
+from flask import Blueprint, request, jsonify
+from events import build_events_index, event_id, load_all_events
+from events_store import EVENT_SOURCES, store_versions, load_events, schedule_refresh
+from metrics import record_cache
+from response_encoding import EncodedBody, encoded_response
+from conditional import not_modified, with_validators
+
+
+event_feeds_bp = Blueprint('event_feeds', __name__)
+
+FEED_MAX_AGE = 300
+ICS_PRODID = '-//Scholar App//University Events//EN'
+
+_feeds = {}
+_feeds_lock = threading.Lock()
+
+def _ics_escape(value):
+    return str(value).replace('\\', '\\\\').replace(';', '\\;').replace(',', '\\,').replace('\r\n', '\\n').replace('\n', '\\n')
+
+def _ics_fold(line):
+    # RFC 5545 caps content lines at 75 octets; longer lines continue on the
+    # next line after a single leading space.
+    encoded = line.encode('utf-8')
+    if len(encoded) <= 75:
+        return line
+    parts = []
+    while encoded:
+        size = 75 if not parts else 74
+        cut = min(size, len(encoded))
+        while cut < len(encoded) and (encoded[cut] & 0xC0) == 0x80:
+            cut -= 1
+        parts.append(encoded[:cut].decode('utf-8'))
+        encoded = encoded[cut:]
+    return '\r\n '.join(parts)
+
+def _ics_stamp(records):
+    fetched = [r['last_updated'] for r in records.values() if r['last_updated']]
+    stamp = datetime.datetime.fromisoformat(max(fetched)) if fetched else datetime.datetime.now()
+    return stamp.astimezone(datetime.timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+
+def render_ics(events, records):
+    stamp = _ics_stamp(records)
+    lines = [
+        'BEGIN:VCALENDAR',
+        'VERSION:2.0',
+        f'PRODID:{ICS_PRODID}',
+        'CALSCALE:GREGORIAN',
+        'METHOD:PUBLISH',
+        'X-WR-CALNAME:University Events'
+    ]
+    for event in events:
+        if not event['start_date']:
+            continue
+        start = datetime.date.fromisoformat(event['start_date'])
+        end = datetime.date.fromisoformat(event['end_date']) + datetime.timedelta(days=1)
+        lines.extend([
+            'BEGIN:VEVENT',
+            f"UID:{event.get('id') or event_id(event)}@{event['source']}.scholar-app",
+            f'DTSTAMP:{stamp}',
+            f"DTSTART;VALUE=DATE:{start.strftime('%Y%m%d')}",
+            f"DTEND;VALUE=DATE:{end.strftime('%Y%m%d')}",
+            f"SUMMARY:{_ics_escape(event.get('title') or 'Untitled event')}",
+            f"DESCRIPTION:{_ics_escape(event.get('date') or '')}",
+            f"CATEGORIES:{_ics_escape(event['source'])}",
+            'END:VEVENT'
+        ])
+    lines.append('END:VCALENDAR')
+    return '\r\n'.join(_ics_fold(line) for line in lines) + '\r\n'
+
+def render_json_feed(events, url_root):
+    items = []
+    for event in events:
+        title = event.get('title') or 'Untitled event'
+        items.append({
+            'id': f"{event['source']}:{event.get('id') or event_id(event)}",
+            'title': title,
+            'content_text': f"{title} ({event['date']})" if event.get('date') else title,
+            'tags': [event['source']],
+            '_event': {
+                'source': event['source'],
+                'date': event.get('date'),
+                'start_date': event['start_date'],
+                'end_date': event['end_date']
+            }
+        })
+    return json.dumps({
+        'version': 'https://jsonfeed.org/version/1.1',
+        'title': 'University Events',
+        'home_page_url': url_root,
+        'feed_url': url_root.rstrip('/') + '/api/events.json',
+        'items': items
+    })
+
+RENDERERS = {
+    'ics': ('text/calendar; charset=utf-8', lambda events, records, url_root: render_ics(events, records)),
+    'json': ('application/feed+json; charset=utf-8', lambda events, records, url_root: render_json_feed(events, url_root))
+}
+
+
+def _feed_state():
+    # Reads only source versions; stale or empty sources are refreshed in the
+    # background so polling a feed never waits on a scrape.
+    versions = store_versions()
+    now = time.time()
+    for source in EVENT_SOURCES:
+        state = versions.get(source)
+        if state is None or not state['filled'] or state['expires_at'] <= now:
+            schedule_refresh(source)
+    filled = {s: v for s, v in versions.items() if s in EVENT_SOURCES and v['filled']}
+    key = tuple(sorted((s, v['version']) for s, v in filled.items()))
+    return key, max((v['fetched_at'] for v in filled.values()), default=None)
+
+def _etag(fmt, key, url_root):
+    return hashlib.sha1(f'{fmt}|{url_root}|{key}'.encode('utf-8')).hexdigest()
+
+def _build_feed(fmt, key, url_root):
+    with _feeds_lock:
+        cached = _feeds.get((fmt, url_root))
+        if cached and cached['key'] == key:
+            record_cache(f'feed:{fmt}', 'hit')
+            return cached
+        record_cache(f'feed:{fmt}', 'miss')
+        records = {}
+        for source, _ in key:
+            record = load_events(source)
+            if record is not None and record['events'] is not None:
+                records[source] = record
+        # A refresh may land between reading versions and loading events, so
+        # the feed is keyed on what was actually loaded.
+        key = tuple(sorted((source, record['version']) for source, record in records.items()))
+        index = build_events_index(records)
+        body = RENDERERS[fmt][1](index['dated'] + index['undated'], records, url_root)
+        feed = {
+            'key': key,
+            'body': EncodedBody(body.encode('utf-8')),
+            'etag': _etag(fmt, key, url_root)
+        }
+        _feeds[(fmt, url_root)] = feed
+        return feed
+
+def feed_response(fmt):
+    try:
+        key, last_modified = _feed_state()
+        if not key:
+            # Nothing stored yet: wait for the first fill like /api/events.
+            load_all_events(list(EVENT_SOURCES))
+            key, last_modified = _feed_state()
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+    if not key:
+        return jsonify({
+            'success': False,
+            'error': 'Events are being refreshed, try again shortly'
+        }), 503
+    url_root = request.url_root
+    etag = _etag(fmt, key, url_root)
+    response = not_modified(etag, last_modified)
+    if response is None:
+        try:
+            feed = _build_feed(fmt, key, url_root)
+        except Exception as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 500
+        response = encoded_response(feed['body'], RENDERERS[fmt][0])
+        etag = feed['etag']
+    response.headers['Cache-Control'] = f'public, max-age={FEED_MAX_AGE}'
+    return with_validators(response, etag, last_modified)
+
+
+@event_feeds_bp.route('/api/events.ics', methods=['GET'])
+def events_ics():
+    return feed_response('ics')
+
+@event_feeds_bp.route('/api/events.json', methods=['GET'])
+def events_json_feed():
+    return feed_response('json')
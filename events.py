@@ -1,136 +1,376 @@
 
-from flask import Blueprint, jsonify
-import requests
-from bs4 import BeautifulSoup
+from flask import Blueprint, request, jsonify
+import bisect
+import datetime
+import hashlib
+import heapq
+import importlib.util
+import os
 import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from polite_fetch import polite_get
+from lazy_imports import lazy_attr
+from timing import timed
+from date_parsing import parse_date_span
+from events_store import EVENT_SOURCES, register_event_source, get_events, load_events
+from response_encoding import cached_json_response
+from conditional import is_conditional, make_etag, not_modified, with_validators
 
 
 events_bp = Blueprint('events', __name__)
 
+BeautifulSoup = lazy_attr('bs4', 'BeautifulSoup')
+SoupStrainer = lazy_attr('bs4', 'SoupStrainer')
+
+COMSATS_EVENTS_URL = 'https://ww2.comsats.edu.pk/alumni/allevents.aspx'
+NEDUET_EVENTS_URL = 'https://www.neduet.edu.pk/content/events?page={page}'
+UET_TAXILA_EVENTS_URL = 'https://www.uettaxila.edu.pk/Events/All'
+NEDUET_FIRST_PAGE = 0
+NEDUET_MAX_PAGES = int(os.environ.get('NEDUET_EVENT_PAGES', 10))
+NEDUET_CRAWL_WORKERS = 4
+MAX_STORED_EVENTS = 500
+# lxml builds trees several times faster than html.parser when it is installed.
+EVENT_PARSER = 'lxml' if importlib.util.find_spec('lxml') else 'html.parser'
+COMSATS_DATE_MARKER = 'Event Date:'
+# The marker in raw HTML, allowing tags between its words (<b>Event Date</b>:).
+COMSATS_MARKER_PATTERN = re.compile(r'Event(?:\s|<[^>]*>)*Date(?:\s|<[^>]*>)*:')
+ANCHOR_OPEN_PATTERN = re.compile(r'<a[\s>]', re.I)
+NEDUET_DATE_PATTERN = re.compile(
+    r'(\b\d{1,2}(?:st|nd|rd|th)?\s+\w+,\s*\d{4}\b|\b\w+\s+\d{1,2}\s*-\s*\d{1,2},?\s*\d{4}\b|\b\d{1,2}\s*-\s*\d{1,2}\s*\w+\s*\d{4}\b)'
+)
+NEDUET_CONTENT_PATTERN = re.compile(r'<div\b[^>]*\bclass\s*=\s*["\'][^"\']*\bcontent\b', re.I)
+NEDUET_SKIP_WORDS = ("breadcrumb", "home", "events", "pagination", "quick", "links")
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+@timed("parse")
+def parse_comsats_events(html):
+    markers = [match.start() for match in COMSATS_MARKER_PATTERN.finditer(html)]
+    if not markers:
+        return []
+    # Only the stretch from the first event link to the end of the last one
+    # is handed to the parser; the rest of the page is navigation chrome.
+    start = 0
+    for match in ANCHOR_OPEN_PATTERN.finditer(html, 0, markers[0]):
+        start = match.start()
+    end = html.lower().find('</a>', markers[-1])
+    html = html[start:len(html) if end == -1 else end + 4]
+    soup = BeautifulSoup(html, EVENT_PARSER, parse_only=SoupStrainer('a'))
+    events = []
+    for a in soup.find_all('a'):
+        # The marker is matched against the anchor's joined text, since it can
+        # be split across child tags, e.g. <b>Event Date</b>: or Event <b>Date:</b>
+        text = ' '.join(a.get_text().split())
+        if COMSATS_DATE_MARKER in text:
+            parts = text.split(COMSATS_DATE_MARKER)
+            title = parts[0].strip()
+            date = parts[1].strip() if len(parts) > 1 else None
+            events.append({'title': title, 'date': date})
+    return events
+
 def fetch_events(url):
-    try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        resp = requests.get(url, headers=headers, timeout=10)
-        resp.raise_for_status()
-        soup = BeautifulSoup(resp.text, 'html.parser')
-        events = []
-        for a in soup.find_all('a'):
-            text = a.get_text(strip=True)
-            if 'Event Date:' in text:
-                parts = text.split('Event Date:')
-                title = parts[0].strip()
-                date = parts[1].strip() if len(parts) > 1 else None
-                events.append({'title': title, 'date': date})
-        return events
-    except Exception as e:
-        print(f"Error fetching events from {url}: {e}")
-        return [{'title': f'Error: {str(e)}', 'date': None}]
+    resp = polite_get(url, headers=HEADERS, timeout=10)
+    resp.raise_for_status()
+    return parse_comsats_events(resp.text)
+
+@timed("parse")
+def parse_neduet_events(html):
+    match = NEDUET_CONTENT_PATTERN.search(html)
+    soup = BeautifulSoup(html[match.start():] if match else html, EVENT_PARSER, parse_only=SoupStrainer('div', class_='content'))
+    content = soup.find('div', class_='content')
+    if not content:
+        content = BeautifulSoup(html, EVENT_PARSER)
+    text_lines = [t.strip() for t in content.stripped_strings]
+    events = []
+    for i, line in enumerate(text_lines[:-1]):
+        if NEDUET_DATE_PATTERN.search(line):
+            title = text_lines[i + 1]
+            if not any(word in title.lower() for word in NEDUET_SKIP_WORDS):
+                events.append({'date': line, 'title': title})
+    return events
 
 def fetch_neduet_events(page=3):
+    url = NEDUET_EVENTS_URL.format(page=page)
+    resp = polite_get(url, headers=HEADERS, timeout=10)
+    resp.raise_for_status()
+    return parse_neduet_events(resp.text)
+
+def event_id(event):
+    key = f"{(event.get('title') or '').strip().lower()}|{(event.get('date') or '').strip().lower()}"
+    return hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]
+
+def crawl_neduet_events(first_page=NEDUET_FIRST_PAGE, max_pages=NEDUET_MAX_PAGES, workers=NEDUET_CRAWL_WORKERS, known_ids=None):
+    # Pages are fetched a batch at a time but consumed in page order, so the
+    # crawl can stop at the first page that holds nothing new.
+    known_ids = set(known_ids or [])
+    seen = set()
+    events = []
+    pages = list(range(first_page, first_page + max_pages))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for start in range(0, len(pages), workers):
+            batch = pages[start:start + workers]
+            results = list(executor.map(_fetch_neduet_page, batch))
+            for page, (page_events, error) in zip(batch, results):
+                if error:
+                    if page == first_page:
+                        raise error
+                    print(f"Error fetching NEDUET events page {page}: {error}")
+                    return events
+                fresh = []
+                for event in page_events:
+                    event['id'] = event_id(event)
+                    if event['id'] not in seen:
+                        seen.add(event['id'])
+                        fresh.append(event)
+                events.extend(fresh)
+                if not page_events or all(event['id'] in known_ids for event in fresh):
+                    return events
+    return events
+
+def _fetch_neduet_page(page):
     try:
-        url = f'https://www.neduet.edu.pk/content/events?page={page}'
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        resp = requests.get(url, headers=headers, timeout=10)
-        resp.raise_for_status()
-        soup = BeautifulSoup(resp.text, 'html.parser')
-        content = soup.find('div', {'class': 'content'})
-        if not content:
-            content = soup
-        text_lines = [t.strip() for t in content.stripped_strings]
-        events = []
-        date_pattern = re.compile(
-            r'(\b\d{1,2}(?:st|nd|rd|th)?\s+\w+,\s*\d{4}\b|\b\w+\s+\d{1,2}\s*-\s*\d{1,2},?\s*\d{4}\b|\b\d{1,2}\s*-\s*\d{1,2}\s*\w+\s*\d{4}\b)'
-        )
-        for i, line in enumerate(text_lines):
-            if date_pattern.search(line):
-                if i + 1 < len(text_lines):
-                    title = text_lines[i + 1]
-                    date = line
-                    if not any(word in title.lower() for word in ["breadcrumb", "home", "events", "pagination", "quick", "links"]):
-                        events.append({'date': date, 'title': title})
-        return events
+        return fetch_neduet_events(page), None
     except Exception as e:
-        print(f"Error fetching NEDUET events: {e}")
-        return [{'title': f'Error: {str(e)}', 'date': None}]
+        return [], e
+
+def refresh_neduet_events():
+    record = load_events('neduet')
+    stored = (record or {}).get('events') or []
+    stored_ids = [event.get('id') or event_id(event) for event in stored]
+    crawled = crawl_neduet_events(known_ids=stored_ids)
+    crawled_ids = {event['id'] for event in crawled}
+    merged = crawled + [dict(event, id=eid) for event, eid in zip(stored, stored_ids) if eid not in crawled_ids]
+    return merged[:MAX_STORED_EVENTS]
+
+@timed("parse")
+def parse_uet_taxila_events(html):
+    start = html.find('<table')
+    soup = BeautifulSoup(html[start:] if start != -1 else html, EVENT_PARSER, parse_only=SoupStrainer('table'))
+    table = soup.find('table')
+    if not table:
+        raise ValueError('No events table found')
+
+    events = []
+    rows = table.find_all('tr')
+    for row in rows[1:]:  # Skip header row
+        cols = row.find_all('td')
+        if len(cols) >= 2:
+            title = cols[0].get_text(strip=True)
+            date = cols[1].get_text(strip=True)
+            events.append({'title': title, 'date': date})
+    return events
 
 def fetch_uet_taxila_events():
-    try:
-        url = 'https://www.uettaxila.edu.pk/Events/All'
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        resp = requests.get(url, headers=headers, timeout=10)
-        resp.raise_for_status()
-        soup = BeautifulSoup(resp.text, 'html.parser')
-        events = []
-
-        table = soup.find('table')
-        if not table:
-            return [{'title': 'No events table found', 'date': None}]
-
-        rows = table.find_all('tr')
-        for row in rows[1:]:  # Skip header row
-            cols = row.find_all('td')
-            if len(cols) >= 2:
-                title = cols[0].get_text(strip=True)
-                date = cols[1].get_text(strip=True)
-                events.append({'title': title, 'date': date})
-        return events if events else [{'title': 'No events found', 'date': None}]
-    except Exception as e:
-        print(f"Error fetching UET Taxila events: {e}")
-        return [{'title': f'Error: {str(e)}', 'date': None}]
+    resp = polite_get(UET_TAXILA_EVENTS_URL, headers=HEADERS, timeout=10)
+    resp.raise_for_status()
+    return parse_uet_taxila_events(resp.text)
 
-# Event routes with better error handling
-@events_bp.route('/api/comsats_events', methods=['GET'])
-def comsats_events():
+
+register_event_source('comsats', lambda: fetch_events(COMSATS_EVENTS_URL), ttl=6 * 3600)
+register_event_source('neduet', refresh_neduet_events, ttl=3 * 3600)
+register_event_source('uet_taxila', fetch_uet_taxila_events, ttl=6 * 3600)
+
+
+def record_etag(record):
+    # Covers everything a per-source response is built from.
+    return make_etag('events', record['source'], record['hash'], record['fetched_at'], record['stale'], record['last_error'])
+
+def events_response(source):
     try:
-        url = 'https://ww2.comsats.edu.pk/alumni/allevents.aspx'
-        events = fetch_events(url)
-        return jsonify({
-            'success': True,
-            'events': events,
-            'count': len(events)
-        })
+        state = get_events(source, state_only=True) if is_conditional() else None
+        if state is None:
+            record = get_events(source)
+        else:
+            response = not_modified(record_etag(state), state['fetched_at'])
+            if response is not None:
+                return response
+            record = load_events(source)
     except Exception as e:
         return jsonify({
             'success': False,
             'error': str(e),
             'events': []
         }), 500
+    if record is None or record['events'] is None:
+        return jsonify({
+            'success': False,
+            'error': (record or {}).get('last_error') or 'Events are being refreshed, try again shortly',
+            'events': []
+        }), 503
+    def build():
+        response = {
+            'success': True,
+            'events': record['events'],
+            'count': len(record['events']),
+            'last_updated': record['last_updated']
+        }
+        if record['last_error']:
+            response['note'] = 'Data loaded from cache due to fetch failure'
+        elif record['stale']:
+            response['note'] = 'Cached data is being refreshed in the background'
+        return response
+    etag = record_etag(record)
+    return with_validators(cached_json_response(('events', source), etag, build), etag, record['fetched_at'])
 
-@events_bp.route('/api/neduet_events', methods=['GET'])
-def neduet_events():
+
+_source_entries = {}
+_events_indexes = {}
+_index_lock = threading.Lock()
+
+def normalize_event(source, event):
+    start, end = parse_date_span(event.get('date'))
+    return dict(
+        event,
+        source=source,
+        start_date=start.isoformat() if start else None,
+        end_date=end.isoformat() if end else None
+    )
+
+def _sorted_entries(source, record):
+    # Normalized, date-sorted events per source, rebuilt only when the store
+    # version of that source changes.
+    cached = _source_entries.get(source)
+    if cached and cached[0] == record['version']:
+        return cached[1]
+    entries = [normalize_event(source, event) for event in record['events']]
+    entries.sort(key=lambda e: (e['start_date'] is None, e['start_date'] or '', e.get('title') or ''))
+    _source_entries[source] = (record['version'], entries)
+    return entries
+
+def build_events_index(records):
+    sources = tuple(sorted(records))
+    key = tuple(records[source]['version'] for source in sources)
+    with _index_lock:
+        index = _events_indexes.get(sources)
+        if index and index['key'] == key:
+            return index
+        per_source = [_sorted_entries(source, records[source]) for source in sources]
+        dated = list(heapq.merge(*[[e for e in entries if e['start_date']] for entries in per_source], key=lambda e: e['start_date']))
+        spans = [
+            (datetime.date.fromisoformat(e['end_date']) - datetime.date.fromisoformat(e['start_date'])).days
+            for e in dated
+        ]
+        index = {
+            'key': key,
+            'dated': dated,
+            'starts': [e['start_date'] for e in dated],
+            'max_span': max(spans, default=0),
+            'undated': [e for entries in per_source for e in entries if not e['start_date']]
+        }
+        _events_indexes[sources] = index
+        return index
+
+def events_between(index, start=None, end=None):
+    # Events overlapping [start, end]; bisect narrows the scan to events that
+    # begin no earlier than the longest event span before ``start``.
+    if start is None and end is None:
+        return index['dated'] + index['undated']
+    lo = 0
+    if start is not None:
+        lo = bisect.bisect_left(index['starts'], (start - datetime.timedelta(days=index['max_span'])).isoformat())
+    hi = len(index['starts'])
+    if end is not None:
+        hi = bisect.bisect_right(index['starts'], end.isoformat())
+    events = index['dated'][lo:hi]
+    if start is not None:
+        events = [e for e in events if e['end_date'] >= start.isoformat()]
+    return events
+
+def load_all_events(sources):
+    def load(source):
+        try:
+            return source, get_events(source), None
+        except Exception as e:
+            return source, None, e
+    with ThreadPoolExecutor(max_workers=len(sources)) as executor:
+        return list(executor.map(load, sources))
+
+def _parse_day(name):
+    value = request.args.get(name)
+    if not value:
+        return None
+    return datetime.date.fromisoformat(value)
+
+@events_bp.route('/api/events', methods=['GET'])
+def all_events():
     try:
-        events = fetch_neduet_events(3)
+        start = _parse_day('from')
+        end = _parse_day('to')
+    except ValueError:
         return jsonify({
-            'success': True,
-            'events': events,
-            'count': len(events)
-        })
-    except Exception as e:
+            'success': False,
+            'error': "Query parameters 'from' and 'to' must be dates in YYYY-MM-DD format",
+            'events': []
+        }), 400
+    sources = [s.strip() for s in request.args.get('source', '').split(',') if s.strip()] or list(EVENT_SOURCES)
+    unknown = [s for s in sources if s not in EVENT_SOURCES]
+    if unknown:
         return jsonify({
             'success': False,
-            'error': str(e),
+            'error': f"Unknown event source: {', '.join(unknown)}",
             'events': []
-        }), 500
+        }), 400
 
-@events_bp.route('/api/uet_taxila_events', methods=['GET'])
-def uet_taxila_events():
-    try:
-        events = fetch_uet_taxila_events()
-        return jsonify({
-            'success': True,
-            'events': events,
-            'count': len(events)
-        })
-    except Exception as e:
+    def etag_for(records):
+        return make_etag('events', start, end, *[record_etag(records[source]) for source in sorted(records)])
+
+    if is_conditional():
+        states = {source: get_events(source, state_only=True) for source in sources}
+        if all(states.values()):
+            response = not_modified(etag_for(states), max(state['fetched_at'] for state in states.values()))
+            if response is not None:
+                return response
+
+    records = {}
+    status = {}
+    for source, record, error in load_all_events(sources):
+        if error is None and record is not None and record['events'] is not None:
+            records[source] = record
+            status[source] = {
+                'count': len(record['events']),
+                'last_updated': record['last_updated'],
+                'stale': record['stale'],
+                'error': record['last_error']
+            }
+        else:
+            status[source] = {
+                'count': 0,
+                'last_updated': None,
+                'stale': True,
+                'error': str(error) if error else (record or {}).get('last_error') or 'Events are being refreshed, try again shortly'
+            }
+    if not records:
         return jsonify({
             'success': False,
-            'error': str(e),
+            'error': 'No event data available',
+            'sources': status,
             'events': []
-        }), 500
\ No newline at end of file
+        }), 503
+
+    events = events_between(build_events_index(records), start, end)
+    response = jsonify({
+        'success': True,
+        'events': events,
+        'count': len(events),
+        'sources': status
+    })
+    if len(records) == len(sources):
+        # Validators only when every source answered; errors are not versioned.
+        response = with_validators(response, etag_for(records), max(record['fetched_at'] for record in records.values()))
+    return response
+
+# Event routes serve from the events store; refreshes happen in the background
+@events_bp.route('/api/comsats_events', methods=['GET'])
+def comsats_events():
+    return events_response('comsats')
+
+@events_bp.route('/api/neduet_events', methods=['GET'])
+def neduet_events():
+    return events_response('neduet')
+
+@events_bp.route('/api/uet_taxila_events', methods=['GET'])
+def uet_taxila_events():
+    return events_response('uet_taxila')
@@ -0,0 +1,197 @@
+import datetime
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from db import get_connection
+from metrics import record_cache
+
+
+EVENT_SOURCES = {}
+FAILURE_RETRY_SECONDS = 300
+REFRESH_LEASE_SECONDS = 120
+REFRESH_WORKERS = 3
+
+_schema_pids = set()
+_executor = None
+_executor_pid = None
+_pending = set()
+_pending_lock = threading.Lock()
+
+def register_event_source(name, fetcher, ttl):
+    EVENT_SOURCES[name] = {"fetch": fetcher, "ttl": ttl}
+
+def _ensure_schema(conn):
+    if os.getpid() in _schema_pids:
+        return
+    with conn:
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS event_sources ("
+            "source TEXT PRIMARY KEY, events TEXT, hash TEXT, version INTEGER NOT NULL DEFAULT 0, "
+            "fetched_at REAL, expires_at REAL NOT NULL DEFAULT 0, last_error TEXT, last_attempt REAL, "
+            "refreshing_until REAL NOT NULL DEFAULT 0)"
+        )
+    _schema_pids.add(os.getpid())
+
+
+def _iso(timestamp):
+    return datetime.datetime.fromtimestamp(timestamp).isoformat() if timestamp else None
+
+def load_events(source):
+    conn = get_connection()
+    _ensure_schema(conn)
+    row = conn.execute("SELECT * FROM event_sources WHERE source = ?", (source,)).fetchone()
+    if row is None:
+        return None
+    return {
+        "source": source,
+        "events": json.loads(row["events"]) if row["events"] is not None else None,
+        "filled": row["events"] is not None,
+        "version": row["version"],
+        "hash": row["hash"],
+        "fetched_at": row["fetched_at"],
+        "last_updated": _iso(row["fetched_at"]),
+        "stale": row["expires_at"] <= time.time(),
+        "expires_at": row["expires_at"],
+        "last_error": row["last_error"]
+    }
+
+def event_state(source):
+    # Everything load_events returns except the events, for answering
+    # conditional requests without decoding them.
+    conn = get_connection()
+    _ensure_schema(conn)
+    row = conn.execute(
+        "SELECT version, hash, fetched_at, expires_at, last_error, events IS NOT NULL AS filled "
+        "FROM event_sources WHERE source = ?",
+        (source,)
+    ).fetchone()
+    if row is None:
+        return None
+    return {
+        "source": source,
+        "filled": bool(row["filled"]),
+        "version": row["version"],
+        "hash": row["hash"],
+        "fetched_at": row["fetched_at"],
+        "last_updated": _iso(row["fetched_at"]),
+        "stale": row["expires_at"] <= time.time(),
+        "expires_at": row["expires_at"],
+        "last_error": row["last_error"]
+    }
+
+def store_versions():
+    # Version and expiry per source without loading the events themselves.
+    conn = get_connection()
+    _ensure_schema(conn)
+    rows = conn.execute("SELECT source, version, fetched_at, expires_at, events IS NOT NULL AS filled FROM event_sources").fetchall()
+    return {
+        row["source"]: {"version": row["version"], "fetched_at": row["fetched_at"], "expires_at": row["expires_at"], "filled": bool(row["filled"])}
+        for row in rows
+    }
+
+def _claim_refresh(conn, source):
+    # Only one worker process refreshes a given source at a time.
+    now = time.time()
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        row = conn.execute("SELECT refreshing_until FROM event_sources WHERE source = ?", (source,)).fetchone()
+        if row is not None and row["refreshing_until"] > now:
+            conn.execute("ROLLBACK")
+            return False
+        if row is None:
+            conn.execute("INSERT INTO event_sources (source, refreshing_until) VALUES (?, ?)", (source, now + REFRESH_LEASE_SECONDS))
+        else:
+            conn.execute("UPDATE event_sources SET refreshing_until = ? WHERE source = ?", (now + REFRESH_LEASE_SECONDS, source))
+        conn.execute("COMMIT")
+        return True
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+
+def store_events(source, events, ttl):
+    conn = get_connection()
+    _ensure_schema(conn)
+    now = time.time()
+    payload = json.dumps(events, sort_keys=True)
+    digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    with conn:
+        conn.execute(
+            "INSERT INTO event_sources (source) VALUES (?) ON CONFLICT(source) DO NOTHING", (source,)
+        )
+        conn.execute(
+            "UPDATE event_sources SET events = ?, version = CASE WHEN hash IS ? THEN version ELSE version + 1 END, "
+            "hash = ?, fetched_at = ?, expires_at = ?, last_error = NULL, last_attempt = ?, refreshing_until = 0 "
+            "WHERE source = ?",
+            (json.dumps(events), digest, digest, now, now + ttl, now, source)
+        )
+
+def refresh_source(source):
+    config = EVENT_SOURCES[source]
+    conn = get_connection()
+    _ensure_schema(conn)
+    if not _claim_refresh(conn, source):
+        return False
+    try:
+        events = config["fetch"]()
+        if not events:
+            raise ValueError("No events found")
+    except Exception as e:
+        print(f"Error refreshing {source} events: {e}")
+        now = time.time()
+        with conn:
+            conn.execute(
+                "UPDATE event_sources SET last_error = ?, last_attempt = ?, expires_at = ?, refreshing_until = 0 WHERE source = ?",
+                (str(e), now, now + FAILURE_RETRY_SECONDS, source)
+            )
+        return False
+    store_events(source, events, config["ttl"])
+    return True
+
+def _run_refresh(source):
+    try:
+        refresh_source(source)
+    except Exception as e:
+        print(f"Error refreshing {source} events: {e}")
+    finally:
+        with _pending_lock:
+            _pending.discard(source)
+
+def _get_executor():
+    # Executors do not survive a fork, so each worker builds its own.
+    global _executor, _executor_pid
+    if _executor is None or _executor_pid != os.getpid():
+        _executor = ThreadPoolExecutor(max_workers=REFRESH_WORKERS, thread_name_prefix="events-refresh")
+        _executor_pid = os.getpid()
+        _pending.clear()
+    return _executor
+
+def schedule_refresh(source):
+    executor = _get_executor()
+    with _pending_lock:
+        if source in _pending:
+            return False
+        _pending.add(source)
+    executor.submit(_run_refresh, source)
+    return True
+
+def get_events(source, state_only=False):
+    # With state_only the events are not loaded, and None is returned when
+    # nothing is stored yet so the caller can fall back to a full load.
+    record = event_state(source) if state_only else load_events(source)
+    cache = f"events:{source}"
+    if record is None or not record["filled"]:
+        if state_only:
+            return None
+        record_cache(cache, "miss")
+        if record is None or record["expires_at"] <= time.time():
+            refresh_source(source)
+            record = load_events(source)
+    elif record["stale"]:
+        record_cache(cache, "stale")
+        schedule_refresh(source)
+    else:
+        record_cache(cache, "hit")
+    return record
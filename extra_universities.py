@@ -0,0 +1,201 @@
+import datetime
+from lazy_imports import lazy_attr
+from timing import timed
+from flask import Blueprint, jsonify
+from plugins import register_plugin
+from web_scraping import load_cached_data, store_cached_entry, safe_get
+from metrics import record_cache
+from conditional import conditional_scrape
+
+BeautifulSoup = timed("parse")(lazy_attr("bs4", "BeautifulSoup"))
+
+
+iqra_bp = Blueprint('iqra', __name__)
+bahria_bp = Blueprint('bahria', __name__)
+uol_bp = Blueprint('uol', __name__)
+
+IQRA = {
+    "name": "Iqra University",
+    "weights": {"matric": 0.10, "fsc": 0.40, "test": 0.50},
+    "totals": {"matric": 1100, "fsc": 1100, "test": 100},
+    "test_used": "NTS",
+    "data_file": "iqra_uni_merit_list.xlsx",
+    "program_col": "Program",
+    "year_col": "Year",
+    "cutoff_col": "Merit Percentage",
+    "fee_url": "https://www.ilmkidunya.com/colleges/iqra-university-islamabad-fee-structure.aspx"
+}
+BAHRIA = {
+    "name": "Bahria University",
+    "weights": {"matric": 0.20, "fsc": 0.30, "test": 0.50},
+    "totals": {"matric": 1100, "fsc": 1100, "test": 100},
+    "test_used": "NTS",
+    "data_file": "bahria_uni_merit_list.csv",
+    "program_col": "Discipline",
+    "year_col": "Year",
+    "cutoff_col": "Aggregate",
+    "fee_url": "https://www.ilmkidunya.com/colleges/bahria-university-karachi-fee-structure.aspx"
+}
+UOL = {
+    "name": "University of Lahore",
+    "weights": {"matric": 0.20, "fsc": 0.30, "test": 0.50},
+    "totals": {"matric": 1100, "fsc": 1100, "test": 100},
+    "test_used": "NTS",
+    "data_file": "uol_merit_data.csv",
+    "program_col": "Program",
+    "year_col": "Year",
+    "cutoff_col": "Merit Score",
+    "fee_url": "https://www.ilmkidunya.com/colleges/university-of-lahore-uol-fee-structure.aspx"
+}
+UOL_MERIT_DATA = {
+    "columns": {
+        "Program": [
+            "Computer Science",
+            "Software Engineering",
+            "Business Administration",
+            "Electrical Engineering",
+            "Computer Science",
+            "Software Engineering",
+            "Business Administration",
+            "Electrical Engineering",
+            "Computer Science",
+            "Software Engineering"
+        ],
+        "Year": [2023, 2023, 2023, 2023,
+                 2022, 2022, 2022, 2022,
+                 2021, 2021],
+        "Merit Score": [75.5, 74.8, 72.3, 76.2,
+                        74.8, 74.1, 71.8, 75.5,
+                        74.2, 73.9]
+    },
+    "cutoff_col": "Merit Score",
+    "year_col": "Year",
+    "program_col": "Program"
+}
+
+
+def scrape_table_fees(cache_key, url, label):
+    cached = load_cached_data()
+    resp, error = safe_get(url)
+    if not error:
+        soup = BeautifulSoup(resp.text, 'html.parser')
+        tables = soup.find_all('table')
+        fee_data = []
+        for table in tables:
+            headers = [th.get_text(strip=True) for th in table.find_all('th')]
+            for row in table.find_all('tr')[1:]:
+                cols = row.find_all('td')
+                if len(cols) == len(headers):
+                    fee_data.append({headers[i]: cols[i].get_text(strip=True) for i in range(len(headers))})
+        if fee_data:
+            update_time = datetime.datetime.now().isoformat()
+            store_cached_entry(cached, cache_key, {
+                "fee_structure": fee_data,
+                "last_updated": update_time
+            })
+            return fee_data, None, update_time, False
+        else:
+            error = f"No fee data found for {label}"
+    record_cache(cache_key, "stale" if cache_key in cached else "miss")
+    if cache_key in cached:
+        cached_entry = cached[cache_key]
+        return cached_entry["fee_structure"], None, cached_entry["last_updated"], True
+    return None, error or f"No fee data found for {label}", None, False
+
+def fee_response(uni_id, source, result):
+    data, error, last_updated, from_cache = result
+    if error:
+        return jsonify({
+            "status": "error",
+            "source": source,
+            "message": error
+        }), 500
+    response = {
+        "status": "success",
+        "uni_id": uni_id,
+        "source": source,
+        "fee_structure": data,
+        "last_updated": last_updated
+    }
+    if from_cache:
+        response["note"] = "Data loaded from cache due to fetch failure"
+    return jsonify(response)
+
+
+@iqra_bp.route('/feesiqra', methods=['GET'])
+@conditional_scrape('iqra_fees')
+def fees_iqra():
+    return fee_response("iqra", "Iqra University", scrape_table_fees("iqra_fees", IQRA["fee_url"], "Iqra University"))
+
+@bahria_bp.route('/feesbahria', methods=['GET'])
+@conditional_scrape('bahria_fees')
+def fees_bahria():
+    return fee_response("bahria", "Bahria University", scrape_table_fees("bahria_fees", BAHRIA["fee_url"], "Bahria University"))
+
+
+def extract_fee_structure_uol(soup, section_title):
+    section = soup.find('h2', string=lambda text: text and section_title.lower() in text.lower())
+    if section:
+        table = section.find_next('table')
+        if table:
+            headers = [th.get_text(strip=True) for th in table.find_all('th')]
+            rows = []
+            for tr in table.find_all('tr')[1:]:
+                cols = [td.get_text(strip=True) for td in tr.find_all('td')]
+                if cols:
+                    rows.append(dict(zip(headers, cols)))
+            return rows
+    return []
+
+def scrape_fee_structure_uol():
+    cache_key = "uol_fees"
+    cached = load_cached_data()
+    resp, error = safe_get(UOL["fee_url"])
+    if not error:
+        soup = BeautifulSoup(resp.text, 'html.parser')
+        data = {
+            'BSCS': extract_fee_structure_uol(soup, "BSCS Fee Structure"),
+            'BBA': extract_fee_structure_uol(soup, "BBA Fee Structure"),
+            'MPhil Programs': extract_fee_structure_uol(soup, "M. Phil Programs"),
+            'Masters Programs': extract_fee_structure_uol(soup, "Masters Programs")
+        }
+        if any(data.values()):
+            update_time = datetime.datetime.now().isoformat()
+            store_cached_entry(cached, cache_key, {
+                "fee_structure": data,
+                "last_updated": update_time
+            })
+            return data, None, update_time, False
+        else:
+            error = "No fee data found for UOL"
+    record_cache(cache_key, "stale" if cache_key in cached else "miss")
+    if cache_key in cached:
+        cached_entry = cached[cache_key]
+        return cached_entry["fee_structure"], None, cached_entry["last_updated"], True
+    return None, error or "No fee data found for UOL", None, False
+
+@uol_bp.route('/feesuol', methods=['GET'])
+@conditional_scrape('uol_fees')
+def fees_uol():
+    return fee_response("uol", "University of Lahore (UOL)", scrape_fee_structure_uol())
+
+
+register_plugin(
+    'iqra',
+    universities={"iqra": IQRA},
+    blueprints=[iqra_bp],
+    endpoints={'Iqra University': '/feesiqra'}
+)
+register_plugin(
+    'bahria',
+    universities={"bahria": BAHRIA},
+    blueprints=[bahria_bp],
+    endpoints={'Bahria University': '/feesbahria'}
+)
+register_plugin(
+    'uol',
+    universities={"uol": UOL},
+    merit_data={"uol": UOL_MERIT_DATA},
+    blueprints=[uol_bp],
+    endpoints={'University of Lahore (UOL)': '/feesuol'}
+)
@@ -0,0 +1,229 @@
+import copy
+import difflib
+import hashlib
+import json
+import os
+import zlib
+from flask import Blueprint, request, jsonify
+from response_encoding import cached_json_response
+from conditional import make_etag, not_modified, with_validators
+from db import get_connection
+
+
+fee_history_bp = Blueprint('fee_history', __name__)
+
+FEE_KEY_SUFFIX = "_fees"
+CHECKPOINT_INTERVAL = 30
+
+_schema_pids = set()
+_latest = {}
+
+def _ensure_schema(conn):
+    if os.getpid() in _schema_pids:
+        return
+    with conn:
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS fee_history ("
+            "uni_id TEXT NOT NULL, version INTEGER NOT NULL, recorded_at TEXT, hash TEXT NOT NULL, "
+            "is_checkpoint INTEGER NOT NULL, payload BLOB NOT NULL, PRIMARY KEY (uni_id, version))"
+        )
+    _schema_pids.add(os.getpid())
+
+
+def _canonical(value):
+    return json.dumps(value, sort_keys=True, separators=(",", ":"))
+
+def make_delta(old, new):
+    if old == new:
+        return None
+    if isinstance(old, dict) and isinstance(new, dict):
+        changes = {}
+        for key, value in new.items():
+            if key not in old:
+                changes[key] = {"=": value}
+            else:
+                sub = make_delta(old[key], value)
+                if sub is not None:
+                    changes[key] = sub
+        delta = {}
+        if changes:
+            delta["d"] = changes
+        removed = [key for key in old if key not in new]
+        if removed:
+            delta["r"] = removed
+        if [key for key in old if key in new] + [key for key in new if key not in old] != list(new):
+            delta["o"] = list(new)
+        return delta
+    if isinstance(old, list) and isinstance(new, list):
+        # Splice ops keep rows that were inserted or dropped from shifting
+        # every following row into the delta.
+        matcher = difflib.SequenceMatcher(None, [_canonical(v) for v in old], [_canonical(v) for v in new], autojunk=False)
+        ops = []
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            if tag == "equal":
+                ops.append(["c", i1, i2])
+            elif tag == "replace" and i2 - i1 == j2 - j1:
+                ops.append(["p", i1, [make_delta(old[i1 + k], new[j1 + k]) for k in range(i2 - i1)]])
+            elif tag in ("replace", "insert"):
+                ops.append(["n", new[j1:j2]])
+        return {"s": ops}
+    return {"=": new}
+
+def apply_delta(value, delta):
+    if delta is None:
+        return value
+    if "=" in delta:
+        return delta["="]
+    if "s" in delta:
+        result = []
+        for op in delta["s"]:
+            if op[0] == "c":
+                result.extend(value[op[1]:op[2]])
+            elif op[0] == "p":
+                result.extend(apply_delta(value[op[1] + k], sub) for k, sub in enumerate(op[2]))
+            elif op[0] == "n":
+                result.extend(op[1])
+        return result
+    result = {key: val for key, val in value.items() if key not in delta.get("r", [])}
+    for key, sub in delta.get("d", {}).items():
+        result[key] = apply_delta(result.get(key), sub)
+    if "o" in delta:
+        result = {key: result[key] for key in delta["o"]}
+    return result
+
+
+def _encode(value):
+    return zlib.compress(_canonical(value).encode("utf-8"), 9)
+
+def _decode(payload):
+    return json.loads(zlib.decompress(payload).decode("utf-8"))
+
+def _reconstruct(conn, uni_id, version):
+    rows = conn.execute(
+        "SELECT version, is_checkpoint, payload FROM fee_history WHERE uni_id = ? AND version <= ? "
+        "AND version >= (SELECT MAX(version) FROM fee_history WHERE uni_id = ? AND version <= ? AND is_checkpoint = 1) "
+        "ORDER BY version",
+        (uni_id, version, uni_id, version)
+    ).fetchall()
+    if not rows or rows[-1]["version"] != version:
+        return None
+    value = None
+    for row in rows:
+        data = _decode(row["payload"])
+        value = data if row["is_checkpoint"] else apply_delta(value, data)
+    return value
+
+def record_fee_snapshot(cache_key, entry):
+    if not cache_key.endswith(FEE_KEY_SUFFIX) or not isinstance(entry, dict) or "fee_structure" not in entry:
+        return None
+    uni_id = cache_key[:-len(FEE_KEY_SUFFIX)]
+    structure = entry["fee_structure"]
+    digest = hashlib.sha256(_canonical(structure).encode("utf-8")).hexdigest()
+    conn = get_connection()
+    _ensure_schema(conn)
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        last = conn.execute(
+            "SELECT version, hash FROM fee_history WHERE uni_id = ? ORDER BY version DESC LIMIT 1",
+            (uni_id,)
+        ).fetchone()
+        if last is not None and last["hash"] == digest:
+            conn.execute("ROLLBACK")
+            return None
+        version = last["version"] + 1 if last else 1
+        is_checkpoint = (version - 1) % CHECKPOINT_INTERVAL == 0
+        if is_checkpoint:
+            payload = _encode(structure)
+        else:
+            cached_version, previous = _latest.get(uni_id, (None, None))
+            if cached_version != last["version"]:
+                previous = _reconstruct(conn, uni_id, last["version"])
+            payload = _encode(make_delta(previous, structure))
+        conn.execute(
+            "INSERT INTO fee_history (uni_id, version, recorded_at, hash, is_checkpoint, payload) VALUES (?, ?, ?, ?, ?, ?)",
+            (uni_id, version, entry.get("last_updated"), digest, int(is_checkpoint), payload)
+        )
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+    _latest[uni_id] = (version, copy.deepcopy(structure))
+    return version
+
+def record_cached_fees(cached):
+    for cache_key, entry in cached.items():
+        try:
+            record_fee_snapshot(cache_key, entry)
+        except Exception as e:
+            print(f"Error recording fee history for {cache_key}: {e}")
+
+def list_versions(uni_id):
+    conn = get_connection()
+    _ensure_schema(conn)
+    rows = conn.execute(
+        "SELECT version, recorded_at, hash, is_checkpoint, LENGTH(payload) AS size FROM fee_history "
+        "WHERE uni_id = ? ORDER BY version",
+        (uni_id,)
+    ).fetchall()
+    return [{
+        "version": row["version"],
+        "recorded_at": row["recorded_at"],
+        "hash": row["hash"],
+        "checkpoint": bool(row["is_checkpoint"]),
+        "stored_bytes": row["size"]
+    } for row in rows]
+
+def get_version(uni_id, version):
+    conn = get_connection()
+    _ensure_schema(conn)
+    return _reconstruct(conn, uni_id, version)
+
+
+@fee_history_bp.route('/fees/<uni_id>/history', methods=['GET'])
+def fee_history(uni_id):
+    try:
+        versions = list_versions(uni_id)
+    except Exception as e:
+        return jsonify({
+            "status": "error",
+            "message": str(e)
+        }), 500
+    if not versions:
+        return jsonify({
+            "status": "error",
+            "uni_id": uni_id,
+            "message": f"No fee history recorded for {uni_id}"
+        }), 404
+    version = request.args.get('version', type=int)
+    if version is None:
+        latest = versions[-1]
+        etag = make_etag("fee_history", uni_id, "versions", latest["version"], latest["hash"])
+        return not_modified(etag, latest["recorded_at"]) or with_validators(jsonify({
+            "status": "success",
+            "uni_id": uni_id,
+            "latest_version": latest["version"],
+            "count": len(versions),
+            "versions": versions
+        }), etag, latest["recorded_at"])
+    if version < 1 or version > versions[-1]["version"]:
+        return jsonify({
+            "status": "error",
+            "uni_id": uni_id,
+            "message": f"Version {version} not found"
+        }), 404
+    meta = versions[version - 1]
+    etag = make_etag("fee_history", uni_id, version, meta["hash"])
+    response = not_modified(etag, meta["recorded_at"])
+    if response is not None:
+        return response
+    # Recorded versions never change, so each is rebuilt from its deltas and
+    # encoded once.
+    response = cached_json_response(("fee_history", uni_id, version), meta["hash"], lambda: {
+        "status": "success",
+        "uni_id": uni_id,
+        "version": version,
+        "recorded_at": meta["recorded_at"],
+        "hash": meta["hash"],
+        "fee_structure": get_version(uni_id, version)
+    })
+    return with_validators(response, etag, meta["recorded_at"])
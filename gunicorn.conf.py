@@ -0,0 +1,36 @@
+import gc
+import os
+import shutil
+import tempfile
+
+
+# Load the app once in the master and fork workers from it. Merit tables,
+# fitted predictions and the heavy imports are then shared copy-on-write
+# instead of every worker building its own. SCHOLAR_PRELOAD=0 turns this off.
+os.environ.setdefault("SCHOLAR_PRELOAD", "1")
+preload_app = os.environ["SCHOLAR_PRELOAD"] == "1"
+if preload_app:
+    os.environ.setdefault("SCHOLAR_EAGER_IMPORTS", "1")
+
+# Workers write their metric samples here and /metrics merges them. It must be
+# set before prometheus_client is imported, and is emptied here rather than in
+# on_starting, which runs after a preloading master has already recorded its
+# table loads and model fits.
+os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", os.path.join(tempfile.gettempdir(), "scholar_metrics"))
+shutil.rmtree(os.environ["PROMETHEUS_MULTIPROC_DIR"], ignore_errors=True)
+os.makedirs(os.environ["PROMETHEUS_MULTIPROC_DIR"], exist_ok=True)
+
+def pre_fork(server, worker):
+    # A collection in a worker writes to the GC header of every object it
+    # visits, which would copy the shared pages; frozen objects are skipped.
+    if preload_app:
+        gc.freeze()
+
+def post_fork(server, worker):
+    if preload_app:
+        import merit_tables
+        merit_tables.detach_predictions()
+
+def child_exit(server, worker):
+    from prometheus_client import multiprocess
+    multiprocess.mark_process_dead(worker.pid)
@@ -0,0 +1,40 @@
+DEFAULT_NODE_BUDGET = 2000
+
+def walk_section(start, stop=None, siblings=False, budget=DEFAULT_NODE_BUDGET):
+    # Yields the tags after ``start`` in one pass: its following siblings when
+    # ``siblings`` is set, otherwise everything after it in document order.
+    # The walk ends at the first tag for which ``stop`` is true or once
+    # ``budget`` tags have been yielded.
+    from bs4 import Tag
+    nodes = start.next_siblings if siblings else start.next_elements
+    visited = 0
+    for node in nodes:
+        if not isinstance(node, Tag):
+            continue
+        if stop is not None and stop(node):
+            return
+        if visited >= budget:
+            return
+        visited += 1
+        yield node
+
+def heading_stop(names=("h1", "h2")):
+    return lambda tag: tag.name in names
+
+def tag_not_in(names):
+    return lambda tag: tag.name not in names
+
+def table_stop(start):
+    # Matches the first table after ``start`` and every ancestor of it that
+    # begins after ``start``, i.e. the elements that "contain a table", without
+    # a subtree search per visited node.
+    table = start.find_next("table")
+    if table is None:
+        return None
+    boundary = {id(table)}
+    before = {id(start)} | {id(parent) for parent in start.parents}
+    for parent in table.parents:
+        if id(parent) in before:
+            break
+        boundary.add(id(parent))
+    return lambda tag: id(tag) in boundary
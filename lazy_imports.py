@@ -0,0 +1,59 @@
+import importlib
+import os
+
+
+# Heavy libraries (pandas, sklearn, bs4, requests) are bound through these
+# proxies so a worker only pays for them when a route first needs them.
+# SCHOLAR_EAGER_IMPORTS=1 resolves everything at import time instead, which is
+# what a preloading master wants before it forks workers.
+EAGER_IMPORTS = os.environ.get("SCHOLAR_EAGER_IMPORTS") == "1"
+
+_proxies = []
+
+class LazyModule:
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def _resolve(self):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return self._module
+
+    def __getattr__(self, attr):
+        return getattr(self._resolve(), attr)
+
+class LazyAttr:
+    def __init__(self, module, attr):
+        self._module = module
+        self._attr = attr
+        self._value = None
+
+    def _resolve(self):
+        if self._value is None:
+            self._value = getattr(importlib.import_module(self._module), self._attr)
+        return self._value
+
+    def __call__(self, *args, **kwargs):
+        return self._resolve()(*args, **kwargs)
+
+    def __getattr__(self, attr):
+        return getattr(self._resolve(), attr)
+
+def lazy_module(name):
+    if EAGER_IMPORTS:
+        return importlib.import_module(name)
+    proxy = LazyModule(name)
+    _proxies.append(proxy)
+    return proxy
+
+def lazy_attr(module, attr):
+    if EAGER_IMPORTS:
+        return getattr(importlib.import_module(module), attr)
+    proxy = LazyAttr(module, attr)
+    _proxies.append(proxy)
+    return proxy
+
+def resolve_all():
+    for proxy in _proxies:
+        proxy._resolve()
@@ -1,24 +1,70 @@
 from flask import Flask, request, jsonify
 from flask_cors import CORS
-import pandas as pd
-import re
-import numpy as np
-from sklearn.linear_model import LinearRegression
-from sklearn.preprocessing import PolynomialFeatures
-from sklearn.pipeline import make_pipeline
-from sklearn.metrics import r2_score
-import datetime
+from lazy_imports import lazy_module, lazy_attr, resolve_all
+import gc
 import os
 import json
 from events import events_bp
-from web_scraping import web_scraping_bp, set_universities
+from event_feeds import event_feeds_bp
+from web_scraping import web_scraping_bp, set_universities, register_cache_listener, read_cached_data, remove_cached_entries
+from search_index import search_bp, index_cache_entry, index_cached_data
+from deadlines import deadlines_bp, index_deadlines, index_cached_deadlines
+from sync_feed import sync_bp, record_change, sync_cached_data, live_keys
+from fee_history import fee_history_bp, record_fee_snapshot, record_cached_fees
+from polite_fetch import fetch_stats_bp
+from timing import timing_bp, timed, span
+from metrics import metrics_bp, record_model_fit
+from app_logging import logging_bp, setup_logging, get_logger, sample_payload
+from response_encoding import encoding_bp, FastJSONProvider, cached_json_response
+from conditional import make_etag, not_modified, with_validators
+from plugins import load_plugins
+from merit_tables import normalize, get_merit_table, get_latest_cutoff, prepare_training_data, cached_prediction, preload_tables
+import scholarships  # registers the abroad_scholarships plugin
+import extra_universities  # registers the iqra, bahria and uol plugins
+
+np = lazy_module("numpy")
+LinearRegression = lazy_attr("sklearn.linear_model", "LinearRegression")
+PolynomialFeatures = lazy_attr("sklearn.preprocessing", "PolynomialFeatures")
+make_pipeline = lazy_attr("sklearn.pipeline", "make_pipeline")
+r2_score = lazy_attr("sklearn.metrics", "r2_score")
+
+# SCHOLAR_PRELOAD=1 builds merit tables and fitted predictions at import so a
+# preloading gunicorn master can share them with its workers (gunicorn.conf.py).
+PRELOAD = os.environ.get("SCHOLAR_PRELOAD") == "1"
+TARGET_YEAR = 2026
+# Keys of each /predict university entry, for fields= projection.
+PREDICT_FIELDS = (
+    "id", "name", "user_aggregate", "predicted_2026_cutoff", "admitted", "admission_chance", "criteria",
+    "last_actual_cutoff", "last_actual_year", "linear_r2", "poly_r2", "best_model"
+)
+# compact=1 keeps the outcome only: names and criteria come from /universities
+# and the model fit diagnostics are left out.
+COMPACT_FIELDS = ("user_aggregate", "predicted_2026_cutoff", "admitted", "admission_chance", "last_actual_cutoff", "last_actual_year")
+O_A_LEVEL_MATRIC_TOTAL = 900
+UNIVERSITIES_MAX_AGE = 3600
+
+setup_logging()
+log = get_logger("predict")
 
 app = Flask(__name__)
+app.json = FastJSONProvider(app)
 CORS(app)  
 
 
 app.register_blueprint(web_scraping_bp)
 app.register_blueprint(events_bp)  
+app.register_blueprint(event_feeds_bp)
+app.register_blueprint(search_bp)
+app.register_blueprint(deadlines_bp)
+app.register_blueprint(sync_bp)
+app.register_blueprint(fee_history_bp)
+app.register_blueprint(fetch_stats_bp)
+app.register_blueprint(timing_bp)
+app.register_blueprint(metrics_bp)
+app.register_blueprint(logging_bp)
+# Registered last so compression runs before the other after-request hooks
+# and the metrics and timings include it.
+app.register_blueprint(encoding_bp)
 
 UNIVERSITIES = {
    "fast": {
@@ -124,7 +170,100 @@ UNIVERSITIES = {
     }
 }
 
+# Merit data kept in code for universities without a usable data file,
+# together with the columns /predict reads from it.
+INLINE_MERIT_DATA = {
+    "ned": {
+        "columns": {
+            "Discipline": ["Software Engineering (SE)", "Computer Systems Engineer", 
+                         "Computer Science and Info", "Data Sciences (DS)", 
+                         "Artificial Intelligence (AI)"],
+            "2024": [86.86, 83.90, 84.27, None, None],
+            "2023": [86.86, 83.90, 84.27, 83.73, 83.50],
+            "2022": [91.50, 89.18, 89.45, 88.40, 88.14],
+            "2021": [83.35, 83.61, 83.59, None, None],
+            "2020": [91.76, 89.24, 89.37, 83.91, 83.60],
+            "2019": [92.18, 89.11, 89.09, 84.01, 82.82],
+            "2018": [92.56, 89.02, 90.08, 83.48, 83.32]
+        },
+        "melt": ("Discipline", "Year", "Percentage"),
+        "cutoff_col": "Percentage",
+        "year_col": "Year",
+        "program_col": "Discipline"
+    },
+    "iiui": {
+        "columns": {
+            "Discipline": [
+                "BS Computer Science", 
+                "BS Software Engineering", 
+                "BS Artificial Intelligence", 
+                "BS Data Science", 
+                "BS Cyber Security", 
+                "BS Information Technology", 
+                "BE Electrical Engineering", 
+                "BE Mechanical Engineer",
+                "BS Computer Science", 
+                "BS Software Engineering", 
+                "BS Artificial Intelligence", 
+            ],
+            "Year": [2021, 2021, 2021, 2021, 2021, 2021, 2021, 2021, 
+                     2020, 2020, 2020],
+            "Aggregate": [84.20, 84.10, 84.00, 83.90, 83.80, 83.70, 83.60, 83.50,
+                          83.70, 83.60, 83.50]
+        },
+        "cutoff_col": "Aggregate",
+        "year_col": "Year",
+        "program_col": "Discipline"
+    },
+    "air": {
+        "columns": {
+            "Program": [
+                "Computer Science", 
+                "Software Engineering", 
+                "Business Administration", 
+                "Electrical Engineering",
+                "Computer Science", 
+                "Software Engineering", 
+                "Business Administration", 
+                "Electrical Engineering",
+                "Computer Science", 
+                "Software Engineering"
+            ],
+            "Year": [2023, 2023, 2023, 2023, 
+                     2022, 2022, 2022, 2022,
+                     2021, 2021],
+            "Merit Score": [75.5, 74.8, 72.3, 76.2,
+                           74.8, 74.1, 71.8, 75.5,
+                           74.2, 73.9]
+        },
+        "cutoff_col": "Merit Score",
+        "year_col": "Year",
+        "program_col": "Program"
+    }
+}
+
+# (uni_id, error) pairs already logged, so a missing data file is reported
+# once per process instead of on every request.
+_reported_load_errors = set()
+
+PLUGIN_ENDPOINTS = {}
+LOADED_PLUGINS = load_plugins(app, UNIVERSITIES, INLINE_MERIT_DATA, PLUGIN_ENDPOINTS)
+
 set_universities(UNIVERSITIES)
+register_cache_listener(index_cache_entry)
+register_cache_listener(index_deadlines)
+register_cache_listener(record_change)
+register_cache_listener(record_fee_snapshot)
+cached_data = read_cached_data() or {}
+index_cached_data(cached_data)
+index_cached_deadlines(cached_data)
+sync_cached_data(cached_data)
+record_cached_fees(cached_data)
+# Keys that have left the cache file since the last start are removed
+# everywhere. Skipped when the file is missing, unreadable or empty, which
+# must not turn into a deletion of every record.
+if cached_data:
+    remove_cached_entries(live_keys() - set(cached_data))
 
 def calculate_aggregate(matric_marks, fsc_marks, test_marks, totals, weights):
     matric_pct = (matric_marks / totals["matric"]) * 100 if totals.get("matric") else 0
@@ -136,15 +275,7 @@ def calculate_aggregate(matric_marks, fsc_marks, test_marks, totals, weights):
                 (test_pct * weights.get("test", 0))
     return aggregate
 
-def normalize(text):
-    if pd.isna(text):
-        return ""
-    return re.sub(r'\b(bs|bsc|bachelors|in|science|scien)\b', '', str(text).lower()).strip()
-
-def extract_year(year_str):
-    match = re.search(r'(\d{4})', str(year_str).replace(',', ''))
-    return int(match.group(1)) if match else None
-
+@timed("fit")
 def predict_cutoff(X, y, target_year):
     if len(X) == 0:
         return None, None, None, None
@@ -183,62 +314,28 @@ def predict_with_single_point(y_value, target_year, current_year, trend="stable"
     else:
         return y_value
 
-def get_latest_cutoff(df, program, cutoff_col, year_col=None, program_col="Program"):
-    df = df.copy()
-    if program_col not in df.columns:
-        return None, None
-        
-    df["Program_norm"] = df[program_col].apply(normalize)
+def predict_program(table, program, target_year):
     program_norm = normalize(program)
-    matched = df[df["Program_norm"].str.contains(program_norm, na=False)]
-    
-    if matched.empty:
-        return None, None
-
-    if year_col and year_col in df.columns:
-        matched = matched.copy()
-        matched.loc[:, 'Year_Num'] = matched[year_col].apply(extract_year)
-        matched = matched.dropna(subset=['Year_Num'])
-        if not matched.empty:
-            latest = matched.loc[matched['Year_Num'].idxmax()]
-            return float(latest[cutoff_col]), int(latest['Year_Num'])
-    
-    val = matched.iloc[0].get(cutoff_col, None)
-    return (float(val), None) if pd.notna(val) else (None, None)
 
-def prepare_training_data(df, program, year_col, cutoff_col, program_col="Program"):
-    df = df.copy()
-    if program_col not in df.columns or cutoff_col not in df.columns:
-        return None, None
-        
-    df["Program_norm"] = df[program_col].apply(normalize)
-    prog_norm = normalize(program)
-    prog_df = df[df["Program_norm"].str.contains(prog_norm, na=False)].copy()
-    
-    if prog_df.empty:
-        return None, None
-
-    if year_col and year_col in prog_df.columns:
-        prog_df.loc[:, 'Year_Num'] = prog_df[year_col].apply(extract_year)
-        prog_df = prog_df.dropna(subset=['Year_Num', cutoff_col])
-        if prog_df.shape[0] >= 2:
-            X = prog_df[['Year_Num']].astype(int).values
-            y = prog_df[cutoff_col].astype(float).values
-            return X, y
-        elif prog_df.shape[0] == 1:
-            return prog_df[['Year_Num']].astype(int).values, prog_df[cutoff_col].astype(float).values
-
-    prog_df = prog_df.dropna(subset=[cutoff_col])
-    if prog_df.shape[0] >= 2:
-        X = np.arange(len(prog_df)).reshape(-1, 1)
-        y = prog_df[cutoff_col].astype(float).values
-        return X, y
-    elif prog_df.shape[0] == 1:
-        X = np.array([[0]])
-        y = prog_df[cutoff_col].astype(float).values
-        return X, y
-
-    return None, None
+    def compute():
+        latest_cutoff, latest_year = get_latest_cutoff(table, program_norm)
+        X, y = prepare_training_data(table, program_norm)
+        if X is None:
+            return latest_cutoff, latest_year, None, None, None, None
+        if len(X) == 1:
+            if X[0][0] > 1900:
+                current_year = X[0][0]
+            else:
+                current_year = 2021
+            predicted_cutoff = predict_with_single_point(
+                y[0], target_year, current_year, trend="increasing"
+            )
+            return latest_cutoff, latest_year, predicted_cutoff, None, None, "single_point"
+        predicted_cutoff, linear_r2, poly_r2, best_model = predict_cutoff(X, y, target_year)
+        record_model_fit(table.uni_id)
+        return latest_cutoff, latest_year, predicted_cutoff, linear_r2, poly_r2, best_model
+
+    return cached_prediction(table, (program_norm, target_year), compute)
 
 def get_admission_chance(user_agg, predicted_cutoff):
     if predicted_cutoff is None:
@@ -253,15 +350,44 @@ def get_admission_chance(user_agg, predicted_cutoff):
     else:
         return "Low (<30%)"
 
+def requested_fields(data):
+    # fields= from the query string or the request body, as a list or a
+    # comma-separated string; None when the client asked for every field.
+    fields = request.args.get("fields", data.get("fields"))
+    if fields is None:
+        return None
+    if isinstance(fields, str):
+        fields = fields.split(",")
+    if not isinstance(fields, list) or not all(isinstance(field, str) for field in fields):
+        raise ValueError("fields must be a list of field names or a comma-separated string")
+    fields = [field.strip() for field in fields if field.strip()]
+    unknown = [field for field in fields if field not in PREDICT_FIELDS]
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}. Valid fields: {', '.join(PREDICT_FIELDS)}")
+    return fields
+
+def project_result(uni_result, fields):
+    # The id is always kept so entries can be matched to /universities.
+    return {field: uni_result[field] for field in ["id", *fields] if field in uni_result}
+
 @app.route("/predict", methods=["POST"])
 def predict_admission():
     data = request.get_json()
-    print("Received data:", data)
+    if sample_payload():
+        log.info("predict request", extra={"fields": {"request": data}})
     
     required_fields = ["matric_marks", "fsc_marks", "program"]
     if not all(field in data for field in required_fields):
         return jsonify({"error": "Missing required fields"}), 400
 
+    compact = request.args.get("compact", "").lower() in ("1", "true") or data.get("compact") is True
+    try:
+        fields = requested_fields(data)
+        if fields is None and compact:
+            fields = COMPACT_FIELDS
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
     try:
         matric = float(data["matric_marks"])
         fsc = float(data["fsc_marks"])
@@ -279,7 +405,7 @@ def predict_admission():
 
     is_graduate_application = bachelors_cgpa is not None or masters_cgpa is not None
     
-    target_year = 2026
+    target_year = TARGET_YEAR
     results = {"universities": []}
     
     if is_graduate_application:
@@ -303,7 +429,7 @@ def predict_admission():
         
         if is_o_a_level:
             if "matric" in uni_config["totals"]:
-                uni_config["totals"]["matric"] = 900
+                uni_config["totals"]["matric"] = O_A_LEVEL_MATRIC_TOTAL
         
         if is_graduate_application:
             uni_result = {
@@ -388,72 +514,11 @@ def predict_admission():
         )
         
         try:
-            if uni_id == "ned":
-                ned_data = {
-                    "Discipline": ["Software Engineering (SE)", "Computer Systems Engineer", 
-                                 "Computer Science and Info", "Data Sciences (DS)", 
-                                 "Artificial Intelligence (AI)"],
-                    "2024": [86.86, 83.90, 84.27, None, None],
-                    "2023": [86.86, 83.90, 84.27, 83.73, 83.50],
-                    "2022": [91.50, 89.18, 89.45, 88.40, 88.14],
-                    "2021": [83.35, 83.61, 83.59, None, None],
-                    "2020": [91.76, 89.24, 89.37, 83.91, 83.60],
-                    "2019": [92.18, 89.11, 89.09, 84.01, 82.82],
-                    "2018": [92.56, 89.02, 90.08, 83.48, 83.32]
-                }
-                df = pd.DataFrame(ned_data)
-                df = df.melt(id_vars=["Discipline"], var_name="Year", value_name="Percentage")
-                df['Year'] = df['Year'].astype(int)
-            elif uni_id == "iiui":
-                iiui_data = {
-                    "Discipline": [
-                        "BS Computer Science", 
-                        "BS Software Engineering", 
-                        "BS Artificial Intelligence", 
-                        "BS Data Science", 
-                        "BS Cyber Security", 
-                        "BS Information Technology", 
-                        "BE Electrical Engineering", 
-                        "BE Mechanical Engineer",
-                        "BS Computer Science", 
-                        "BS Software Engineering", 
-                        "BS Artificial Intelligence", 
-                    ],
-                    "Year": [2021, 2021, 2021, 2021, 2021, 2021, 2021, 2021, 
-                             2020, 2020, 2020],
-                    "Aggregate": [84.20, 84.10, 84.00, 83.90, 83.80, 83.70, 83.60, 83.50,
-                                  83.70, 83.60, 83.50]
-                }
-                df = pd.DataFrame(iiui_data)
-            elif uni_id == "air":
-                air_data = {
-                    "Program": [
-                        "Computer Science", 
-                        "Software Engineering", 
-                        "Business Administration", 
-                        "Electrical Engineering",
-                        "Computer Science", 
-                        "Software Engineering", 
-                        "Business Administration", 
-                        "Electrical Engineering",
-                        "Computer Science", 
-                        "Software Engineering"
-                    ],
-                    "Year": [2023, 2023, 2023, 2023, 
-                             2022, 2022, 2022, 2022,
-                             2021, 2021],
-                    "Merit Score": [75.5, 74.8, 72.3, 76.2,
-                                   74.8, 74.1, 71.8, 75.5,
-                                   74.2, 73.9]
-                }
-                df = pd.DataFrame(air_data)
-            else:
-                if uni_config.get("data_file"):
-                    df = pd.read_excel(uni_config["data_file"]) if str(uni_config["data_file"]).lower().endswith((".xlsx", ".xls")) else pd.read_csv(uni_config["data_file"])
-                else:
-                    df = None
+            table = get_merit_table(uni_id, uni_config, INLINE_MERIT_DATA.get(uni_id))
         except Exception as e:
-            print(f"Error loading {uni_config.get('data_file', 'data')}: {e}")
+            if (uni_id, str(e)) not in _reported_load_errors:
+                _reported_load_errors.add((uni_id, str(e)))
+                log.warning("merit data unavailable", extra={"fields": {"uni_id": uni_id, "data_file": uni_config.get("data_file"), "error": str(e)}})
             predicted_cutoff = None
             linear_r2 = None
             poly_r2 = None
@@ -461,41 +526,10 @@ def predict_admission():
             latest_cutoff = None
             latest_year = None
         else:
-            if df is not None:
-                latest_cutoff, latest_year = get_latest_cutoff(
-                    df, program, 
-                    "Percentage" if uni_id == "ned" else ("Merit Score" if uni_id == "air" else uni_config["cutoff_col"]), 
-                    "Year" if uni_id in ["ned", "iiui", "air"] else uni_config["year_col"],
-                    "Discipline" if uni_id in ["ned", "iiui"] else ("Program" if uni_id == "air" else uni_config.get("program_col", "Program"))
-                )
-                
-                Xy = prepare_training_data(
-                    df, program, 
-                    "Year" if uni_id in ["ned", "iiui", "air"] else uni_config["year_col"], 
-                    "Percentage" if uni_id == "ned" else ("Merit Score" if uni_id == "air" else uni_config["cutoff_col"]),
-                    "Discipline" if uni_id in ["ned", "iiui"] else ("Program" if uni_id == "air" else uni_config.get("program_col", "Program"))
+            if table is not None:
+                latest_cutoff, latest_year, predicted_cutoff, linear_r2, poly_r2, best_model = predict_program(
+                    table, program, target_year
                 )
-                
-                if Xy[0] is not None:
-                    X, y = Xy
-                    if len(X) == 1:
-                        if X[0][0] > 1900:
-                            current_year = X[0][0]
-                        else:
-                            current_year = 2021
-                        predicted_cutoff = predict_with_single_point(
-                            y[0], target_year, current_year, trend="increasing"
-                        )
-                        linear_r2 = None
-                        poly_r2 = None
-                        best_model = "single_point"
-                    else:
-                        predicted_cutoff, linear_r2, poly_r2, best_model = predict_cutoff(X, y, target_year)
-                else:
-                    predicted_cutoff = None
-                    linear_r2 = None
-                    poly_r2 = None
-                    best_model = None
             else:
                 predicted_cutoff = None
                 linear_r2 = None
@@ -528,8 +562,57 @@ def predict_admission():
         
         results["universities"].append(uni_result)
 
-    print("Final results:", results)
-    return jsonify(results)
+    log.info("predict", extra={"fields": {
+        "program": program,
+        "universities": len(results["universities"]),
+        "admitted": sum(1 for uni in results["universities"] if uni["admitted"])
+    }})
+    if sample_payload():
+        log.info("predict results", extra={"fields": {"results": results}})
+    # A new dict, since the results may still be waiting to be logged.
+    body = results
+    if fields is not None:
+        body = {**results, "universities": [project_result(uni, fields) for uni in results["universities"]]}
+        if compact:
+            body["criteria_url"] = "/universities"
+    with span("encode"):
+        return jsonify(body)
+
+def universities_payload():
+    universities = {}
+    for uni_id, uni in UNIVERSITIES.items():
+        o_a_level_totals = dict(uni["totals"])
+        if "matric" in o_a_level_totals:
+            o_a_level_totals["matric"] = O_A_LEVEL_MATRIC_TOTAL
+        universities[uni_id] = {
+            "id": uni_id,
+            "name": uni["name"],
+            "weights": uni["weights"],
+            "totals": uni["totals"],
+            "o_a_level_totals": o_a_level_totals,
+            "test_used": uni["test_used"]
+        }
+    return {
+        "status": "success",
+        "target_year": TARGET_YEAR,
+        "count": len(universities),
+        "universities": universities
+    }
+
+_universities_etag = None
+
+@app.route("/universities", methods=["GET"])
+def universities():
+    # Static admission criteria, the same for every /predict request; the
+    # ETag is computed once since UNIVERSITIES only changes at startup.
+    global _universities_etag
+    if _universities_etag is None:
+        _universities_etag = make_etag("universities", json.dumps(universities_payload(), sort_keys=True))
+    response = not_modified(_universities_etag)
+    if response is None:
+        response = cached_json_response(("universities",), _universities_etag, universities_payload)
+    response.headers["Cache-Control"] = f"public, max-age={UNIVERSITIES_MAX_AGE}"
+    return with_validators(response, _universities_etag)
 
 @app.route('/', methods=['GET'])
 def index():
@@ -537,6 +620,7 @@ def index():
         'status': 'success',
         'endpoints': {
             'Admission Prediction': '/predict',
+            'University Criteria': '/universities',
             'International Islamic University Islamabad (IIUI)': '/feesiiui',
             'UET Lahore': '/feesuet',
             'LUMS': '/feeslums',
@@ -549,11 +633,31 @@ def index():
             'NUST Scholarships': '/scholarshipsnust',
             'COMSATS Events': '/api/comsats_events',
             'NEDUET Events': '/api/neduet_events', 
-            'UET Taxila Events': '/api/uet_taxila_events'
+            'UET Taxila Events': '/api/uet_taxila_events',
+            'All Events': '/api/events?from=<YYYY-MM-DD>&to=<YYYY-MM-DD>&source=<name>',
+            'Events Calendar': '/api/events.ics',
+            'Events JSON Feed': '/api/events.json',
+            'Search': '/search?q=<terms>',
+            'Scholarship Deadlines': '/scholarships/deadlines?within=30d',
+            'Delta Sync': '/sync?since=<seq>',
+            'Fee History': '/fees/<uni_id>/history?version=<n>',
+            'Scraping Stats': '/scraping/stats',
+            'Stage Timings': '/timing/stats',
+            'Metrics': '/metrics',
+            **PLUGIN_ENDPOINTS
         },
+        'plugins': LOADED_PLUGINS,
         'note': 'All endpoints return JSON data. Use /predict for admission predictions and other endpoints for fee structures, scholarships, or events.'
     })
 
+def preload():
+    resolve_all()
+    preload_tables(UNIVERSITIES, INLINE_MERIT_DATA, lambda table, program_norm: predict_program(table, program_norm, TARGET_YEAR))
+    gc.collect()
+
+if PRELOAD:
+    preload()
+
 if __name__ == '__main__':
     port = int(os.environ.get('PORT', 5000))
     app.run(host='0.0.0.0', port=port, debug=False)
\ No newline at end of file
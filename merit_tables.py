@@ -0,0 +1,213 @@
+import math
+import os
+import re
+import threading
+from lazy_imports import lazy_module
+from timing import timed
+from metrics import record_data_reload
+
+
+np = lazy_module("numpy")
+pd = lazy_module("pandas")
+
+PREDICTION_CACHE_SIZE = 512
+
+_tables = {}
+_tables_lock = threading.Lock()
+
+def normalize(text):
+    if text is None or (isinstance(text, float) and math.isnan(text)):
+        return ""
+    return re.sub(r'\b(bs|bsc|bachelors|in|science|scien)\b', '', str(text).lower()).strip()
+
+def extract_year(year_str):
+    match = re.search(r'(\d{4})', str(year_str).replace(',', ''))
+    return int(match.group(1)) if match else None
+
+def _to_float(value):
+    if value is None:
+        return math.nan
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+class MeritTable:
+    # One university's merit rows as parallel arrays: normalized program
+    # names, extracted years and cutoffs, with NaN where a value is missing.
+    # Column names are None when the source has no such column.
+    __slots__ = ("uni_id", "program_col", "year_col", "cutoff_col", "norms", "years", "cutoffs", "predictions")
+
+    def __init__(self, uni_id, columns, program_col, year_col, cutoff_col):
+        self.uni_id = uni_id
+        self.program_col = program_col if program_col in columns else None
+        self.year_col = year_col if year_col and year_col in columns else None
+        self.cutoff_col = cutoff_col if cutoff_col in columns else None
+        size = len(next(iter(columns.values()))) if columns else 0
+        self.norms = tuple(normalize(v) for v in columns[self.program_col]) if self.program_col else ()
+        years = [extract_year(v) for v in columns[self.year_col]] if self.year_col else [None] * size
+        self.years = np.array([math.nan if year is None else year for year in years], dtype=float)
+        self.cutoffs = np.array([_to_float(v) for v in columns[self.cutoff_col]] if self.cutoff_col else [math.nan] * size, dtype=float)
+        self.predictions = {}
+
+    @timed("match")
+    def match(self, program_norm):
+        pattern = re.compile(program_norm)
+        return np.array([i for i, norm in enumerate(self.norms) if pattern.search(norm)], dtype=np.intp)
+
+
+def _inline_columns(spec):
+    columns = spec["columns"]
+    if not spec.get("melt"):
+        return columns
+    id_col, var_name, value_name = spec["melt"]
+    value_cols = [name for name in columns if name != id_col]
+    ids = columns[id_col]
+    return {
+        id_col: [ids[i] for _ in value_cols for i in range(len(ids))],
+        var_name: [int(name) for name in value_cols for _ in ids],
+        value_name: [columns[name][i] for name in value_cols for i in range(len(ids))]
+    }
+
+def _read_file(path):
+    df = pd.read_excel(path) if str(path).lower().endswith((".xlsx", ".xls")) else pd.read_csv(path)
+    return {name: df[name].tolist() for name in df.columns}
+
+def merit_columns(uni_config, inline_spec=None):
+    if inline_spec:
+        return inline_spec["cutoff_col"], inline_spec["year_col"], inline_spec["program_col"]
+    return uni_config["cutoff_col"], uni_config["year_col"], uni_config.get("program_col", "Program")
+
+@timed("load")
+def get_merit_table(uni_id, uni_config, inline_spec=None):
+    # Tables are built once per process and rebuilt only when the data file
+    # changes on disk; pandas is only touched here, at ingest.
+    if inline_spec:
+        stamp = id(inline_spec)
+    elif uni_config.get("data_file"):
+        stamp = os.stat(uni_config["data_file"]).st_mtime_ns
+    else:
+        return None
+    cached = _tables.get(uni_id)
+    if cached and cached[0] == stamp:
+        return cached[1]
+    with _tables_lock:
+        cached = _tables.get(uni_id)
+        if cached and cached[0] == stamp:
+            return cached[1]
+        columns = _inline_columns(inline_spec) if inline_spec else _read_file(uni_config["data_file"])
+        cutoff_col, year_col, program_col = merit_columns(uni_config, inline_spec)
+        table = MeritTable(uni_id, columns, program_col, year_col, cutoff_col)
+        _tables[uni_id] = (stamp, table)
+        record_data_reload(uni_id)
+        return table
+
+@timed("latest_cutoff")
+def get_latest_cutoff(table, program_norm):
+    if table.program_col is None:
+        return None, None
+    rows = table.match(program_norm)
+    if not len(rows):
+        return None, None
+
+    if table.year_col:
+        dated = rows[~np.isnan(table.years[rows])]
+        if len(dated):
+            latest = dated[np.argmax(table.years[dated])]
+            if table.cutoff_col is None:
+                raise KeyError(table.cutoff_col)
+            return float(table.cutoffs[latest]), int(table.years[latest])
+
+    # Programs listed without a usable year fall back to their first row.
+    val = table.cutoffs[rows[0]]
+    return (float(val), None) if not np.isnan(val) else (None, None)
+
+@timed("training_data")
+def prepare_training_data(table, program_norm):
+    if table.program_col is None or table.cutoff_col is None:
+        return None, None
+    rows = table.match(program_norm)
+    if not len(rows):
+        return None, None
+
+    if table.year_col:
+        rows = rows[~np.isnan(table.years[rows]) & ~np.isnan(table.cutoffs[rows])]
+        if len(rows):
+            return table.years[rows].astype(int).reshape(-1, 1), table.cutoffs[rows]
+
+    rows = rows[~np.isnan(table.cutoffs[rows])]
+    if len(rows) >= 2:
+        return np.arange(len(rows)).reshape(-1, 1), table.cutoffs[rows]
+    elif len(rows) == 1:
+        return np.array([[0]]), table.cutoffs[rows]
+
+    return None, None
+
+def cached_prediction(table, key, compute):
+    # Cutoff predictions depend only on the table and the program, never on
+    # the applicant's marks, so each program is fitted once per table.
+    result = table.predictions.get(key)
+    if result is None:
+        result = compute()
+        if len(table.predictions) >= PREDICTION_CACHE_SIZE:
+            table.predictions.clear()
+        table.predictions[key] = result
+    return result
+
+def _pack_tables():
+    # Copy every table's years and cutoffs into one contiguous read-only
+    # buffer, and its normalized program names into a second one of fixed
+    # width strings, and point the tables at views of them. Built in the
+    # master before forking, the data then lives in pages that no worker ever
+    # writes to; a tuple of str objects would be written to on every read, as
+    # each access changes the strings' reference counts.
+    tables = [table for _, table in _tables.values()]
+    packed = np.concatenate([table.years for table in tables] + [table.cutoffs for table in tables])
+    packed.flags.writeable = False
+    norms = np.concatenate([np.array(table.norms, dtype=str) for table in tables])
+    norms.flags.writeable = False
+    offset = 0
+    for table in tables:
+        table.years = packed[offset:offset + len(table.years)]
+        offset += len(table.years)
+    for table in tables:
+        table.cutoffs = packed[offset:offset + len(table.cutoffs)]
+        offset += len(table.cutoffs)
+    offset = 0
+    for table in tables:
+        size = len(table.norms)
+        table.norms = norms[offset:offset + size]
+        offset += size
+    return packed, norms
+
+def detach_predictions():
+    # Called in each worker right after fork. Every new fit writes to the
+    # table's prediction cache, so each worker gets its own dict, seeded with
+    # the predictions fitted in the master, instead of writing to the shared one.
+    for _, table in _tables.values():
+        table.predictions = dict(table.predictions)
+
+def preload_tables(universities, inline_data, warm=None):
+    # Build every table up front and, when given, run warm(table, program_norm)
+    # for each program the table knows so predictions are fitted before fork.
+    loaded = {}
+    for uni_id, uni_config in universities.items():
+        try:
+            table = get_merit_table(uni_id, uni_config, inline_data.get(uni_id))
+        except Exception as e:
+            print(f"Error preloading merit data for {uni_id}: {e}")
+            continue
+        if table is None:
+            continue
+        loaded[uni_id] = table
+        if warm:
+            for program_norm in dict.fromkeys(table.norms):
+                try:
+                    warm(table, program_norm)
+                except Exception as e:
+                    print(f"Error preloading {uni_id} prediction for {program_norm!r}: {e}")
+    with _tables_lock:
+        if _tables:
+            _pack_tables()
+    return loaded
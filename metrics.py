@@ -0,0 +1,88 @@
+import os
+import time
+from flask import Blueprint, Response, g, request
+from prometheus_client import CollectorRegistry, Counter, Histogram, CONTENT_TYPE_LATEST, generate_latest, multiprocess
+
+
+metrics_bp = Blueprint('metrics', __name__)
+
+# With PROMETHEUS_MULTIPROC_DIR set (gunicorn.conf.py does this), every worker
+# writes its samples to files in that directory and /metrics merges them, so
+# any worker answers for the whole server. Without it, /metrics covers only
+# the process that serves it.
+MULTIPROCESS = bool(os.environ.get("PROMETHEUS_MULTIPROC_DIR"))
+FETCH_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+REQUEST_LATENCY = Histogram(
+    "scholar_http_request_duration_seconds", "Time spent serving a request, by Flask route",
+    ["route", "method", "status"]
+)
+UPSTREAM_LATENCY = Histogram(
+    "scholar_upstream_fetch_duration_seconds", "Time spent fetching an upstream page, by host",
+    ["host"], buckets=FETCH_BUCKETS
+)
+UPSTREAM_FETCHES = Counter(
+    "scholar_upstream_fetches_total", "Upstream fetches by host and HTTP status (error: no response, throttled: not sent)",
+    ["host", "status"]
+)
+# outcome is hit, miss or stale; scraped fee and scholarship entries are only
+# read when a live fetch fails, so they count refresh, stale (fallback served)
+# or miss (nothing to fall back to), plus hit when a revalidating client was
+# answered 304 without a fetch.
+CACHE_REQUESTS = Counter(
+    "scholar_cache_requests_total", "Cache lookups by cache key and outcome",
+    ["cache", "outcome"]
+)
+MODEL_FITS = Counter(
+    "scholar_model_fits_total", "Cutoff predictions fitted, by university",
+    ["university"]
+)
+DATA_RELOADS = Counter(
+    "scholar_data_reloads_total", "Merit tables built from their data source, by university",
+    ["university"]
+)
+LOG_DROPS = Counter(
+    "scholar_log_records_dropped_total", "Log records dropped because the log queue was full"
+)
+
+def record_fetch(host, status, seconds=None):
+    UPSTREAM_FETCHES.labels(host, str(status)).inc()
+    if seconds is not None:
+        UPSTREAM_LATENCY.labels(host).observe(seconds)
+
+def record_cache(cache, outcome):
+    CACHE_REQUESTS.labels(cache, outcome).inc()
+
+def record_model_fit(uni_id):
+    MODEL_FITS.labels(uni_id).inc()
+
+def record_data_reload(uni_id):
+    DATA_RELOADS.labels(uni_id).inc()
+
+def record_log_drop():
+    LOG_DROPS.inc()
+
+
+@metrics_bp.before_app_request
+def start_request_clock():
+    g.metrics_started = time.perf_counter()
+
+@metrics_bp.after_app_request
+def observe_request(response):
+    started = g.pop("metrics_started", None)
+    if started is not None:
+        # Labelled by the matched rule, not the path, to keep the series bounded.
+        route = request.url_rule.rule if request.url_rule else "unmatched"
+        REQUEST_LATENCY.labels(route, request.method, str(response.status_code)).observe(time.perf_counter() - started)
+    return response
+
+
+@metrics_bp.route('/metrics', methods=['GET'])
+def metrics():
+    if MULTIPROCESS:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        body = generate_latest(registry)
+    else:
+        body = generate_latest()
+    return Response(body, content_type=CONTENT_TYPE_LATEST)
@@ -0,0 +1,37 @@
+import os
+
+
+# Optional feature sets. Each plugin may add universities (merged into the
+# /predict and fee registry), inline merit data, blueprints and index entries.
+# SCHOLAR_PLUGINS selects them as a comma-separated list; unset enables all.
+PLUGINS = {}
+
+def register_plugin(name, universities=None, merit_data=None, blueprints=(), endpoints=None):
+    PLUGINS[name] = {
+        "universities": universities or {},
+        "merit_data": merit_data or {},
+        "blueprints": list(blueprints),
+        "endpoints": endpoints or {}
+    }
+
+def enabled_plugins():
+    configured = os.environ.get("SCHOLAR_PLUGINS")
+    if configured is None:
+        return list(PLUGINS)
+    names = [name.strip() for name in configured.split(",") if name.strip()]
+    for name in names:
+        if name not in PLUGINS:
+            print(f"Error loading plugin {name}: not registered")
+    return [name for name in names if name in PLUGINS]
+
+def load_plugins(app, universities, merit_data, endpoints):
+    loaded = []
+    for name in enabled_plugins():
+        plugin = PLUGINS[name]
+        universities.update(plugin["universities"])
+        merit_data.update(plugin["merit_data"])
+        endpoints.update(plugin["endpoints"])
+        for blueprint in plugin["blueprints"]:
+            app.register_blueprint(blueprint)
+        loaded.append(name)
+    return loaded
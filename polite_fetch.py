@@ -0,0 +1,206 @@
+import os
+import time
+import uuid
+from urllib.parse import urlsplit
+from flask import Blueprint, jsonify
+from db import get_connection
+from lazy_imports import lazy_module
+from timing import timed
+from metrics import record_fetch
+
+
+fetch_stats_bp = Blueprint('fetch_stats', __name__)
+
+requests = lazy_module('requests')
+
+# rate is sustained requests per second, burst is the bucket size and
+# concurrency the number of in-flight requests allowed across all workers.
+DEFAULT_HOST_LIMIT = {"rate": 2.0, "burst": 4, "concurrency": 4}
+HOST_LIMITS = {
+    "ilmkidunya.com": {"rate": 0.5, "burst": 3, "concurrency": 2}
+}
+MAX_QUEUE_WAIT = float(os.environ.get("SCRAPE_MAX_QUEUE_WAIT", 10))
+SLOT_POLL_INTERVAL = 0.05
+SLOT_LEASE_GRACE = 5
+# Sends every fetch to a stand-in server instead of the real site, with the
+# original host as the first path segment (see benchmarks/mock_upstream.py).
+# Rate limits and stats still apply to the original host.
+UPSTREAM_OVERRIDE = os.environ.get("SCRAPE_UPSTREAM_URL", "").rstrip("/")
+
+_schema_pids = set()
+
+class RateLimited(Exception):
+    pass
+
+def _ensure_schema(conn):
+    if os.getpid() in _schema_pids:
+        return
+    with conn:
+        conn.execute("CREATE TABLE IF NOT EXISTS host_buckets (host TEXT PRIMARY KEY, tokens REAL NOT NULL, updated_at REAL NOT NULL)")
+        conn.execute("CREATE TABLE IF NOT EXISTS host_slots (slot_id TEXT PRIMARY KEY, host TEXT NOT NULL, expires_at REAL NOT NULL)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_host_slots_host ON host_slots (host)")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS host_stats ("
+            "host TEXT PRIMARY KEY, requests INTEGER NOT NULL DEFAULT 0, errors INTEGER NOT NULL DEFAULT 0, "
+            "throttled INTEGER NOT NULL DEFAULT 0, wait_seconds REAL NOT NULL DEFAULT 0, "
+            "fetch_seconds REAL NOT NULL DEFAULT 0, bytes INTEGER NOT NULL DEFAULT 0, "
+            "last_status INTEGER, first_request_at REAL, last_request_at REAL)"
+        )
+    _schema_pids.add(os.getpid())
+
+
+def host_for(url):
+    host = (urlsplit(url).hostname or "").lower()
+    return host[4:] if host.startswith("www.") else host
+
+def upstream_url(url):
+    if not UPSTREAM_OVERRIDE:
+        return url
+    parts = urlsplit(url)
+    return f"{UPSTREAM_OVERRIDE}/{parts.netloc}{parts.path or '/'}" + (f"?{parts.query}" if parts.query else "")
+
+def set_host_limit(host, rate=None, burst=None, concurrency=None):
+    limit = dict(HOST_LIMITS.get(host, DEFAULT_HOST_LIMIT))
+    if rate is not None:
+        limit["rate"] = rate
+    if burst is not None:
+        limit["burst"] = burst
+    if concurrency is not None:
+        limit["concurrency"] = concurrency
+    HOST_LIMITS[host] = limit
+
+def _acquire_slot(conn, host, limit, deadline, lease):
+    slot_id = uuid.uuid4().hex
+    while True:
+        now = time.time()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute("DELETE FROM host_slots WHERE host = ? AND expires_at < ?", (host, now))
+            active = conn.execute("SELECT COUNT(*) FROM host_slots WHERE host = ?", (host,)).fetchone()[0]
+            if active < limit["concurrency"]:
+                conn.execute("INSERT INTO host_slots (slot_id, host, expires_at) VALUES (?, ?, ?)", (slot_id, host, now + lease))
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        if active < limit["concurrency"]:
+            return slot_id
+        if now >= deadline:
+            return None
+        time.sleep(SLOT_POLL_INTERVAL)
+
+def _release_slot(conn, slot_id):
+    with conn:
+        conn.execute("DELETE FROM host_slots WHERE slot_id = ?", (slot_id,))
+
+def _reserve_token(conn, host, limit, max_wait):
+    # Tokens may go negative: each caller reserves its place in the queue and
+    # sleeps until its token would have been refilled.
+    now = time.time()
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        row = conn.execute("SELECT tokens, updated_at FROM host_buckets WHERE host = ?", (host,)).fetchone()
+        if row is None:
+            tokens = float(limit["burst"])
+        else:
+            tokens = min(float(limit["burst"]), row["tokens"] + (now - row["updated_at"]) * limit["rate"])
+        wait = 0.0 if tokens >= 1 else (1 - tokens) / limit["rate"]
+        if wait > max_wait:
+            conn.execute("ROLLBACK")
+            return None
+        conn.execute("INSERT OR REPLACE INTO host_buckets (host, tokens, updated_at) VALUES (?, ?, ?)", (host, tokens - 1, now))
+        conn.execute("COMMIT")
+        return wait
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+
+def _record_stats(conn, host, throttled=False, error=False, wait=0.0, elapsed=0.0, size=0, status=None):
+    now = time.time()
+    with conn:
+        conn.execute(
+            "INSERT INTO host_stats (host, requests, errors, throttled, wait_seconds, fetch_seconds, bytes, last_status, first_request_at, last_request_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT(host) DO UPDATE SET requests = requests + excluded.requests, errors = errors + excluded.errors, "
+            "throttled = throttled + excluded.throttled, wait_seconds = wait_seconds + excluded.wait_seconds, "
+            "fetch_seconds = fetch_seconds + excluded.fetch_seconds, bytes = bytes + excluded.bytes, "
+            "last_status = COALESCE(excluded.last_status, last_status), last_request_at = excluded.last_request_at",
+            (host, 0 if throttled else 1, int(error), int(throttled), wait, elapsed, size, status, now, now)
+        )
+    if throttled:
+        record_fetch(host, "throttled")
+    else:
+        record_fetch(host, "error" if status is None else status, elapsed)
+
+@timed("fetch")
+def polite_get(url, headers=None, timeout=30, max_wait=None):
+    host = host_for(url)
+    limit = HOST_LIMITS.get(host, DEFAULT_HOST_LIMIT)
+    max_wait = MAX_QUEUE_WAIT if max_wait is None else max_wait
+    conn = get_connection()
+    _ensure_schema(conn)
+    started = time.time()
+    # The slot is held while waiting for a token (up to max_wait) and then
+    # fetching (up to timeout), so the lease must outlast both.
+    slot_id = _acquire_slot(conn, host, limit, started + max_wait, max_wait + timeout + SLOT_LEASE_GRACE)
+    if slot_id is None:
+        _record_stats(conn, host, throttled=True, wait=time.time() - started)
+        raise RateLimited(f"Concurrency budget for {host} exhausted")
+    try:
+        wait = _reserve_token(conn, host, limit, max(0.0, started + max_wait - time.time()))
+        if wait is None:
+            _record_stats(conn, host, throttled=True, wait=time.time() - started)
+            raise RateLimited(f"Request rate budget for {host} exhausted")
+        if wait > 0:
+            time.sleep(wait)
+        queued = time.time() - started
+        fetch_start = time.time()
+        try:
+            response = requests.get(upstream_url(url), headers=headers, timeout=timeout)
+        except Exception:
+            _record_stats(conn, host, error=True, wait=queued, elapsed=time.time() - fetch_start)
+            raise
+        _record_stats(
+            conn, host, error=response.status_code >= 400, wait=queued, elapsed=time.time() - fetch_start,
+            size=len(response.content), status=response.status_code
+        )
+        return response
+    finally:
+        _release_slot(conn, slot_id)
+
+def host_stats():
+    conn = get_connection()
+    _ensure_schema(conn)
+    now = time.time()
+    stats = {}
+    for row in conn.execute("SELECT * FROM host_stats ORDER BY host").fetchall():
+        elapsed_minutes = max((now - row["first_request_at"]) / 60, 1 / 60)
+        limit = HOST_LIMITS.get(row["host"], DEFAULT_HOST_LIMIT)
+        stats[row["host"]] = {
+            "requests": row["requests"],
+            "errors": row["errors"],
+            "throttled": row["throttled"],
+            "bytes": row["bytes"],
+            "avg_fetch_ms": round(row["fetch_seconds"] / row["requests"] * 1000, 2) if row["requests"] else None,
+            "avg_queue_wait_ms": round(row["wait_seconds"] / (row["requests"] + row["throttled"]) * 1000, 2) if row["requests"] + row["throttled"] else None,
+            "requests_per_minute": round(row["requests"] / elapsed_minutes, 3),
+            "last_status": row["last_status"],
+            "last_request_at": row["last_request_at"],
+            "limit": limit
+        }
+    return stats
+
+
+@fetch_stats_bp.route('/scraping/stats', methods=['GET'])
+def scraping_stats():
+    try:
+        stats = host_stats()
+    except Exception as e:
+        return jsonify({
+            "status": "error",
+            "message": str(e)
+        }), 500
+    return jsonify({
+        "status": "success",
+        "hosts": stats
+    })
@@ -0,0 +1,144 @@
+import gzip
+import importlib.util
+import json
+import os
+import threading
+from flask import Blueprint, current_app, request
+from flask.json.provider import DefaultJSONProvider
+from lazy_imports import lazy_module
+
+
+encoding_bp = Blueprint('response_encoding', __name__)
+
+# orjson and brotli are optional: without orjson bodies are encoded by the
+# json module, without brotli only gzip is offered.
+orjson = lazy_module("orjson") if importlib.util.find_spec("orjson") else None
+brotli = lazy_module("brotli") if importlib.util.find_spec("brotli") else None
+
+# Bodies smaller than this go out as they are; compressing them saves less
+# than the headers cost.
+COMPRESS_MIN_BYTES = int(os.environ.get("SCHOLAR_COMPRESS_MIN_BYTES", 1024))
+COMPRESSIBLE_TYPES = ("application/json", "application/feed+json", "text/")
+ENCODINGS = ["br", "gzip"] if brotli else ["gzip"]
+# Levels for bodies compressed per response, and for cached bodies that are
+# compressed once per version and can afford the slowest setting.
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+CACHED_GZIP_LEVEL = 9
+CACHED_BROTLI_QUALITY = 11
+ENCODED_CACHE_SIZE = 256
+
+_encoded = {}
+_encoded_lock = threading.Lock()
+
+
+def _default(o):
+    # NumPy scalars and arrays, without importing NumPy to check for them.
+    if type(o).__module__ == "numpy" and hasattr(o, "tolist"):
+        return o.tolist()
+    return DefaultJSONProvider.default(o)
+
+def _orjson_options(indent=False):
+    # Sorted keys and dates as HTTP dates, like jsonify has always sent.
+    options = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_SORT_KEYS
+    return (options | orjson.OPT_INDENT_2) if indent else options
+
+def dumps_bytes(obj):
+    if orjson is not None:
+        return orjson.dumps(obj, default=_default, option=_orjson_options())
+    return json.dumps(obj, default=_default, ensure_ascii=False, separators=(",", ":"), sort_keys=True).encode("utf-8")
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    def dumps(self, obj, **kwargs):
+        if orjson is None or kwargs:
+            kwargs.setdefault("default", _default)
+            return super().dumps(obj, **kwargs)
+        return orjson.dumps(obj, default=_default, option=_orjson_options()).decode("utf-8")
+
+    def response(self, *args, **kwargs):
+        if orjson is None:
+            return super().response(*args, **kwargs)
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        body = orjson.dumps(obj, default=_default, option=_orjson_options(indent))
+        return self._app.response_class(body + b"\n", mimetype=self.mimetype)
+
+
+def compress(body, encoding, cached=False):
+    if encoding == "br":
+        return brotli.compress(body, quality=CACHED_BROTLI_QUALITY if cached else BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=CACHED_GZIP_LEVEL if cached else GZIP_LEVEL, mtime=0)
+
+def negotiate():
+    # The client's preferred encoding among the ones on offer, brotli first
+    # on a tie; None means send the body as it is.
+    return request.accept_encodings.best_match(ENCODINGS)
+
+def compressible(response):
+    mimetype = response.mimetype or ""
+    return (
+        response.status_code == 200
+        and not response.direct_passthrough
+        and not response.is_streamed
+        and "Content-Encoding" not in response.headers
+        and mimetype.startswith(COMPRESSIBLE_TYPES)
+    )
+
+
+class EncodedBody:
+    # A serialized body plus its compressed forms, each made on first request.
+    __slots__ = ("body", "encoded")
+
+    def __init__(self, body):
+        self.body = body
+        self.encoded = {}
+
+    def get(self, encoding):
+        if encoding is None or len(self.body) < COMPRESS_MIN_BYTES:
+            return self.body, None
+        data = self.encoded.get(encoding)
+        if data is None:
+            data = self.encoded[encoding] = compress(self.body, encoding, cached=True)
+        return data, encoding
+
+def encoded_response(encoded_body, content_type, status=200):
+    data, encoding = encoded_body.get(negotiate())
+    response = current_app.response_class(data, status=status, content_type=content_type)
+    if encoding:
+        response.headers["Content-Encoding"] = encoding
+    if len(encoded_body.body) >= COMPRESS_MIN_BYTES:
+        response.vary.add("Accept-Encoding")
+    return response
+
+def cached_json_response(key, version, build, status=200):
+    # For routes whose payload only changes with a stored version: the body
+    # is serialized and compressed once per version, then served as bytes.
+    entry = _encoded.get(key)
+    if entry is None or entry[0] != version:
+        entry = (version, EncodedBody(dumps_bytes(build()) + b"\n"))
+        with _encoded_lock:
+            if len(_encoded) >= ENCODED_CACHE_SIZE:
+                _encoded.clear()
+            _encoded[key] = entry
+    return encoded_response(entry[1], "application/json", status)
+
+
+@encoding_bp.after_app_request
+def compress_response(response):
+    if compressible(response):
+        body = response.get_data()
+        if len(body) >= COMPRESS_MIN_BYTES:
+            response.vary.add("Accept-Encoding")
+            encoding = negotiate()
+            if encoding:
+                response.set_data(compress(body, encoding))
+                response.headers["Content-Encoding"] = encoding
+    if "Content-Encoding" in response.headers:
+        # The compressed bytes differ from the identity body, so a strong
+        # validator would no longer be byte-exact; weak comparison still
+        # lets If-None-Match match it.
+        etag, weak = response.get_etag()
+        if etag and not weak:
+            response.set_etag(etag, weak=True)
+    return response
@@ -1,33 +1,38 @@
-from flask import Flask, jsonify
-from flask_cors import CORS
-import requests
-from bs4 import BeautifulSoup
+from flask import Blueprint, jsonify
+from lazy_imports import lazy_attr
+from timing import timed
+from html_sections import walk_section, heading_stop
+from polite_fetch import polite_get
+from plugins import register_plugin
+from web_scraping import store_scholarship, scholarship_fallback
+from conditional import conditional_scrape
+
+BeautifulSoup = timed("parse")(lazy_attr("bs4", "BeautifulSoup"))
+
+
+scholarships_bp = Blueprint('scholarships', __name__)
 
-app = Flask(__name__)
-CORS(app)  # Enable CORS so it can run on any device / frontend
 
-# -----------------------
-# SI Scholarship for Global Professionals Scraper
-# -----------------------
 SISGP_URL = "https://www.ilmkidunya.com/scholarships/sisgp-scholarships"
-@app.route("/sisgp", methods=["GET"])
+@scholarships_bp.route("/sisgp", methods=["GET"])
+@conditional_scrape("sisgp_scholarship")
 def scrape_sisgp():
     try:
-        response = requests.get(SISGP_URL, headers={"User-Agent": "Mozilla/5.0"})
+        response = polite_get(SISGP_URL, headers={"User-Agent": "Mozilla/5.0"})
         response.raise_for_status()
         soup = BeautifulSoup(response.text, "html.parser")
 
-        # Title
+  
         title = soup.find("h1")
         title_text = title.get_text(strip=True) if title else "No Title Found"
 
-        # Introduction - first few paragraphs after title
+        
         intro_paragraphs = []
         intro_p = soup.find("p")
         if intro_p:
             intro_paragraphs = [p.get_text(strip=True) for p in intro_p.find_all_next("p", limit=3) if len(p.get_text(strip=True)) > 50]
 
-        # Why Pakistani Professionals Should Apply
+  
         why_apply_points = []
         why_section = soup.find("h2", string=lambda t: t and "Why Pakistani Professionals Should Apply" in t)
         if why_section:
@@ -35,7 +40,7 @@ def scrape_sisgp():
             if ul:
                 why_apply_points = [li.get_text(strip=True) for li in ul.find_all("li")]
 
-        # Eligibility Criteria
+  
         eligibility_points = []
         eligibility_section = soup.find("h2", string=lambda t: t and "Eligibility Criteria" in t)
         if eligibility_section:
@@ -43,7 +48,7 @@ def scrape_sisgp():
             if ul:
                 eligibility_points = [li.get_text(strip=True) for li in ul.find_all("li")]
 
-        # What Does the Scholarship Cover?
+
         coverage_points = []
         coverage_section = soup.find("h2", string=lambda t: t and "What Does the Scholarship Cover?" in t)
         if coverage_section:
@@ -51,7 +56,7 @@ def scrape_sisgp():
             if ul:
                 coverage_points = [li.get_text(strip=True) for li in ul.find_all("li")]
 
-        # How to Apply
+ 
         apply_steps = []
         apply_section = soup.find("h2", string=lambda t: t and "How to Apply" in t)
         if apply_section:
@@ -59,11 +64,11 @@ def scrape_sisgp():
             if ol:
                 apply_steps = [li.get_text(strip=True) for li in ol.find_all("li")]
             else:
-                # Fallback to paragraphs
+      
                 steps = apply_section.find_all_next("p", limit=10)
                 apply_steps = [s.get_text(strip=True) for s in steps if len(s.get_text(strip=True)) > 30 and any(num in s.get_text() for num in ['1.', '2.', '3.', '4.'])]
 
-        # Key Dates
+
         dates = []
         dates_section = soup.find("h2", string=lambda t: t and "Key Dates" in t)
         if dates_section:
@@ -71,7 +76,7 @@ def scrape_sisgp():
             if ul:
                 dates = [li.get_text(strip=True) for li in ul.find_all("li")]
 
-        # Benefits
+
         benefits_points = []
         benefits_section = soup.find("h2", string=lambda t: t and "Benefits" in t)
         if benefits_section:
@@ -79,27 +84,27 @@ def scrape_sisgp():
             if ul:
                 benefits_points = [li.get_text(strip=True) for li in ul.find_all("li")]
 
-        # Final Thoughts
+
         final_thoughts = []
         final_section = soup.find("h2", string=lambda t: t and "Final Thoughts" in t)
         if final_section:
             final_paragraphs = final_section.find_all_next("p", limit=3)
             final_thoughts = [p.get_text(strip=True) for p in final_paragraphs if len(p.get_text(strip=True)) > 30]
 
-        # Social Media Sharing Buttons
+  
         sharing_buttons = []
         sharing_section = soup.find_all("button", string=lambda t: t and any(platform in t.lower() for platform in ["whatsapp", "facebook", "twitter", "linkedin", "pinterest", "email"]))
         if sharing_section:
             sharing_buttons = [btn.get_text(strip=True).lower() for btn in sharing_section]
 
-        # Feedback Options
+      
         feedback_options = []
         feedback_section = soup.find("div", string=lambda t: t and "Is this page helpful?" in t)
         if feedback_section:
             feedback_buttons = feedback_section.find_all_next("button", limit=2)
             feedback_options = [btn.get_text(strip=True) for btn in feedback_buttons if btn.get_text(strip=True) in ["Yes", "No"]]
 
-        # Community and Subscription Info
+        
         community_info = []
         community_sections = soup.find_all("p", string=lambda t: t and any(keyword in t.lower() for keyword in ["followers", "subscribers", "join", "follow us"]))
         for section in community_sections:
@@ -122,20 +127,19 @@ def scrape_sisgp():
             "community_info": community_info
         }
 
+        store_scholarship("sisgp_scholarship", data)
         return jsonify(data)
 
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
+        return scholarship_fallback("sisgp_scholarship", e)
 
-# -----------------------
-# Türkiye Burslari Scraper
-# -----------------------
-TURKIYE_URL = "https://www.ilmkidunya.com/scholarships/turkiye-burslari-scholarships"
 
-@app.route("/turkiye", methods=["GET"])
+TURKIYE_URL = "https://www.ilmkidunya.com/scholarships/turkiye-burslari-scholarships"
+@scholarships_bp.route("/turkiye", methods=["GET"])
+@conditional_scrape("turkiye_scholarship")
 def scrape_turkiye():
     try:
-        response = requests.get(TURKIYE_URL, headers={"User-Agent": "Mozilla/5.0"})
+        response = polite_get(TURKIYE_URL, headers={"User-Agent": "Mozilla/5.0"})
         response.raise_for_status()
         soup = BeautifulSoup(response.text, "html.parser")
 
@@ -143,11 +147,11 @@ def scrape_turkiye():
         title = soup.find("h1")
         title_text = title.get_text(strip=True) if title else "No Title Found"
 
-        # Introduction - first paragraph after title
+       
         intro_p = soup.find("p")
         intro_text = intro_p.get_text(strip=True) if intro_p else "No Intro Found"
 
-        # Why Game-Changer - section
+        
         why_section = soup.find("h2", string=lambda t: t and "Why Türkiye Scholarships Are a Game-Changer" in t)
         why_points = []
         if why_section:
@@ -155,36 +159,35 @@ def scrape_turkiye():
             if ul:
                 why_points = [li.get_text(strip=True) for li in ul.find_all("li")]
 
-        # Eligibility
         eligibility_academic = []
         eligibility_age = []
         eligibility_other = []
         eligibility_section = soup.find("h2", string=lambda t: t and "Who is Eligible?" in t)
         if eligibility_section:
-            # Academic
+          
             academic_h3 = eligibility_section.find_next("h3", string=lambda t: t and "Academic Requirements" in t)
             if academic_h3:
                 ul = academic_h3.find_next("ul")
                 if ul:
                     eligibility_academic = [li.get_text(strip=True) for li in ul.find_all("li")]
-            # Age
+          
             age_h3 = eligibility_section.find_next("h3", string=lambda t: t and "Age Limits" in t)
             if age_h3:
                 ul = age_h3.find_next("ul")
                 if ul:
                     eligibility_age = [li.get_text(strip=True) for li in ul.find_all("li")]
-            # Other
+          
             other_h3 = eligibility_section.find_next("h3", string=lambda t: t and "Other Requirements" in t)
             if other_h3:
                 ul = other_h3.find_next("ul")
                 if ul:
                     eligibility_other = [li.get_text(strip=True) for li in ul.find_all("li")]
 
-        # Benefits - table
+       
         benefits_table = soup.find("table")
         benefits = {}
         if benefits_table:
-            rows = benefits_table.find_all("tr")[1:]  # skip header
+            rows = benefits_table.find_all("tr")[1:]  
             for row in rows:
                 cols = row.find_all("td")
                 if len(cols) == 2:
@@ -192,7 +195,7 @@ def scrape_turkiye():
                     value = cols[1].get_text(strip=True)
                     benefits[key] = value
 
-        # How to Apply
+       
         apply_steps = []
         apply_section = soup.find("h2", string=lambda t: t and "How to Apply" in t)
         if apply_section:
@@ -200,11 +203,11 @@ def scrape_turkiye():
             if ol:
                 apply_steps = [li.get_text(strip=True) for li in ol.find_all("li")]
             else:
-                # fallback to paragraphs
+               
                 steps = apply_section.find_all_next("p", limit=10)
                 apply_steps = [s.get_text(strip=True) for s in steps if len(s.get_text(strip=True)) > 30 and any(num in s.get_text() for num in ['1.', '2.', '3.', '4.'])]
 
-        # Selection Process
+       
         selection_steps = []
         selection_section = soup.find("h2", string=lambda t: t and "Selection Process" in t)
         if selection_section:
@@ -212,7 +215,7 @@ def scrape_turkiye():
             if ul:
                 selection_steps = [li.get_text(strip=True) for li in ul.find_all("li")]
 
-        # Key Dates
+       
         dates = []
         dates_section = soup.find("h2", string=lambda t: t and "Key Dates" in t)
         if dates_section:
@@ -220,7 +223,7 @@ def scrape_turkiye():
             if ul:
                 dates = [li.get_text(strip=True) for li in ul.find_all("li")]
 
-        # Why Study in Turkey
+   
         why_turkey_points = []
         why_turkey_section = soup.find("h2", string=lambda t: t and "Why Study in Turkey?" in t)
         if why_turkey_section:
@@ -244,41 +247,40 @@ def scrape_turkiye():
             "why_study_turkey": why_turkey_points
         }
 
+        store_scholarship("turkiye_scholarship", data)
         return jsonify(data)
 
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
+        return scholarship_fallback("turkiye_scholarship", e)
 
-# -----------------------
-# Stipendium Hungaricum Scraper
-# -----------------------
-STIPENDIUM_URL = "https://www.ilmkidunya.com/scholarships/stipendium-hungaricum-scholarships"
 
-@app.route("/hungary", methods=["GET"])
+STIPENDIUM_URL = "https://www.ilmkidunya.com/scholarships/stipendium-hungaricum-scholarships"
+@scholarships_bp.route("/hungary", methods=["GET"])
+@conditional_scrape("stipendium_scholarship")
 def scrape_stipendium():
     try:
-        response = requests.get(STIPENDIUM_URL, headers={"User-Agent": "Mozilla/5.0"})
+        response = polite_get(STIPENDIUM_URL, headers={"User-Agent": "Mozilla/5.0"})
         response.raise_for_status()
         soup = BeautifulSoup(response.text, "html.parser")
 
-        # Title
+       
         title = soup.find("h1")
         title_text = title.get_text(strip=True) if title else "No Title Found"
 
-        # Introduction
+       
         intro_paragraphs = []
         intro_section = soup.find("h2", string=lambda t: t and "Introduction" in t)
         if intro_section:
             intro_paragraphs = [p.get_text(strip=True) for p in intro_section.find_all_next("p", limit=3) if len(p.get_text(strip=True)) > 50]
 
-        # What is the Stipendium Hungaricum Scholarship?
+      
         what_is = []
         what_section = soup.find("h2", string=lambda t: t and "What is the Stipendium Hungaricum Scholarship?" in t)
         if what_section:
             what_paragraphs = what_section.find_all_next("p", limit=3)
             what_is = [p.get_text(strip=True) for p in what_paragraphs if len(p.get_text(strip=True)) > 30]
 
-        # Programs Offered
+        
         programs = []
         programs_section = soup.find("h2", string=lambda t: t and "Programs Offered" in t)
         if programs_section:
@@ -286,7 +288,7 @@ def scrape_stipendium():
             if ul:
                 programs = [li.get_text(strip=True) for li in ul.find_all("li")]
 
-        # Eligibility Criteria
+      
         eligibility = []
         eligibility_section = soup.find("h2", string=lambda t: t and "Eligibility Criteria" in t)
         if eligibility_section:
@@ -294,7 +296,7 @@ def scrape_stipendium():
             if ul:
                 eligibility = [li.get_text(strip=True) for li in ul.find_all("li")]
 
-        # Scholarship Benefits
+  
         benefits = []
         benefits_section = soup.find("h2", string=lambda t: t and "Scholarship Benefits" in t)
         if benefits_section:
@@ -302,14 +304,14 @@ def scrape_stipendium():
             if ul:
                 benefits = [li.get_text(strip=True) for li in ul.find_all("li")]
 
-        # How to Apply
+        
         apply_steps = []
         apply_section = soup.find("h2", string=lambda t: t and "How to Apply" in t)
         if apply_section:
             steps = apply_section.find_all_next("p", limit=10)
             apply_steps = [s.get_text(strip=True) for s in steps if len(s.get_text(strip=True)) > 30]
 
-        # Important Dates
+       
         dates = []
         dates_section = soup.find("h2", string=lambda t: t and "Important Dates" in t)
         if dates_section:
@@ -317,7 +319,7 @@ def scrape_stipendium():
             if ul:
                 dates = [li.get_text(strip=True) for li in ul.find_all("li")]
 
-        # Why Pakistani Students Should Apply
+      
         why_apply = []
         why_section = soup.find("h2", string=lambda t: t and "Why Pakistani Students Should Apply" in t)
         if why_section:
@@ -325,34 +327,34 @@ def scrape_stipendium():
             if ul:
                 why_apply = [li.get_text(strip=True) for li in ul.find_all("li")]
 
-        # Contact for Queries
+       
         contact_info = []
         contact_section = soup.find("h2", string=lambda t: t and "Contact for Queries" in t)
         if contact_section:
             contact_paragraphs = contact_section.find_all_next("p", limit=3)
             contact_info = [p.get_text(strip=True) for p in contact_paragraphs if len(p.get_text(strip=True)) > 20]
 
-        # Conclusion
+        
         conclusion = []
         conclusion_section = soup.find("h2", string=lambda t: t and "Conclusion" in t)
         if conclusion_section:
             conclusion_paragraphs = conclusion_section.find_all_next("p", limit=3)
             conclusion = [p.get_text(strip=True) for p in conclusion_paragraphs if len(p.get_text(strip=True)) > 30]
 
-        # Social Media Sharing Buttons
+        
         sharing_buttons = []
         sharing_section = soup.find_all("button", string=lambda t: t and any(platform in t.lower() for platform in ["whatsapp", "facebook", "twitter", "linkedin", "pinterest", "email"]))
         if sharing_section:
             sharing_buttons = [btn.get_text(strip=True).lower() for btn in sharing_section]
 
-        # Feedback Options
+   
         feedback_options = []
         feedback_section = soup.find("div", string=lambda t: t and "Is this page helpful?" in t)
         if feedback_section:
             feedback_buttons = feedback_section.find_all_next("button", limit=2)
             feedback_options = [btn.get_text(strip=True) for btn in feedback_buttons if btn.get_text(strip=True) in ["Yes", "No"]]
 
-        # Community and Subscription Info
+ 
         community_info = []
         community_sections = soup.find_all("p", string=lambda t: t and any(keyword in t.lower() for keyword in ["followers", "subscribers", "join", "follow us"]))
         for section in community_sections:
@@ -360,7 +362,7 @@ def scrape_stipendium():
             if len(text) > 20:
                 community_info.append(text)
 
-        # Copyright Notice
+       
         copyright_notice = ""
         copyright_section = soup.find("p", string=lambda t: t and "Copyright" in t)
         if copyright_section:
@@ -384,20 +386,18 @@ def scrape_stipendium():
             "copyright_notice": copyright_notice
         }
 
+        store_scholarship("stipendium_scholarship", data)
         return jsonify(data)
 
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
+        return scholarship_fallback("stipendium_scholarship", e)
 
-# -----------------------
-# Chevening Scraper
-# -----------------------
 CHEVENING_URL = "https://www.ilmkidunya.com/scholarships/chevening-scholarships"
-
-@app.route("/chevening", methods=["GET"])
+@scholarships_bp.route("/chevening", methods=["GET"])
+@conditional_scrape("chevening_scholarship")
 def scrape_chevening():
     try:
-        response = requests.get(CHEVENING_URL, headers={"User-Agent": "Mozilla/5.0"})
+        response = polite_get(CHEVENING_URL, headers={"User-Agent": "Mozilla/5.0"})
         response.raise_for_status()
         soup = BeautifulSoup(response.text, "html.parser")
 
@@ -424,20 +424,19 @@ def scrape_chevening():
             "paragraphs": paragraphs[:10]
         }
 
+        store_scholarship("chevening_scholarship", data)
         return jsonify(data)
 
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
+        return scholarship_fallback("chevening_scholarship", e)
 
-# -----------------------
-# Erasmus Scraper
-# -----------------------
-ERASMUS_URL = "https://www.ilmkidunya.com/scholarships/erasmus-mundus-scholarships"
 
-@app.route("/erasmus", methods=["GET"])
+ERASMUS_URL = "https://www.ilmkidunya.com/scholarships/erasmus-mundus-scholarships"
+@scholarships_bp.route("/erasmus", methods=["GET"])
+@conditional_scrape("erasmus_scholarship")
 def scrape_erasmus():
     try:
-        response = requests.get(ERASMUS_URL, headers={"User-Agent": "Mozilla/5.0"})
+        response = polite_get(ERASMUS_URL, headers={"User-Agent": "Mozilla/5.0"})
         response.raise_for_status()
         soup = BeautifulSoup(response.text, "html.parser")
 
@@ -467,20 +466,19 @@ def scrape_erasmus():
             "paragraphs": paragraphs[:12]
         }
 
+        store_scholarship("erasmus_scholarship", data)
         return jsonify(data)
 
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
+        return scholarship_fallback("erasmus_scholarship", e)
 
-# -----------------------
-# Commonwealth Scraper
-# -----------------------
-COMMONWEALTH_URL = "https://www.ilmkidunya.com/scholarships/commonwealth-international-scholarships"
 
-@app.route("/commonwealth", methods=["GET"])
+COMMONWEALTH_URL = "https://www.ilmkidunya.com/scholarships/commonwealth-international-scholarships"
+@scholarships_bp.route("/commonwealth", methods=["GET"])
+@conditional_scrape("commonwealth_scholarship")
 def scrape_commonwealth():
     try:
-        response = requests.get(COMMONWEALTH_URL, headers={"User-Agent": "Mozilla/5.0"})
+        response = polite_get(COMMONWEALTH_URL, headers={"User-Agent": "Mozilla/5.0"})
         response.raise_for_status()
         soup = BeautifulSoup(response.text, "html.parser")
 
@@ -510,28 +508,27 @@ def scrape_commonwealth():
             "paragraphs": paragraphs[:15]
         }
 
+        store_scholarship("commonwealth_scholarship", data)
         return jsonify(data)
 
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
+        return scholarship_fallback("commonwealth_scholarship", e)
 
-# -----------------------
-# Rhodes Scraper
-# -----------------------
-RHODES_URL = "https://www.ilmkidunya.com/scholarships/rhodes-uk-scholarships"
 
-@app.route("/rhodes", methods=["GET"])
+RHODES_URL = "https://www.ilmkidunya.com/scholarships/rhodes-uk-scholarships"
+@scholarships_bp.route("/rhodes", methods=["GET"])
+@conditional_scrape("rhodes_scholarship")
 def scrape_rhodes():
     try:
-        response = requests.get(RHODES_URL, headers={"User-Agent": "Mozilla/5.0"})
+        response = polite_get(RHODES_URL, headers={"User-Agent": "Mozilla/5.0"})
         response.raise_for_status()
         soup = BeautifulSoup(response.text, "html.parser")
 
-        # Title
+     
         title = soup.find("h1")
         title_text = title.get_text(strip=True) if title else "No Title Found"
 
-        # Introduction
+       
         introduction = ""
         intro_section = soup.find("h2", string=lambda t: t and "Introduction" in t)
         if intro_section:
@@ -539,7 +536,7 @@ def scrape_rhodes():
             if next_p:
                 introduction = next_p.get_text(strip=True)
 
-        # Quick Facts
+        
         facts = {}
         quick_facts = soup.find_all("tr")
         for row in quick_facts:
@@ -549,7 +546,7 @@ def scrape_rhodes():
                 value = cols[1].get_text(strip=True)
                 facts[key] = value
 
-        # What the Scholarship Covers
+     
         benefits = []
         benefits_section = soup.find("h2", string=lambda t: t and "What the Scholarship Covers" in t)
         if benefits_section:
@@ -557,12 +554,12 @@ def scrape_rhodes():
             if ul:
                 benefits = [li.get_text(strip=True) for li in ul.find_all("li")]
             else:
-                # Alternative approach if structured differently
+               
                 next_p = benefits_section.find_next("p")
                 if next_p:
                     benefits = [next_p.get_text(strip=True)]
 
-        # Eligibility Criteria
+       
         eligibility = []
         eligibility_section = soup.find("h2", string=lambda t: t and "Eligibility Criteria" in t)
         if eligibility_section:
@@ -570,13 +567,12 @@ def scrape_rhodes():
             if ul:
                 eligibility = [li.get_text(strip=True) for li in ul.find_all("li")]
 
-        # Application Process
+   
         application_process = []
         application_section = soup.find("h2", string=lambda t: t and "Application Process" in t)
         if application_section:
-            # Get all list items under the application process section
-            current = application_section.find_next()
-            while current and current.name != "h2":
+          
+            for current in walk_section(application_section, stop=heading_stop(["h2"]), siblings=True):
                 if current.name == "h3" or current.name == "h4":
                     process_step = {"title": current.get_text(strip=True), "details": ""}
                     application_process.append(process_step)
@@ -587,9 +583,8 @@ def scrape_rhodes():
                     if application_process:
                         list_items = [li.get_text(strip=True) for li in current.find_all("li")]
                         application_process[-1]["details"] += "; ".join(list_items)
-                current = current.find_next_sibling()
 
-        # Why Apply for Rhodes?
+     
         why_apply = []
         why_apply_section = soup.find("h2", string=lambda t: t and "Why Apply for Rhodes" in t)
         if why_apply_section:
@@ -597,7 +592,7 @@ def scrape_rhodes():
             if ul:
                 why_apply = [li.get_text(strip=True) for li in ul.find_all("li")]
 
-        # Tips for a Strong Application
+       
         tips = []
         tips_section = soup.find("h2", string=lambda t: t and "Tips for a Strong Application" in t)
         if tips_section:
@@ -605,7 +600,7 @@ def scrape_rhodes():
             if ul:
                 tips = [li.get_text(strip=True) for li in ul.find_all("li")]
 
-        # Final Thoughts
+    
         final_thoughts = ""
         final_section = soup.find("h2", string=lambda t: t and "Final Words" in t) or soup.find("h2", string=lambda t: t and "Final Thoughts" in t)
         if final_section:
@@ -613,7 +608,7 @@ def scrape_rhodes():
             if next_p:
                 final_thoughts = next_p.get_text(strip=True)
 
-        # Important Notes
+    
         important_notes = []
         notes_section = soup.find("strong", string=lambda t: t and "Important:" in t)
         if notes_section:
@@ -633,12 +628,22 @@ def scrape_rhodes():
             "source_url": RHODES_URL
         }
 
+        store_scholarship("rhodes_scholarship", data)
         return jsonify(data)
 
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
-# -----------------------
-# Run Server
-# -----------------------
-if __name__ == "__main__":
-    app.run(host="0.0.0.0", port=5000, debug=True)
\ No newline at end of file
+        return scholarship_fallback("rhodes_scholarship", e)
+
+register_plugin(
+    'abroad_scholarships',
+    blueprints=[scholarships_bp],
+    endpoints={
+        'SI Scholarship for Global Professionals': '/sisgp',
+        'Turkiye Burslari Scholarship': '/turkiye',
+        'Stipendium Hungaricum Scholarship': '/hungary',
+        'Chevening Scholarship': '/chevening',
+        'Erasmus Mundus Scholarship': '/erasmus',
+        'Commonwealth Scholarship': '/commonwealth',
+        'Rhodes Scholarship': '/rhodes'
+    }
+)
@@ -0,0 +1,190 @@
+import hashlib
+import json
+import os
+import re
+import time
+from flask import Blueprint, request, jsonify
+from db import get_connection
+
+
+search_bp = Blueprint('search', __name__)
+
+SCHOLARSHIP_SKIP_KEYS = {"title", "sharing_buttons", "feedback_options", "community_info", "copyright_notice", "source_url"}
+PROGRAM_KEY_WORDS = ["program", "discipline", "degree", "name"]
+TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+_schema_pids = set()
+
+def _ensure_schema(conn):
+    if os.getpid() in _schema_pids:
+        return
+    with conn:
+        conn.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS search_docs USING fts5("
+            "title, body, cache_key UNINDEXED, kind UNINDEXED, section UNINDEXED, "
+            "tokenize='porter unicode61 remove_diacritics 2')"
+        )
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS search_sources ("
+            "cache_key TEXT PRIMARY KEY, digest TEXT NOT NULL, indexed_at TEXT NOT NULL)"
+        )
+    _schema_pids.add(os.getpid())
+
+
+def _text(value):
+    if isinstance(value, dict):
+        return " ".join(f"{k} {_text(v)}" for k, v in value.items())
+    if isinstance(value, list):
+        return " ".join(_text(v) for v in value)
+    return "" if value is None else str(value)
+
+def _program_name(row):
+    for key, value in row.items():
+        if value and any(word in str(key).lower() for word in PROGRAM_KEY_WORDS):
+            return str(value)
+    for value in row.values():
+        if value:
+            return str(value)
+    return ""
+
+def _fee_documents(structure, section=""):
+    if isinstance(structure, list):
+        for row in structure:
+            if isinstance(row, dict):
+                name = _program_name(row)
+                if name:
+                    yield section, name, _text(row)
+            elif row:
+                yield section, str(row), str(row)
+    elif isinstance(structure, dict):
+        for key, value in structure.items():
+            if isinstance(value, (list, dict)):
+                yield from _fee_documents(value, key)
+            elif value:
+                yield section, key, f"{key} {value}"
+
+def _scholarship_documents(data):
+    title = data.get("title") or ""
+    for key, value in data.items():
+        if key in SCHOLARSHIP_SKIP_KEYS:
+            continue
+        body = _text(value).strip()
+        if body:
+            yield key, title, body
+
+def documents_for_entry(cache_key, entry):
+    docs = []
+    if not isinstance(entry, dict):
+        return docs
+    if "fee_structure" in entry:
+        for section, title, body in _fee_documents(entry["fee_structure"]):
+            docs.append(("fee", section, title, body))
+    elif "scholarship" in entry:
+        for section, title, body in _scholarship_documents(entry["scholarship"]):
+            docs.append(("scholarship", section, title, body))
+    elif "scholarships" in entry:
+        lines = [str(line) for line in entry["scholarships"] if line]
+        if lines:
+            title = cache_key.replace("_", " ").title()
+            docs.append(("scholarship", "scholarships", title, "\n".join(lines)))
+    return docs
+
+
+def index_cache_entry(cache_key, entry):
+    if entry is None:
+        conn = get_connection()
+        _ensure_schema(conn)
+        with conn:
+            conn.execute("DELETE FROM search_docs WHERE cache_key = ?", (cache_key,))
+            conn.execute("DELETE FROM search_sources WHERE cache_key = ?", (cache_key,))
+        return True
+    docs = documents_for_entry(cache_key, entry)
+    digest = hashlib.sha1(json.dumps(docs, sort_keys=True).encode("utf-8")).hexdigest()
+    conn = get_connection()
+    _ensure_schema(conn)
+    row = conn.execute("SELECT digest FROM search_sources WHERE cache_key = ?", (cache_key,)).fetchone()
+    if row and row["digest"] == digest:
+        return False
+    with conn:
+        conn.execute("DELETE FROM search_docs WHERE cache_key = ?", (cache_key,))
+        conn.executemany(
+            "INSERT INTO search_docs (title, body, cache_key, kind, section) VALUES (?, ?, ?, ?, ?)",
+            [(title, body, cache_key, kind, section) for kind, section, title, body in docs]
+        )
+        conn.execute(
+            "INSERT OR REPLACE INTO search_sources (cache_key, digest, indexed_at) VALUES (?, ?, datetime('now'))",
+            (cache_key, digest)
+        )
+    return True
+
+def index_cached_data(cached):
+    updated = 0
+    for cache_key, entry in cached.items():
+        try:
+            if index_cache_entry(cache_key, entry):
+                updated += 1
+        except Exception as e:
+            print(f"Error indexing {cache_key}: {e}")
+    return updated
+
+
+def _match_expression(terms, operator):
+    return f" {operator} ".join(f'"{term}"*' for term in terms)
+
+def search_documents(query, limit=20, kind=None):
+    terms = TOKEN_PATTERN.findall(query.lower())
+    if not terms:
+        return []
+    conn = get_connection()
+    _ensure_schema(conn)
+    sql = (
+        "SELECT cache_key, kind, section, title, "
+        "snippet(search_docs, 1, '[', ']', '...', 12) AS snippet, "
+        "bm25(search_docs, 4.0, 1.0) AS score "
+        "FROM search_docs WHERE search_docs MATCH ?"
+    )
+    if kind:
+        sql += " AND kind = ?"
+    sql += " ORDER BY score LIMIT ?"
+    operators = ["AND", "OR"] if len(terms) > 1 else ["AND"]
+    rows = []
+    for operator in operators:
+        params = [_match_expression(terms, operator)] + ([kind] if kind else []) + [limit]
+        rows = conn.execute(sql, params).fetchall()
+        if rows:
+            break
+    return [{
+        "source": row["cache_key"],
+        "type": row["kind"],
+        "section": row["section"],
+        "title": row["title"],
+        "snippet": row["snippet"],
+        "score": round(-row["score"], 4)
+    } for row in rows]
+
+
+@search_bp.route('/search', methods=['GET'])
+def search():
+    query = request.args.get('q', '').strip()
+    if not query:
+        return jsonify({
+            "status": "error",
+            "message": "Query parameter 'q' is required"
+        }), 400
+    limit = max(1, min(request.args.get('limit', 20, type=int), 100))
+    kind = request.args.get('type')
+    start = time.perf_counter()
+    try:
+        results = search_documents(query, limit, kind)
+    except Exception as e:
+        return jsonify({
+            "status": "error",
+            "message": str(e)
+        }), 500
+    return jsonify({
+        "status": "success",
+        "query": query,
+        "count": len(results),
+        "results": results,
+        "took_ms": round((time.perf_counter() - start) * 1000, 2)
+    })
@@ -0,0 +1,134 @@
+import hashlib
+import json
+import os
+from flask import Blueprint, request, jsonify
+from db import get_connection
+
+
+sync_bp = Blueprint('sync', __name__)
+
+DEFAULT_SYNC_LIMIT = 100
+MAX_SYNC_LIMIT = 500
+
+_schema_pids = set()
+
+def _ensure_schema(conn):
+    if os.getpid() in _schema_pids:
+        return
+    with conn:
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS sync_records ("
+            "cache_key TEXT PRIMARY KEY, seq INTEGER NOT NULL, hash TEXT NOT NULL, "
+            "deleted INTEGER NOT NULL DEFAULT 0, last_updated TEXT, payload TEXT)"
+        )
+        conn.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_sync_seq ON sync_records (seq)")
+    _schema_pids.add(os.getpid())
+
+
+def content_hash(entry):
+    # last_updated changes on every successful scrape, so it is left out of the
+    # hash; otherwise every refresh would look like a change to clients.
+    if entry is None:
+        return ""
+    content = {k: v for k, v in entry.items() if k != "last_updated"} if isinstance(entry, dict) else entry
+    return hashlib.sha256(json.dumps(content, sort_keys=True).encode("utf-8")).hexdigest()
+
+def record_change(cache_key, entry):
+    conn = get_connection()
+    _ensure_schema(conn)
+    new_hash = content_hash(entry)
+    deleted = entry is None
+    # BEGIN IMMEDIATE serializes sequence allocation across gunicorn workers.
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        row = conn.execute("SELECT hash, deleted FROM sync_records WHERE cache_key = ?", (cache_key,)).fetchone()
+        if row is None and deleted:
+            conn.execute("ROLLBACK")
+            return None
+        if row is not None and row["hash"] == new_hash and bool(row["deleted"]) == deleted:
+            conn.execute("ROLLBACK")
+            return None
+        seq = conn.execute("SELECT COALESCE(MAX(seq), 0) + 1 FROM sync_records").fetchone()[0]
+        conn.execute(
+            "INSERT OR REPLACE INTO sync_records (cache_key, seq, hash, deleted, last_updated, payload) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                cache_key, seq, new_hash, int(deleted),
+                None if deleted else entry.get("last_updated"),
+                None if deleted else json.dumps(entry)
+            )
+        )
+        conn.execute("COMMIT")
+        return seq
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+
+def sync_cached_data(cached):
+    for cache_key, entry in cached.items():
+        try:
+            record_change(cache_key, entry)
+        except Exception as e:
+            print(f"Error recording sync state for {cache_key}: {e}")
+
+def live_keys():
+    conn = get_connection()
+    _ensure_schema(conn)
+    return {row["cache_key"] for row in conn.execute("SELECT cache_key FROM sync_records WHERE deleted = 0").fetchall()}
+
+def latest_seq():
+    conn = get_connection()
+    _ensure_schema(conn)
+    return conn.execute("SELECT COALESCE(MAX(seq), 0) FROM sync_records").fetchone()[0]
+
+def changes_since(since, limit=DEFAULT_SYNC_LIMIT):
+    conn = get_connection()
+    _ensure_schema(conn)
+    rows = conn.execute(
+        "SELECT cache_key, seq, hash, deleted, last_updated, payload FROM sync_records "
+        "WHERE seq > ? ORDER BY seq LIMIT ?",
+        (since, limit + 1)
+    ).fetchall()
+    has_more = len(rows) > limit
+    changes = []
+    for row in rows[:limit]:
+        change = {
+            "key": row["cache_key"],
+            "seq": row["seq"],
+            "hash": row["hash"],
+            "deleted": bool(row["deleted"])
+        }
+        if not row["deleted"]:
+            change["last_updated"] = row["last_updated"]
+            change["data"] = json.loads(row["payload"])
+        changes.append(change)
+    return changes, has_more
+
+
+@sync_bp.route('/sync', methods=['GET'])
+def sync():
+    since = request.args.get('since', '0')
+    if not since.isdigit():
+        return jsonify({
+            "status": "error",
+            "message": "Query parameter 'since' must be a non-negative integer"
+        }), 400
+    since = int(since)
+    limit = max(1, min(request.args.get('limit', DEFAULT_SYNC_LIMIT, type=int), MAX_SYNC_LIMIT))
+    try:
+        changes, has_more = changes_since(since, limit)
+        latest = latest_seq()
+    except Exception as e:
+        return jsonify({
+            "status": "error",
+            "message": str(e)
+        }), 500
+    return jsonify({
+        "status": "success",
+        "since": since,
+        "next_since": changes[-1]["seq"] if changes else latest,
+        "latest_seq": latest,
+        "has_more": has_more,
+        "count": len(changes),
+        "changes": changes
+    })
@@ -0,0 +1,128 @@
+import contextlib
+import functools
+import os
+import threading
+import time
+import types
+from flask import Blueprint, jsonify
+
+
+timing_bp = Blueprint('timing', __name__)
+
+# SCHOLAR_TIMING=1 times the stages of each request (file loading, program
+# matching, model fitting, fetching, parsing, encoding), sends them back in a
+# Server-Timing header and keeps per-process totals at /timing/stats. When it
+# is off, timed() hands back the undecorated function and span() a shared
+# no-op context, so the instrumented code runs as if it were not there.
+ENABLED = os.environ.get("SCHOLAR_TIMING") == "1"
+
+_local = threading.local()
+_totals = {}
+_totals_lock = threading.Lock()
+_null_span = contextlib.nullcontext()
+
+def _record(name, ms):
+    spans = getattr(_local, "spans", None)
+    if spans is not None:
+        entry = spans.get(name)
+        if entry is None:
+            spans[name] = [ms, 1]
+        else:
+            entry[0] += ms
+            entry[1] += 1
+    with _totals_lock:
+        entry = _totals.get(name)
+        if entry is None:
+            _totals[name] = [1, ms, ms]
+        else:
+            entry[0] += 1
+            entry[1] += ms
+            entry[2] = max(entry[2], ms)
+
+
+class Span:
+    __slots__ = ("name", "start")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        _record(self.name, (time.perf_counter() - self.start) * 1000)
+
+def span(name):
+    return Span(name) if ENABLED else _null_span
+
+def timed(name):
+    def decorate(func):
+        if not ENABLED:
+            return func
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _record(name, (time.perf_counter() - start) * 1000)
+        # Lazy proxies are wrapped as they are; copying their attributes
+        # would import the library behind them.
+        if isinstance(func, types.FunctionType):
+            functools.update_wrapper(wrapper, func)
+        return wrapper
+    return decorate
+
+def server_timing(spans, total_ms):
+    # Repeated stages (one match per university, say) are summed into one
+    # entry with the call count as its description.
+    parts = []
+    for name, (ms, calls) in spans.items():
+        parts.append(f'{name};dur={ms:.2f}' + (f';desc="{calls} calls"' if calls > 1 else ""))
+    parts.append(f"total;dur={total_ms:.2f}")
+    return ", ".join(parts)
+
+def stage_totals():
+    with _totals_lock:
+        totals = {name: list(entry) for name, entry in _totals.items()}
+    return {
+        name: {
+            "calls": calls,
+            "total_ms": round(total, 3),
+            "avg_ms": round(total / calls, 3),
+            "max_ms": round(longest, 3)
+        }
+        for name, (calls, total, longest) in sorted(totals.items())
+    }
+
+def reset_totals():
+    with _totals_lock:
+        _totals.clear()
+
+
+if ENABLED:
+    @timing_bp.before_app_request
+    def start_request_timing():
+        _local.spans = {}
+        _local.started = time.perf_counter()
+
+    @timing_bp.after_app_request
+    def add_server_timing(response):
+        spans = getattr(_local, "spans", None)
+        if spans is not None:
+            response.headers["Server-Timing"] = server_timing(spans, (time.perf_counter() - _local.started) * 1000)
+        return response
+
+    @timing_bp.teardown_app_request
+    def stop_request_timing(exc):
+        _local.spans = None
+
+
+@timing_bp.route('/timing/stats', methods=['GET'])
+def timing_stats():
+    return jsonify({
+        "status": "success",
+        "enabled": ENABLED,
+        "pid": os.getpid(),
+        "stages": stage_totals()
+    })
@@ -2,37 +2,110 @@ import os
 import json
 import datetime
 import re
-import requests
-from bs4 import BeautifulSoup
+from lazy_imports import lazy_attr
+from html_sections import walk_section, heading_stop, tag_not_in, table_stop
 from flask import Blueprint
 from flask import Flask, request, jsonify
+from polite_fetch import polite_get
+from timing import timed
+from metrics import record_cache
+from conditional import conditional_scrape
+
+BeautifulSoup = timed("parse")(lazy_attr("bs4", "BeautifulSoup"))
 
 
 web_scraping_bp = Blueprint('web_scraping', __name__)
 
 
-json_path = r"C:\work\unis_recommendation\all_uni.json"
+json_path = os.environ.get("SCHOLAR_CACHE_PATH", r"C:\work\unis_recommendation\all_uni.json")
 
-def load_cached_data():
+def read_cached_data():
+    # None when the cache file is missing or unreadable, so callers can tell
+    # that apart from a cache that is really empty.
     try:
-        if os.path.exists(json_path):
-            with open(json_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+        with open(json_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
     except Exception as e:
         print(f"Error loading cache: {e}")
-    return {}
+        return None
+
+def load_cached_data():
+    cached = read_cached_data()
+    return cached if cached is not None else {}
 
 def save_cached_data(data):
+    # Written to a temporary file and renamed into place, so a worker reading
+    # the cache never sees a half-written file.
+    tmp_path = f"{json_path}.{os.getpid()}.tmp"
     try:
-        os.makedirs(os.path.dirname(json_path), exist_ok=True)
-        with open(json_path, 'w', encoding='utf-8') as f:
+        os.makedirs(os.path.dirname(json_path) or ".", exist_ok=True)
+        with open(tmp_path, 'w', encoding='utf-8') as f:
             json.dump(data, f, indent=4)
+        os.replace(tmp_path, json_path)
     except Exception as e:
         print(f"Error saving cache: {e}")
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+CACHE_LISTENERS = []
+
+def register_cache_listener(listener):
+    if listener not in CACHE_LISTENERS:
+        CACHE_LISTENERS.append(listener)
+
+def notify_cache_listeners(cache_key, entry):
+    for listener in CACHE_LISTENERS:
+        try:
+            listener(cache_key, entry)
+        except Exception as e:
+            print(f"Error notifying cache listener for {cache_key}: {e}")
+
+def store_cached_entry(cached, cache_key, entry):
+    cached[cache_key] = entry
+    save_cached_data(cached)
+    record_cache(cache_key, "refresh")
+    notify_cache_listeners(cache_key, entry)
+
+def remove_cached_entries(cache_keys):
+    # Entries that are gone from the cache file. Listeners get None, so the
+    # search index and deadlines drop their rows and the sync feed records a
+    # tombstone.
+    for cache_key in cache_keys:
+        notify_cache_listeners(cache_key, None)
+
+def store_scholarship(cache_key, data):
+    # An unchanged page is not stored again: that would rewrite the whole
+    # cache file and rerun every listener for nothing but a new timestamp.
+    cached = load_cached_data()
+    if cache_key in cached and cached[cache_key].get("scholarship") == data:
+        return False
+    store_cached_entry(cached, cache_key, {
+        "scholarship": data,
+        "last_updated": datetime.datetime.now().isoformat()
+    })
+    return True
+
+def scholarship_fallback(cache_key, error):
+    # Serves the stored copy of a scholarship page when the live fetch fails
+    # or is throttled, like the fee scrapers do.
+    cached = load_cached_data()
+    record_cache(cache_key, "stale" if cache_key in cached else "miss")
+    if cache_key not in cached:
+        return jsonify({"error": str(error)}), 500
+    cached_entry = cached[cache_key]
+    response = dict(cached_entry["scholarship"])
+    response["last_updated"] = cached_entry["last_updated"]
+    response["note"] = "Data loaded from cache due to fetch failure"
+    return jsonify(response)
 
 def safe_get(url):
     try:
-        response = requests.get(url, timeout=30)
+        response = polite_get(url, timeout=30)
         response.raise_for_status()
         return response, None
     except Exception as e:
@@ -80,20 +153,21 @@ def scrape_iiui_fees():
                         })
         if fee_data:
             update_time = datetime.datetime.now().isoformat()
-            cached[cache_key] = {
+            store_cached_entry(cached, cache_key, {
                 "fee_structure": fee_data,
                 "last_updated": update_time
-            }
-            save_cached_data(cached)
+            })
             return fee_data, None, update_time, False
         else:
             error = "No fee data found in any tables on the IIUI page"
+    record_cache(cache_key, "stale" if cache_key in cached else "miss")
     if cache_key in cached:
         cached_entry = cached[cache_key]
         return cached_entry["fee_structure"], None, cached_entry["last_updated"], True
     return None, error or "No fee data found in any tables on the IIUI page", None, False
 
 @web_scraping_bp.route('/feesiiui', methods=['GET'])
+@conditional_scrape('iiui_fees')
 def fees_iiui():
     data, error, last_updated, from_cache = scrape_iiui_fees()
     if error:
@@ -131,22 +205,23 @@ def scrape_uet_fees():
                     rows.append(dict(zip(headers, cols)))
             if rows:
                 update_time = datetime.datetime.now().isoformat()
-                cached[cache_key] = {
+                store_cached_entry(cached, cache_key, {
                     "fee_structure": rows,
                     "last_updated": update_time
-                }
-                save_cached_data(cached)
+                })
                 return rows, None, update_time, False
             else:
                 error = "No fee data found in the table"
         else:
             error = "Fee structure table not found"
+    record_cache(cache_key, "stale" if cache_key in cached else "miss")
     if cache_key in cached:
         cached_entry = cached[cache_key]
         return cached_entry["fee_structure"], None, cached_entry["last_updated"], True
     return None, error or "Fee structure table not found", None, False
 
 @web_scraping_bp.route('/feesuet', methods=['GET'])
+@conditional_scrape('uet_fees')
 def fees_uet():
     data, error, last_updated, from_cache = scrape_uet_fees()
     if error:
@@ -205,20 +280,21 @@ def scrape_lums_fees():
 
         if data:
             update_time = datetime.datetime.now().isoformat()
-            cached[cache_key] = {
+            store_cached_entry(cached, cache_key, {
                 "fee_structure": data,
                 "last_updated": update_time
-            }
-            save_cached_data(cached)
+            })
             return data, None, update_time, False
         else:
             error = "No fee data found for LUMS"
+    record_cache(cache_key, "stale" if cache_key in cached else "miss")
     if cache_key in cached:
         cached_entry = cached[cache_key]
         return cached_entry["fee_structure"], None, cached_entry["last_updated"], True
     return None, error or "No fee data found for LUMS", None, False
 
 @web_scraping_bp.route("/feeslums", methods=["GET"])
+@conditional_scrape("lums_fees")
 def fees_lums():
     data, error, last_updated, from_cache = scrape_lums_fees()
     if error:
@@ -256,20 +332,21 @@ def scrape_ned_fees():
                     fee_data.append(dict(zip(headers, cols)))
         if fee_data:
             update_time = datetime.datetime.now().isoformat()
-            cached[cache_key] = {
+            store_cached_entry(cached, cache_key, {
                 "fee_structure": fee_data,
                 "last_updated": update_time
-            }
-            save_cached_data(cached)
+            })
             return fee_data, None, update_time, False
         else:
             error = "No fee data found for NED University"
+    record_cache(cache_key, "stale" if cache_key in cached else "miss")
     if cache_key in cached:
         cached_entry = cached[cache_key]
         return cached_entry["fee_structure"], None, cached_entry["last_updated"], True
     return None, error or "No fee data found for NED University", None, False
 
 @web_scraping_bp.route('/nedfees', methods=['GET'])
+@conditional_scrape('ned_fees')
 def ned_fees():
     data, error, last_updated, from_cache = scrape_ned_fees()
     if error:
@@ -319,20 +396,21 @@ def scrape_fee_structure_air():
         }
         if any(data.values()):
             update_time = datetime.datetime.now().isoformat()
-            cached[cache_key] = {
+            store_cached_entry(cached, cache_key, {
                 "fee_structure": data,
                 "last_updated": update_time
-            }
-            save_cached_data(cached)
+            })
             return data, None, update_time, False
         else:
             error = "No fee data found for AIR"
+    record_cache(cache_key, "stale" if cache_key in cached else "miss")
     if cache_key in cached:
         cached_entry = cached[cache_key]
         return cached_entry["fee_structure"], None, cached_entry["last_updated"], True
     return None, error or "No fee data found for air", None, False
 
 @web_scraping_bp.route('/feesair', methods=['GET'])
+@conditional_scrape('air_fees')
 def fees_air():
     data, error, last_updated, from_cache = scrape_fee_structure_air()
     if error:
@@ -370,20 +448,21 @@ def scrape_nust_fees():
                     fee_data.append({headers[i]: cols[i].get_text(strip=True) for i in range(len(headers))})
         if fee_data:
             update_time = datetime.datetime.now().isoformat()
-            cached[cache_key] = {
+            store_cached_entry(cached, cache_key, {
                 "fee_structure": fee_data,
                 "last_updated": update_time
-            }
-            save_cached_data(cached)
+            })
             return fee_data, None, update_time, False
         else:
             error = "No fee data found for NUST"
+    record_cache(cache_key, "stale" if cache_key in cached else "miss")
     if cache_key in cached:
         cached_entry = cached[cache_key]
         return cached_entry["fee_structure"], None, cached_entry["last_updated"], True
     return None, error or "No fee data found for NUST", None, False
 
 @web_scraping_bp.route('/feesnust', methods=['GET'])
+@conditional_scrape('nust_fees')
 def fees_nust():
     data, error, last_updated, from_cache = scrape_nust_fees()
     if error:
@@ -421,20 +500,21 @@ def scrape_comsats_fees():
                     fee_data.append({headers[i]: cols[i].get_text(strip=True) for i in range(len(headers))})
         if fee_data:
             update_time = datetime.datetime.now().isoformat()
-            cached[cache_key] = {
+            store_cached_entry(cached, cache_key, {
                 "fee_structure": fee_data,
                 "last_updated": update_time
-            }
-            save_cached_data(cached)
+            })
             return fee_data, None, update_time, False
         else:
             error = "No fee data found for COMSATS"
+    record_cache(cache_key, "stale" if cache_key in cached else "miss")
     if cache_key in cached:
         cached_entry = cached[cache_key]
         return cached_entry["fee_structure"], None, cached_entry["last_updated"], True
     return None, error or "No fee data found for COMSATS", None, False
 
 @web_scraping_bp.route('/feescomsats', methods=['GET'])
+@conditional_scrape('comsats_fees')
 def fees_comsats():
     data, error, last_updated, from_cache = scrape_comsats_fees()
     if error:
@@ -472,20 +552,21 @@ def scrape_uni_of_educ_fees():
                     fee_data.append({headers[i]: cols[i].get_text(strip=True) for i in range(len(headers))})
         if fee_data:
             update_time = datetime.datetime.now().isoformat()
-            cached[cache_key] = {
+            store_cached_entry(cached, cache_key, {
                 "fee_structure": fee_data,
                 "last_updated": update_time
-            }
-            save_cached_data(cached)
+            })
             return fee_data, None, update_time, False
         else:
             error = "No fee data found for  University of education"
+    record_cache(cache_key, "stale" if cache_key in cached else "miss")
     if cache_key in cached:
         cached_entry = cached[cache_key]
         return cached_entry["fee_structure"], None, cached_entry["last_updated"], True
     return None, error or "No fee data found for University of Education", None, False
 
 @web_scraping_bp.route('/fees_uni_of_education', methods=['GET'])
+@conditional_scrape('uni_of_education_fees')
 def fees_uni_of_education():
     data, error, last_updated, from_cache = scrape_uni_of_educ_fees()
     if error:
@@ -545,8 +626,7 @@ def scrape_fast_fees():
             misc_parent = misc_section.find_parent()
             if misc_parent:
               
-                next_elem = misc_parent.find_next()
-                while next_elem and not next_elem.find('table'):
+                for next_elem in walk_section(misc_parent, stop=table_stop(misc_parent)):
                     if next_elem.name in ['p', 'div', 'li']:
                         text = next_elem.get_text(strip=True)
                         if text and 'Rs' in text and not any(admission_word in text.lower() for admission_word in ['admission', 'applicant']):
@@ -557,7 +637,6 @@ def scrape_fast_fees():
                                 fee_amount = f"Rs {fee_match.group(2)}"
                                 if 'admission' not in fee_name.lower():
                                     misc_fees[fee_name] = fee_amount
-                    next_elem = next_elem.find_next()
         
        
         misc_tables = fee_content.find_all('table')
@@ -611,27 +690,25 @@ def scrape_fast_fees():
         if payment_section:
             payment_parent = payment_section.find_parent()
             if payment_parent:
-                next_elem = payment_parent.find_next()
-                while next_elem and next_elem.name in ['p', 'li', 'div']:
+                for next_elem in walk_section(payment_parent, stop=tag_not_in(['p', 'li', 'div'])):
                     text = next_elem.get_text(strip=True)
                     if text and not any(admission_word in text.lower() for admission_word in ['admission', 'applicant']):
                         payment_methods.append(text)
-                    next_elem = next_elem.find_next()
         
         if payment_methods:
             fee_data["payment_methods"] = payment_methods[:5]
         
         if fee_data:
             update_time = datetime.datetime.now().isoformat()
-            cached[cache_key] = {
+            store_cached_entry(cached, cache_key, {
                 "fee_structure": fee_data,
                 "last_updated": update_time
-            }
-            save_cached_data(cached)
+            })
             return fee_data, None, update_time, False
         else:
             error = "No fee data found for FAST University"
     
+    record_cache(cache_key, "stale" if cache_key in cached else "miss")
     if cache_key in cached:
         cached_entry = cached[cache_key]
         return cached_entry["fee_structure"], None, cached_entry["last_updated"], True
@@ -639,6 +716,7 @@ def scrape_fast_fees():
     return None, error or "No fee data found for FAST University", None, False
 
 @web_scraping_bp.route('/feesfast', methods=['GET'])
+@conditional_scrape('fast_fees')
 def fees_fast():
     data, error, last_updated, from_cache = scrape_fast_fees()
     if error:
@@ -672,32 +750,31 @@ def scrape_nust_scholarships():
         section = soup.find('h2', string=lambda t: t and 'nust scholarships' in t.lower())
         if section:
             text = []
-            node = section.find_next_sibling()
-            while node and node.name not in ['h2', 'h1']:
+            for node in walk_section(section, stop=heading_stop(['h2', 'h1']), siblings=True):
                 if node.name == 'p':
                     text.append(node.get_text(strip=True))
                 if node.name == 'ul':
                     for li in node.find_all('li'):
                         text.append(f"- {li.get_text(strip=True)}")
-                node = node.find_next_sibling()
             if text:
                 update_time = datetime.datetime.now().isoformat()
-                cached[cache_key] = {
+                store_cached_entry(cached, cache_key, {
                     "scholarships": text,
                     "last_updated": update_time
-                }
-                save_cached_data(cached)
+                })
                 return text, None, update_time, False
             else:
                 error = "No scholarship data found for NUST"
         else:
             error = "NUST scholarships section not found"
+    record_cache(cache_key, "stale" if cache_key in cached else "miss")
     if cache_key in cached:
         cached_entry = cached[cache_key]
         return cached_entry["scholarships"], None, cached_entry["last_updated"], True
     return None, error or "NUST scholarships section not found", None, False
 
 @web_scraping_bp.route('/scholarshipsnust', methods=['GET'])
+@conditional_scrape('nust_scholarships')
 def scholarships_nust():
     data, error, last_updated, from_cache = scrape_nust_scholarships()
     if error:
@@ -716,613 +793,3 @@ def scholarships_nust():
     if from_cache:
         response["note"] = "Data loaded from cache due to fetch failure"
     return jsonify(response)
-
-
-SISGP_URL = "https://www.ilmkidunya.com/scholarships/sisgp-scholarships"
-@web_scraping_bp.route("/sisgp", methods=["GET"])
-def scrape_sisgp():
-    try:
-        response = requests.get(SISGP_URL, headers={"User-Agent": "Mozilla/5.0"})
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, "html.parser")
-
-  
-        title = soup.find("h1")
-        title_text = title.get_text(strip=True) if title else "No Title Found"
-
-        
-        intro_paragraphs = []
-        intro_p = soup.find("p")
-        if intro_p:
-            intro_paragraphs = [p.get_text(strip=True) for p in intro_p.find_all_next("p", limit=3) if len(p.get_text(strip=True)) > 50]
-
-  
-        why_apply_points = []
-        why_section = soup.find("h2", string=lambda t: t and "Why Pakistani Professionals Should Apply" in t)
-        if why_section:
-            ul = why_section.find_next("ul")
-            if ul:
-                why_apply_points = [li.get_text(strip=True) for li in ul.find_all("li")]
-
-  
-        eligibility_points = []
-        eligibility_section = soup.find("h2", string=lambda t: t and "Eligibility Criteria" in t)
-        if eligibility_section:
-            ul = eligibility_section.find_next("ul")
-            if ul:
-                eligibility_points = [li.get_text(strip=True) for li in ul.find_all("li")]
-
-
-        coverage_points = []
-        coverage_section = soup.find("h2", string=lambda t: t and "What Does the Scholarship Cover?" in t)
-        if coverage_section:
-            ul = coverage_section.find_next("ul")
-            if ul:
-                coverage_points = [li.get_text(strip=True) for li in ul.find_all("li")]
-
- 
-        apply_steps = []
-        apply_section = soup.find("h2", string=lambda t: t and "How to Apply" in t)
-        if apply_section:
-            ol = apply_section.find_next("ol")
-            if ol:
-                apply_steps = [li.get_text(strip=True) for li in ol.find_all("li")]
-            else:
-      
-                steps = apply_section.find_all_next("p", limit=10)
-                apply_steps = [s.get_text(strip=True) for s in steps if len(s.get_text(strip=True)) > 30 and any(num in s.get_text() for num in ['1.', '2.', '3.', '4.'])]
-
-
-        dates = []
-        dates_section = soup.find("h2", string=lambda t: t and "Key Dates" in t)
-        if dates_section:
-            ul = dates_section.find_next("ul")
-            if ul:
-                dates = [li.get_text(strip=True) for li in ul.find_all("li")]
-
-
-        benefits_points = []
-        benefits_section = soup.find("h2", string=lambda t: t and "Benefits" in t)
-        if benefits_section:
-            ul = benefits_section.find_next("ul")
-            if ul:
-                benefits_points = [li.get_text(strip=True) for li in ul.find_all("li")]
-
-
-        final_thoughts = []
-        final_section = soup.find("h2", string=lambda t: t and "Final Thoughts" in t)
-        if final_section:
-            final_paragraphs = final_section.find_all_next("p", limit=3)
-            final_thoughts = [p.get_text(strip=True) for p in final_paragraphs if len(p.get_text(strip=True)) > 30]
-
-  
-        sharing_buttons = []
-        sharing_section = soup.find_all("button", string=lambda t: t and any(platform in t.lower() for platform in ["whatsapp", "facebook", "twitter", "linkedin", "pinterest", "email"]))
-        if sharing_section:
-            sharing_buttons = [btn.get_text(strip=True).lower() for btn in sharing_section]
-
-      
-        feedback_options = []
-        feedback_section = soup.find("div", string=lambda t: t and "Is this page helpful?" in t)
-        if feedback_section:
-            feedback_buttons = feedback_section.find_all_next("button", limit=2)
-            feedback_options = [btn.get_text(strip=True) for btn in feedback_buttons if btn.get_text(strip=True) in ["Yes", "No"]]
-
-        
-        community_info = []
-        community_sections = soup.find_all("p", string=lambda t: t and any(keyword in t.lower() for keyword in ["followers", "subscribers", "join", "follow us"]))
-        for section in community_sections:
-            text = section.get_text(strip=True)
-            if len(text) > 20:
-                community_info.append(text)
-
-        data = {
-            "title": title_text,
-            "introduction": intro_paragraphs,
-            "why_apply": why_apply_points,
-            "eligibility": eligibility_points,
-            "coverage": coverage_points,
-            "apply_steps": apply_steps,
-            "key_dates": dates,
-            "benefits": benefits_points,
-            "final_thoughts": final_thoughts,
-            "sharing_buttons": sharing_buttons,
-            "feedback_options": feedback_options,
-            "community_info": community_info
-        }
-
-        return jsonify(data)
-
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
-
-
-TURKIYE_URL = "https://www.ilmkidunya.com/scholarships/turkiye-burslari-scholarships"
-@web_scraping_bp.route("/turkiye", methods=["GET"])
-def scrape_turkiye():
-    try:
-        response = requests.get(TURKIYE_URL, headers={"User-Agent": "Mozilla/5.0"})
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, "html.parser")
-
-        # Title
-        title = soup.find("h1")
-        title_text = title.get_text(strip=True) if title else "No Title Found"
-
-       
-        intro_p = soup.find("p")
-        intro_text = intro_p.get_text(strip=True) if intro_p else "No Intro Found"
-
-        
-        why_section = soup.find("h2", string=lambda t: t and "Why Türkiye Scholarships Are a Game-Changer" in t)
-        why_points = []
-        if why_section:
-            ul = why_section.find_next("ul")
-            if ul:
-                why_points = [li.get_text(strip=True) for li in ul.find_all("li")]
-
-        eligibility_academic = []
-        eligibility_age = []
-        eligibility_other = []
-        eligibility_section = soup.find("h2", string=lambda t: t and "Who is Eligible?" in t)
-        if eligibility_section:
-          
-            academic_h3 = eligibility_section.find_next("h3", string=lambda t: t and "Academic Requirements" in t)
-            if academic_h3:
-                ul = academic_h3.find_next("ul")
-                if ul:
-                    eligibility_academic = [li.get_text(strip=True) for li in ul.find_all("li")]
-          
-            age_h3 = eligibility_section.find_next("h3", string=lambda t: t and "Age Limits" in t)
-            if age_h3:
-                ul = age_h3.find_next("ul")
-                if ul:
-                    eligibility_age = [li.get_text(strip=True) for li in ul.find_all("li")]
-          
-            other_h3 = eligibility_section.find_next("h3", string=lambda t: t and "Other Requirements" in t)
-            if other_h3:
-                ul = other_h3.find_next("ul")
-                if ul:
-                    eligibility_other = [li.get_text(strip=True) for li in ul.find_all("li")]
-
-       
-        benefits_table = soup.find("table")
-        benefits = {}
-        if benefits_table:
-            rows = benefits_table.find_all("tr")[1:]  
-            for row in rows:
-                cols = row.find_all("td")
-                if len(cols) == 2:
-                    key = cols[0].get_text(strip=True)
-                    value = cols[1].get_text(strip=True)
-                    benefits[key] = value
-
-       
-        apply_steps = []
-        apply_section = soup.find("h2", string=lambda t: t and "How to Apply" in t)
-        if apply_section:
-            ol = apply_section.find_next("ol")
-            if ol:
-                apply_steps = [li.get_text(strip=True) for li in ol.find_all("li")]
-            else:
-               
-                steps = apply_section.find_all_next("p", limit=10)
-                apply_steps = [s.get_text(strip=True) for s in steps if len(s.get_text(strip=True)) > 30 and any(num in s.get_text() for num in ['1.', '2.', '3.', '4.'])]
-
-       
-        selection_steps = []
-        selection_section = soup.find("h2", string=lambda t: t and "Selection Process" in t)
-        if selection_section:
-            ul = selection_section.find_next("ul")
-            if ul:
-                selection_steps = [li.get_text(strip=True) for li in ul.find_all("li")]
-
-       
-        dates = []
-        dates_section = soup.find("h2", string=lambda t: t and "Key Dates" in t)
-        if dates_section:
-            ul = dates_section.find_next("ul")
-            if ul:
-                dates = [li.get_text(strip=True) for li in ul.find_all("li")]
-
-   
-        why_turkey_points = []
-        why_turkey_section = soup.find("h2", string=lambda t: t and "Why Study in Turkey?" in t)
-        if why_turkey_section:
-            ul = why_turkey_section.find_next("ul")
-            if ul:
-                why_turkey_points = [li.get_text(strip=True) for li in ul.find_all("li")]
-
-        data = {
-            "title": title_text,
-            "introduction": intro_text,
-            "why_game_changer": why_points,
-            "eligibility": {
-                "academic": eligibility_academic,
-                "age": eligibility_age,
-                "other": eligibility_other
-            },
-            "benefits": benefits,
-            "apply_steps": apply_steps,
-            "selection_process": selection_steps,
-            "key_dates": dates,
-            "why_study_turkey": why_turkey_points
-        }
-
-        return jsonify(data)
-
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
-
-
-STIPENDIUM_URL = "https://www.ilmkidunya.com/scholarships/stipendium-hungaricum-scholarships"
-@web_scraping_bp.route("/hungary", methods=["GET"])
-def scrape_stipendium():
-    try:
-        response = requests.get(STIPENDIUM_URL, headers={"User-Agent": "Mozilla/5.0"})
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, "html.parser")
-
-       
-        title = soup.find("h1")
-        title_text = title.get_text(strip=True) if title else "No Title Found"
-
-       
-        intro_paragraphs = []
-        intro_section = soup.find("h2", string=lambda t: t and "Introduction" in t)
-        if intro_section:
-            intro_paragraphs = [p.get_text(strip=True) for p in intro_section.find_all_next("p", limit=3) if len(p.get_text(strip=True)) > 50]
-
-      
-        what_is = []
-        what_section = soup.find("h2", string=lambda t: t and "What is the Stipendium Hungaricum Scholarship?" in t)
-        if what_section:
-            what_paragraphs = what_section.find_all_next("p", limit=3)
-            what_is = [p.get_text(strip=True) for p in what_paragraphs if len(p.get_text(strip=True)) > 30]
-
-        
-        programs = []
-        programs_section = soup.find("h2", string=lambda t: t and "Programs Offered" in t)
-        if programs_section:
-            ul = programs_section.find_next("ul")
-            if ul:
-                programs = [li.get_text(strip=True) for li in ul.find_all("li")]
-
-      
-        eligibility = []
-        eligibility_section = soup.find("h2", string=lambda t: t and "Eligibility Criteria" in t)
-        if eligibility_section:
-            ul = eligibility_section.find_next("ul")
-            if ul:
-                eligibility = [li.get_text(strip=True) for li in ul.find_all("li")]
-
-  
-        benefits = []
-        benefits_section = soup.find("h2", string=lambda t: t and "Scholarship Benefits" in t)
-        if benefits_section:
-            ul = benefits_section.find_next("ul")
-            if ul:
-                benefits = [li.get_text(strip=True) for li in ul.find_all("li")]
-
-        
-        apply_steps = []
-        apply_section = soup.find("h2", string=lambda t: t and "How to Apply" in t)
-        if apply_section:
-            steps = apply_section.find_all_next("p", limit=10)
-            apply_steps = [s.get_text(strip=True) for s in steps if len(s.get_text(strip=True)) > 30]
-
-       
-        dates = []
-        dates_section = soup.find("h2", string=lambda t: t and "Important Dates" in t)
-        if dates_section:
-            ul = dates_section.find_next("ul")
-            if ul:
-                dates = [li.get_text(strip=True) for li in ul.find_all("li")]
-
-      
-        why_apply = []
-        why_section = soup.find("h2", string=lambda t: t and "Why Pakistani Students Should Apply" in t)
-        if why_section:
-            ul = why_section.find_next("ul")
-            if ul:
-                why_apply = [li.get_text(strip=True) for li in ul.find_all("li")]
-
-       
-        contact_info = []
-        contact_section = soup.find("h2", string=lambda t: t and "Contact for Queries" in t)
-        if contact_section:
-            contact_paragraphs = contact_section.find_all_next("p", limit=3)
-            contact_info = [p.get_text(strip=True) for p in contact_paragraphs if len(p.get_text(strip=True)) > 20]
-
-        
-        conclusion = []
-        conclusion_section = soup.find("h2", string=lambda t: t and "Conclusion" in t)
-        if conclusion_section:
-            conclusion_paragraphs = conclusion_section.find_all_next("p", limit=3)
-            conclusion = [p.get_text(strip=True) for p in conclusion_paragraphs if len(p.get_text(strip=True)) > 30]
-
-        
-        sharing_buttons = []
-        sharing_section = soup.find_all("button", string=lambda t: t and any(platform in t.lower() for platform in ["whatsapp", "facebook", "twitter", "linkedin", "pinterest", "email"]))
-        if sharing_section:
-            sharing_buttons = [btn.get_text(strip=True).lower() for btn in sharing_section]
-
-   
-        feedback_options = []
-        feedback_section = soup.find("div", string=lambda t: t and "Is this page helpful?" in t)
-        if feedback_section:
-            feedback_buttons = feedback_section.find_all_next("button", limit=2)
-            feedback_options = [btn.get_text(strip=True) for btn in feedback_buttons if btn.get_text(strip=True) in ["Yes", "No"]]
-
- 
-        community_info = []
-        community_sections = soup.find_all("p", string=lambda t: t and any(keyword in t.lower() for keyword in ["followers", "subscribers", "join", "follow us"]))
-        for section in community_sections:
-            text = section.get_text(strip=True)
-            if len(text) > 20:
-                community_info.append(text)
-
-       
-        copyright_notice = ""
-        copyright_section = soup.find("p", string=lambda t: t and "Copyright" in t)
-        if copyright_section:
-            copyright_notice = copyright_section.get_text(strip=True)
-
-        data = {
-            "title": title_text,
-            "introduction": intro_paragraphs,
-            "what_is": what_is,
-            "programs": programs,
-            "eligibility": eligibility,
-            "benefits": benefits,
-            "apply_steps": apply_steps,
-            "important_dates": dates,
-            "why_apply": why_apply,
-            "contact_info": contact_info,
-            "conclusion": conclusion,
-            "sharing_buttons": sharing_buttons,
-            "feedback_options": feedback_options,
-            "community_info": community_info,
-            "copyright_notice": copyright_notice
-        }
-
-        return jsonify(data)
-
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
-
-CHEVENING_URL = "https://www.ilmkidunya.com/scholarships/chevening-scholarships"
-@web_scraping_bp.route("/chevening", methods=["GET"])
-def scrape_chevening():
-    try:
-        response = requests.get(CHEVENING_URL, headers={"User-Agent": "Mozilla/5.0"})
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, "html.parser")
-
-        title = soup.find("h1")
-        title_text = title.get_text(strip=True) if title else "No Title Found"
-
-        facts = {}
-        quick_facts = soup.find_all("tr")
-        for row in quick_facts:
-            cols = row.find_all("td")
-            if len(cols) == 2:
-                key = cols[0].get_text(strip=True)
-                value = cols[1].get_text(strip=True)
-                facts[key] = value
-
-        paragraphs = [
-            p.get_text(strip=True) for p in soup.find_all("p")
-            if len(p.get_text(strip=True)) > 50
-        ]
-
-        data = {
-            "title": title_text,
-            "facts": facts,
-            "paragraphs": paragraphs[:10]
-        }
-
-        return jsonify(data)
-
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
-
-
-ERASMUS_URL = "https://www.ilmkidunya.com/scholarships/erasmus-mundus-scholarships"
-@web_scraping_bp.route("/erasmus", methods=["GET"])
-def scrape_erasmus():
-    try:
-        response = requests.get(ERASMUS_URL, headers={"User-Agent": "Mozilla/5.0"})
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, "html.parser")
-
-        title = soup.find("h1")
-        title_text = title.get_text(strip=True) if title else "No Title Found"
-
-        facts = {}
-        quick_facts = soup.find_all("tr")
-        for row in quick_facts:
-            cols = row.find_all("td")
-            if len(cols) == 2:
-                key = cols[0].get_text(strip=True)
-                value = cols[1].get_text(strip=True)
-                facts[key] = value
-
-        headings = [h.get_text(strip=True) for h in soup.find_all(["h2", "h3"])]
-
-        paragraphs = [
-            p.get_text(strip=True) for p in soup.find_all("p")
-            if len(p.get_text(strip=True)) > 50
-        ]
-
-        data = {
-            "title": title_text,
-            "facts": facts,
-            "headings": headings,
-            "paragraphs": paragraphs[:12]
-        }
-
-        return jsonify(data)
-
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
-
-
-COMMONWEALTH_URL = "https://www.ilmkidunya.com/scholarships/commonwealth-international-scholarships"
-@web_scraping_bp.route("/commonwealth", methods=["GET"])
-def scrape_commonwealth():
-    try:
-        response = requests.get(COMMONWEALTH_URL, headers={"User-Agent": "Mozilla/5.0"})
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, "html.parser")
-
-        title = soup.find("h1")
-        title_text = title.get_text(strip=True) if title else "No Title Found"
-
-        facts = {}
-        quick_facts = soup.find_all("tr")
-        for row in quick_facts:
-            cols = row.find_all("td")
-            if len(cols) == 2:
-                key = cols[0].get_text(strip=True)
-                value = cols[1].get_text(strip=True)
-                facts[key] = value
-
-        headings = [h.get_text(strip=True) for h in soup.find_all(["h2", "h3"])]
-
-        paragraphs = [
-            p.get_text(strip=True) for p in soup.find_all("p")
-            if len(p.get_text(strip=True)) > 60
-        ]
-
-        data = {
-            "title": title_text,
-            "facts": facts,
-            "headings": headings,
-            "paragraphs": paragraphs[:15]
-        }
-
-        return jsonify(data)
-
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
-
-
-RHODES_URL = "https://www.ilmkidunya.com/scholarships/rhodes-uk-scholarships"
-@web_scraping_bp.route("/rhodes", methods=["GET"])
-def scrape_rhodes():
-    try:
-        response = requests.get(RHODES_URL, headers={"User-Agent": "Mozilla/5.0"})
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, "html.parser")
-
-     
-        title = soup.find("h1")
-        title_text = title.get_text(strip=True) if title else "No Title Found"
-
-       
-        introduction = ""
-        intro_section = soup.find("h2", string=lambda t: t and "Introduction" in t)
-        if intro_section:
-            next_p = intro_section.find_next("p")
-            if next_p:
-                introduction = next_p.get_text(strip=True)
-
-        
-        facts = {}
-        quick_facts = soup.find_all("tr")
-        for row in quick_facts:
-            cols = row.find_all(["td", "th"])
-            if len(cols) == 2:
-                key = cols[0].get_text(strip=True)
-                value = cols[1].get_text(strip=True)
-                facts[key] = value
-
-     
-        benefits = []
-        benefits_section = soup.find("h2", string=lambda t: t and "What the Scholarship Covers" in t)
-        if benefits_section:
-            ul = benefits_section.find_next("ul")
-            if ul:
-                benefits = [li.get_text(strip=True) for li in ul.find_all("li")]
-            else:
-               
-                next_p = benefits_section.find_next("p")
-                if next_p:
-                    benefits = [next_p.get_text(strip=True)]
-
-       
-        eligibility = []
-        eligibility_section = soup.find("h2", string=lambda t: t and "Eligibility Criteria" in t)
-        if eligibility_section:
-            ul = eligibility_section.find_next("ul")
-            if ul:
-                eligibility = [li.get_text(strip=True) for li in ul.find_all("li")]
-
-   
-        application_process = []
-        application_section = soup.find("h2", string=lambda t: t and "Application Process" in t)
-        if application_section:
-          
-            current = application_section.find_next()
-            while current and current.name != "h2":
-                if current.name == "h3" or current.name == "h4":
-                    process_step = {"title": current.get_text(strip=True), "details": ""}
-                    application_process.append(process_step)
-                elif current.name == "p":
-                    if application_process:
-                        application_process[-1]["details"] += current.get_text(strip=True) + " "
-                elif current.name == "ul":
-                    if application_process:
-                        list_items = [li.get_text(strip=True) for li in current.find_all("li")]
-                        application_process[-1]["details"] += "; ".join(list_items)
-                current = current.find_next_sibling()
-
-     
-        why_apply = []
-        why_apply_section = soup.find("h2", string=lambda t: t and "Why Apply for Rhodes" in t)
-        if why_apply_section:
-            ul = why_apply_section.find_next("ul")
-            if ul:
-                why_apply = [li.get_text(strip=True) for li in ul.find_all("li")]
-
-       
-        tips = []
-        tips_section = soup.find("h2", string=lambda t: t and "Tips for a Strong Application" in t)
-        if tips_section:
-            ul = tips_section.find_next("ul")
-            if ul:
-                tips = [li.get_text(strip=True) for li in ul.find_all("li")]
-
-    
-        final_thoughts = ""
-        final_section = soup.find("h2", string=lambda t: t and "Final Words" in t) or soup.find("h2", string=lambda t: t and "Final Thoughts" in t)
-        if final_section:
-            next_p = final_section.find_next("p")
-            if next_p:
-                final_thoughts = next_p.get_text(strip=True)
-
-    
-        important_notes = []
-        notes_section = soup.find("strong", string=lambda t: t and "Important:" in t)
-        if notes_section:
-            important_notes = [notes_section.parent.get_text(strip=True)]
-
-        data = {
-            "title": title_text,
-            "introduction": introduction,
-            "quick_facts": facts,
-            "benefits": benefits,
-            "eligibility": eligibility,
-            "application_process": application_process,
-            "why_apply": why_apply,
-            "tips": tips,
-            "final_thoughts": final_thoughts,
-            "important_notes": important_notes,
-            "source_url": RHODES_URL
-        }
-
-        return jsonify(data)
-
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
\ No newline at end of file